@@ -0,0 +1,312 @@
+"""
+Ambiente no estilo Gym (reset/step) sobre o núcleo headless do jogo
+
+Um AmbienteAtravessarRua embrulha um JogoAtraversarRua sem janela; o
+AmbienteVetorizado avança vários mundos independentes numa única chamada e
+devolve observações, recompensas e fins de episódio em arrays NumPy:
+
+    from ambiente import AmbienteVetorizado
+
+    ambientes = AmbienteVetorizado(16, seed=1)  # ou modo_obs='grade'
+    obs, info = ambientes.reset()
+    for _ in range(1000):
+        acoes = politica(obs)  # array (16,) com índices de ACOES
+        obs, recompensas, terminados, truncados, info = ambientes.step(acoes)
+
+Requer NumPy (ao contrário do jogo, em que ele é opcional).
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+import config
+from core.clock import VirtualClock
+from core.rng import derive_seed, new_seed
+from game.game_state import GameState
+from game.occupancy import NUM_CANAIS, TIPOS_LINHA, OccupancyGrid
+
+# Ações discretas: índice -> movimento em células (None = ficar parado)
+ACOES = (None, (0, -1), (0, 1), (-1, 0), (1, 0))
+NOMES_ACOES = ('parado', 'cima', 'baixo', 'esquerda', 'direita')
+
+# Observação 'vetor': coluna, linha na tela, vidas, invulnerável e o tipo da
+# linha do jogador e das duas de cima, todos normalizados em [0, 1]
+TAMANHO_OBS = 7
+
+# Observação 'grade': OccupancyGrid (canais x linhas x colunas, uint8)
+FORMA_GRADE = (NUM_CANAIS, config.GRID_ALTURA, config.GRID_LARGURA)
+MODOS_OBS = ('vetor', 'grade')
+
+# Recompensa descontada por vida perdida
+PENALIDADE_MORTE = 10.0
+
+_MAIOR_TIPO = max(TIPOS_LINHA.values())
+
+
+class AmbienteAtravessarRua:
+    """
+    Uma partida headless com a interface reset()/step() do Gym
+
+    step() aplica a ação e avança ticks_por_acao passos de física (ou até o
+    GAME_OVER). A recompensa é o ganho de pontuação menos PENALIDADE_MORTE
+    por vida perdida; o episódio termina no GAME_OVER e é truncado ao
+    atingir max_ticks.
+    """
+
+    num_acoes = len(ACOES)
+
+    def __init__(self, seed=None, ticks_por_acao=8, max_ticks=36000, camera_livre=True,
+                 modo_obs='vetor'):
+        """
+        Inicializa o ambiente
+
+        Args:
+            seed: Seed base; cada episódio usa uma seed derivada dela
+                (sorteada se None)
+            ticks_por_acao: Passos de física por chamada a step()
+            max_ticks: Ticks até truncar o episódio (0 = sem limite)
+            camera_livre: Remove o limite superior da câmera (com ele a
+                pontuação para em 72 e não há o que recompensar)
+            modo_obs: 'vetor' (TAMANHO_OBS floats) ou 'grade' (OccupancyGrid
+                de FORMA_GRADE, escrito no lugar a cada passo)
+        """
+        if modo_obs not in MODOS_OBS:
+            raise ValueError(f"modo_obs deve ser um de {MODOS_OBS}, não {modo_obs!r}")
+        if not pygame.get_init():
+            pygame.init()
+        from atravessar_rua import JogoAtraversarRua
+
+        # Sem thread de pré-geração: num lote de mundos ela só disputa a CPU
+        self.jogo = JogoAtraversarRua(headless=True, time_source=VirtualClock(), pre_geracao=False)
+        self.ticks_por_acao = max(1, ticks_por_acao)
+        self.max_ticks = max_ticks
+        self.camera_livre = camera_livre
+
+        self.seed = seed if seed is not None else new_seed()
+        self.episodios = 0
+        self.modo_obs = modo_obs
+        self.usar_buffer(np.zeros(self.forma_obs(modo_obs), dtype=self.tipo_obs(modo_obs)))
+
+    @staticmethod
+    def forma_obs(modo_obs):
+        """Forma do array de observação de um modo"""
+        return FORMA_GRADE if modo_obs == 'grade' else (TAMANHO_OBS,)
+
+    @staticmethod
+    def tipo_obs(modo_obs):
+        """dtype do array de observação de um modo"""
+        return np.uint8 if modo_obs == 'grade' else np.float32
+
+    def usar_buffer(self, obs):
+        """
+        Passa a escrever as observações em ``obs`` (por exemplo uma linha de um lote)
+
+        Args:
+            obs: Array com forma_obs(modo_obs) e tipo_obs(modo_obs)
+        """
+        self.obs = obs
+        self.grade = OccupancyGrid(obs) if self.modo_obs == 'grade' else None
+
+    def _tipo_linha(self, y):
+        """Código de TIPOS_LINHA da linha que contém o Y (mundo)"""
+        for chunk in self.jogo.procedural_generator.obter_chunks_no_intervalo(y, y):
+            if chunk.y_inicio <= y < chunk.y_fim:
+                return TIPOS_LINHA.get(chunk.tipo, 0)
+        return 0
+
+    def observar(self):
+        """
+        Escreve a observação atual em self.obs (sem alocar)
+
+        Returns:
+            numpy.ndarray: self.obs
+        """
+        jogo = self.jogo
+        if self.grade is not None:
+            return self.grade.atualizar(
+                jogo.procedural_generator, jogo.registro_faixas, jogo.jogador, jogo.camera.offset_y
+            )
+
+        saida = self.obs
+        jogador = jogo.jogador
+        celula = config.TAMANHO_CELL
+        linha = (jogador.y - jogo.camera.offset_y) // celula
+
+        saida[0] = (jogador.x // celula) / (config.GRID_LARGURA - 1)
+        saida[1] = min(max(linha, 0), config.GRID_ALTURA - 1) / (config.GRID_ALTURA - 1)
+        saida[2] = jogo.vidas / config.VIDAS_MAXIMAS
+        saida[3] = 1.0 if jogo.invulneravel else 0.0
+        for i in range(3):
+            saida[4 + i] = self._tipo_linha(jogador.y - i * celula) / _MAIOR_TIPO
+        return saida
+
+    def reset(self, seed=None):
+        """
+        Começa um novo episódio
+
+        Args:
+            seed: Nova seed base (reinicia a sequência de episódios)
+
+        Returns:
+            tuple: (observação, info)
+        """
+        if seed is not None:
+            self.seed = seed
+            self.episodios = 0
+        semente = derive_seed(self.seed, 'episodio', self.episodios)
+        self.episodios += 1
+
+        self.jogo.iniciar_novo_jogo(semente)
+        if self.camera_livre:
+            self.jogo.camera.limite_superior = None
+        # A pontuação por distância só é calculada no primeiro passo de física
+        # (já vale uns 70 pontos); dá esse passo aqui para que a recompensa
+        # conte apenas o progresso a partir dela
+        self.jogo.step_physics(self.jogo.fixed_clock.dt)
+        return self.observar(), {'seed': semente}
+
+    def _avancar(self, acao):
+        """
+        Aplica a ação e avança a simulação (sem montar a observação)
+
+        Returns:
+            tuple: (recompensa, terminado, truncado)
+        """
+        jogo = self.jogo
+        movimento = ACOES[acao]
+        if movimento is not None:
+            jogo.comandar(*movimento)
+
+        pontuacao = jogo.pontuacao
+        mortes = jogo.mortes['carro'] + jogo.mortes['afogamento']
+        dt = jogo.fixed_clock.dt
+        for _ in range(self.ticks_por_acao):
+            jogo.step_physics(dt)
+            if jogo.estado == GameState.GAME_OVER:
+                break
+
+        mortes = jogo.mortes['carro'] + jogo.mortes['afogamento'] - mortes
+        recompensa = (jogo.pontuacao - pontuacao) - PENALIDADE_MORTE * mortes
+        terminado = jogo.estado == GameState.GAME_OVER
+        truncado = not terminado and bool(self.max_ticks) and jogo.tick >= self.max_ticks
+        return float(recompensa), terminado, truncado
+
+    def step(self, acao):
+        """
+        Executa uma ação
+
+        Args:
+            acao: Índice em ACOES
+
+        Returns:
+            tuple: (observação, recompensa, terminado, truncado, info)
+        """
+        recompensa, terminado, truncado = self._avancar(acao)
+        info = {'tick': self.jogo.tick, 'pontuacao': self.jogo.pontuacao, 'mortes': dict(self.jogo.mortes)}
+        return self.observar(), recompensa, terminado, truncado, info
+
+    def fechar(self):
+        """Para a thread de pré-geração de chunks do jogo (se houver)"""
+        self.jogo.procedural_generator.parar_pre_geracao()
+
+
+class AmbienteVetorizado:
+    """
+    Vários AmbienteAtravessarRua avançados numa única chamada
+
+    As saídas são arrays NumPy pré-alocados e reaproveitados a cada step()
+    (copie-os se precisar guardar). Um ambiente que termina ou é truncado
+    é reiniciado na hora; a observação final dele fica em info['obs_final'].
+    """
+
+    def __init__(self, num_ambientes, seed=None, **opcoes):
+        """
+        Inicializa os ambientes
+
+        Args:
+            num_ambientes: Número de mundos independentes
+            seed: Seed base; o ambiente i usa derive_seed(seed, 'ambiente', i)
+            **opcoes: Repassadas a AmbienteAtravessarRua
+        """
+        if num_ambientes <= 0:
+            raise ValueError("num_ambientes deve ser positivo")
+        self.seed = seed if seed is not None else new_seed()
+        self.opcoes = opcoes
+        self.ambientes = [
+            AmbienteAtravessarRua(derive_seed(self.seed, 'ambiente', i), **opcoes)
+            for i in range(num_ambientes)
+        ]
+        self.num_ambientes = num_ambientes
+        self.num_acoes = AmbienteAtravessarRua.num_acoes
+
+        # Cada ambiente escreve a observação direto na sua linha do lote
+        modo_obs = self.ambientes[0].modo_obs
+        self.obs = np.zeros(
+            (num_ambientes,) + AmbienteAtravessarRua.forma_obs(modo_obs),
+            dtype=AmbienteAtravessarRua.tipo_obs(modo_obs)
+        )
+        for i, ambiente in enumerate(self.ambientes):
+            ambiente.usar_buffer(self.obs[i])
+        self.recompensas = np.zeros(num_ambientes, dtype=np.float32)
+        self.terminados = np.zeros(num_ambientes, dtype=bool)
+        self.truncados = np.zeros(num_ambientes, dtype=bool)
+        self.pontuacoes = np.zeros(num_ambientes, dtype=np.int64)
+
+    def reset(self, seed=None):
+        """
+        Reinicia todos os ambientes
+
+        Args:
+            seed: Nova seed base (o ambiente i passa a usar a derivada dela)
+
+        Returns:
+            tuple: (observações (n, ...), info)
+        """
+        if seed is not None:
+            self.seed = seed
+        for i, ambiente in enumerate(self.ambientes):
+            ambiente.reset(derive_seed(self.seed, 'ambiente', i) if seed is not None else None)
+            self.pontuacoes[i] = ambiente.jogo.pontuacao
+        return self.obs, {'pontuacao': self.pontuacoes}
+
+    def step(self, acoes):
+        """
+        Aplica uma ação em cada ambiente
+
+        Args:
+            acoes: Sequência (n,) de índices em ACOES
+
+        Returns:
+            tuple: (observações, recompensas, terminados, truncados, info)
+        """
+        if len(acoes) != self.num_ambientes:
+            raise ValueError(f"esperadas {self.num_ambientes} ações, recebidas {len(acoes)}")
+
+        obs_final = {}
+        for i, ambiente in enumerate(self.ambientes):
+            recompensa, terminado, truncado = ambiente._avancar(int(acoes[i]))
+            self.recompensas[i] = recompensa
+            self.terminados[i] = terminado
+            self.truncados[i] = truncado
+            self.pontuacoes[i] = ambiente.jogo.pontuacao
+            if terminado or truncado:
+                obs_final[i] = ambiente.observar().copy()
+                ambiente.reset()
+            else:
+                ambiente.observar()
+
+        info = {'pontuacao': self.pontuacoes}
+        if obs_final:
+            info['obs_final'] = obs_final
+        return self.obs, self.recompensas, self.terminados, self.truncados, info
+
+    def fechar(self):
+        """Fecha todos os ambientes"""
+        for ambiente in self.ambientes:
+            ambiente.fechar()
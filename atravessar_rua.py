@@ -7,29 +7,63 @@ Objetivo: Atravesse a rua cheia de carros sem ser atingido!
 Controles: Setas do teclado (↑ ↓ ← →) ou WASD
 """
 
+import argparse
+import os
 import pygame
-import random
 import sys
 import time
 
 import config
 from core.clock import FixedStepClock
+from core.profiler import FrameProfiler
+from core.replay import InputRecorder, Replay
+from core.rng import derive_seed, new_seed
 from entities import Jogador, Carro, SafeZone, Tronco
-from game import GameState, CollisionSystem, Camera, ProceduralGenerator, RiverPhysics
-from ui import Menu, HUD, GameOverScreen
+from game import (
+    GameState, CollisionSystem, LaneGroup, LaneRegistry, Camera, ProceduralGenerator, RiverPhysics
+)
+from game.background import ChunkBackgroundCache, WorldCanvas
+from game.kinematics import criar_kinematic_store
+from ui import Menu, HUD, GameOverScreen, ProfilerOverlay
+from utils import converter_para_tela
 
 
 class JogoAtraversarRua:
     """Classe principal que gerencia todo o jogo"""
 
-    def __init__(self):
+    def __init__(self, headless=False, time_source=None, seed=None, pre_geracao=None):
+        """
+        Inicializa o jogo
+
+        Args:
+            headless: Se True, não abre janela; a tela vira uma Surface
+                off-screen, criada (com a UI) só no primeiro desenhar(), e a
+                simulação pode ser avançada com simular()
+            time_source: Fonte de tempo do FixedStepClock (padrão:
+                time.perf_counter). Use core.clock.VirtualClock para
+                simulações mais rápidas que o tempo real
+            seed: Seed fixa do mundo. Com ela toda partida gera exatamente
+                o mesmo mundo e tráfego; se None, cada partida sorteia a sua
+            pre_geracao: Gera chunks numa thread de fundo (padrão:
+                config.PRE_GERACAO_CHUNKS). Simulações com muitos mundos
+                passam False para não abrir uma thread por mundo
+        """
         # Configuração da tela (pygame já foi inicializado em main())
+        self.headless = headless
         try:
             self.tela_cheia = False
-            self.screen = pygame.display.set_mode((config.LARGURA_TELA, config.ALTURA_TELA))
-            pygame.display.set_caption(config.TITULO)
+            if headless:
+                self.screen = None  # Ver preparar_render()
+            else:
+                self.screen = pygame.display.set_mode((config.LARGURA_TELA, config.ALTURA_TELA))
+                pygame.display.set_caption(config.TITULO)
             self.render_clock = pygame.time.Clock()
-            self.fixed_clock = FixedStepClock()
+            self.fixed_clock = FixedStepClock(
+                config.PHYSICS_HZ,
+                time_source=time_source,
+                max_substeps=config.MAX_SUBSTEPS_POR_FRAME,
+                catch_up=config.POLITICA_ATRASO_FISICA
+            )
         except Exception as e:
             raise RuntimeError(f"Falha ao criar janela do jogo: {e}")
         
@@ -45,6 +79,15 @@ class JogoAtraversarRua:
         except Exception as e:
             raise RuntimeError(f"Falha ao criar fontes: {e}")
         
+        # Seeds do mundo (a da sessão é sorteada a cada partida se seed for None)
+        self.seed = seed
+        self.semente_sessao = None
+
+        # Passos de física desde o início da partida e gravação de replay
+        self.tick = 0
+        self.gravar_replays = config.GRAVAR_REPLAYS
+        self.gravador = None
+
         # Estado do jogo
         self.estado = GameState.MENU
         self.pontuacao = 0
@@ -52,26 +95,38 @@ class JogoAtraversarRua:
         self.vidas = config.VIDAS_INICIAIS
         self.tempo_inicio = 0
         self.melhor_pontuacao = 0
+        self.mortes = {'carro': 0, 'afogamento': 0}  # Vidas perdidas por causa, na partida
         
         # Sprites
         self.jogador = None
-        self.carros_group = pygame.sprite.Group()
+        self.carros_group = LaneGroup()  # Indexado por faixa (broadphase de colisão)
+
+        # Cinemática vetorizada de carros e troncos (None sem NumPy)
+        self.cinematica = criar_kinematic_store()
+        self.registro_faixas = LaneRegistry(self.carros_group, self.cinematica)
 
         # Cache de grid visual (otimização de renderização)
         self.grid_cache = None
-        self.criar_cache_grid()
         
-        # UI
-        self.menu = Menu(self.screen, self.font_grande, self.font_media, self.font_pequena)
-        self.hud = HUD(self.screen, self.font_pequena)
-        self.game_over_screen = GameOverScreen(self.screen, self.font_grande, self.font_media, self.font_pequena)
+        # UI (criada em preparar_render)
+        self.menu = None
+        self.hud = None
+        self.game_over_screen = None
+
+        # Tempos por subsistema (F3 mostra, F4 salva em CSV)
+        self.profiler = FrameProfiler(config.AMOSTRAS_PERFIL, enabled=config.PERFIL_ATIVO)
+        self.overlay_perfil = None
+        self.mostrar_perfil = False
+
+        # Contador de entidades (F2); já aparece ligado nos perfis de carga
+        self.mostrar_contagem = config.PERFIL_DENSIDADE != 'normal'
         
         # Sistema de colisão
         self.collision_system = CollisionSystem()
         
         # Sistema de câmera e geração procedimental
         self.camera = Camera()
-        self.procedural_generator = ProceduralGenerator()
+        self.procedural_generator = ProceduralGenerator(pre_geracao=pre_geracao)
         self.river_physics = RiverPhysics()
         
         # Controle de área de descanso
@@ -85,11 +140,38 @@ class JogoAtraversarRua:
         
         # Grupos de sprites para rio
         self.plataformas_group = pygame.sprite.Group()
+        self.chunks_rio_ativos = {}  # Chunk de rio visível -> troncos no grupo
+
+        # Fundo pré-renderizado dos chunks visíveis
+        self.fundo_chunks = ChunkBackgroundCache()
+        self.canvas_mundo = None
+
+        # Sem janela, as superfícies de desenho (~10 MB) só existem se algo
+        # for desenhado: um lote de mundos headless custa só a simulação
+        if not headless:
+            self.preparar_render()
         
         # Não inicializar jogo ainda (será inicializado quando começar a jogar)
 
+    def preparar_render(self):
+        """Cria a tela off-screen (headless), o cache do grid, o canvas do fundo e a UI"""
+        if self.screen is None:
+            self.screen = pygame.Surface((config.LARGURA_TELA, config.ALTURA_TELA))
+
+        self.criar_cache_grid()
+        self.menu = Menu(self.screen, self.font_grande, self.font_media, self.font_pequena)
+        self.hud = HUD(self.screen, self.font_pequena)
+        self.game_over_screen = GameOverScreen(self.screen, self.font_grande, self.font_media, self.font_pequena)
+        self.overlay_perfil = ProfilerOverlay(self.screen, self.profiler)
+
+        if getattr(config, 'USAR_CANVAS_ROLAGEM', True):
+            self.canvas_mundo = WorldCanvas(self.fundo_chunks)
+
     def alternar_tela_cheia(self):
         """Alterna entre modo janela e tela cheia"""
+        if self.headless:
+            return
+
         self.tela_cheia = not self.tela_cheia
         
         try:
@@ -107,13 +189,8 @@ class JogoAtraversarRua:
                 )
                 print("[INFO] Modo janela ativado")
             
-            # Recriar UI com nova tela (mantém mesmas dimensões)
-            self.menu = Menu(self.screen, self.font_grande, self.font_media, self.font_pequena)
-            self.hud = HUD(self.screen, self.font_pequena)
-            self.game_over_screen = GameOverScreen(self.screen, self.font_grande, self.font_media, self.font_pequena)
-
-            # Recriar cache de grid
-            self.criar_cache_grid()
+            # Recriar UI, cache de grid e canvas com a nova tela (mesmas dimensões)
+            self.preparar_render()
         except Exception as e:
             print(f"[ERRO] Falha ao alternar tela cheia: {e}")
             # Reverter para modo janela em caso de erro
@@ -122,12 +199,29 @@ class JogoAtraversarRua:
                 (config.LARGURA_TELA, config.ALTURA_TELA)
             )
     
-    def iniciar_novo_jogo(self):
-        """Inicia um novo jogo do zero"""
+    def iniciar_novo_jogo(self, semente=None):
+        """
+        Inicia um novo jogo do zero
+
+        Args:
+            semente: Seed desta partida (padrão: self.seed ou uma sorteada)
+        """
         # Resetar pontuação e estado
         self.pontuacao = 0
         self.nivel = 1
         self.vidas = config.VIDAS_INICIAIS
+        self.mortes = {'carro': 0, 'afogamento': 0}
+        # Nada da partida anterior pode vazar para esta (o replay começa do zero)
+        self.invulneravel = False
+        self.tempo_invulnerabilidade = 0.0
+        self.jogador_em_safe_zone = False
+        self.tempo_em_safe_zone = 0.0
+        if semente is None:
+            semente = self.seed if self.seed is not None else new_seed()
+        self.semente_sessao = semente
+        self.tick = 0
+        if self.gravar_replays:
+            self.iniciar_gravacao()
         
         # Inicializar jogo
         self.inicializar_jogo()
@@ -139,13 +233,26 @@ class JogoAtraversarRua:
 
     def inicializar_jogo(self):
         """Inicializa ou reinicia o jogo (sem resetar pontuação)"""
+        # Cada nível tem um mundo próprio derivado da seed da sessão
+        if self.semente_sessao is None:
+            self.semente_sessao = self.seed if self.seed is not None else new_seed()
+        semente_nivel = derive_seed(self.semente_sessao, 'nivel', self.nivel)
+
         # Limpar sprites
+        self.registro_faixas.resetar(semente_nivel)
         self.carros_group.empty()
+        for troncos in self.chunks_rio_ativos.values():
+            for tronco in troncos:
+                tronco.desvincular()
         self.plataformas_group.empty()
+        self.chunks_rio_ativos.clear()
+        self.fundo_chunks.limpar()
+        if self.canvas_mundo is not None:
+            self.canvas_mundo.invalidar()
         
         # Resetar sistemas
         self.camera.resetar()
-        self.procedural_generator.resetar()
+        self.procedural_generator.resetar(semente_nivel)
         self.river_physics.resetar()
         
         # Inicializar mundo procedimental
@@ -168,47 +275,9 @@ class JogoAtraversarRua:
         """Atualiza carros baseados nas faixas geradas proceduralmente"""
         # Obter faixas visíveis
         faixas_visiveis = self.procedural_generator.obter_faixas_visiveis(self.camera.offset_y)
-        
-        # Para cada faixa, verificar se já tem carros
-        for faixa in faixas_visiveis:
-            faixa_y = faixa['y']
-            
-            # Verificar se já existem carros nesta faixa (aproximadamente)
-            tem_carro = False
-            for carro in self.carros_group:
-                if abs(carro.rect.centery - faixa_y) < 30:
-                    tem_carro = True
-                    break
-            
-            # Se não tem carro, criar alguns
-            if not tem_carro:
-                carros_por_faixa = random.randint(2, 4)
-                for i in range(carros_por_faixa):
-                    # ESPAÇAMENTO ALINHADO AO GRID
-                    espacamento_cells = config.LARGURA_TELA // (carros_por_faixa + 1) // config.TAMANHO_CELL
-                    x_cell = int((i + 1) * espacamento_cells) + random.randint(-1, 1)  # Variação mínima: ±1 célula
-                    x_cell = max(0, min(x_cell, config.GRID_LARGURA - 1))  # Limitar dentro da tela
-                    x_inicial = x_cell * config.TAMANHO_CELL + config.TAMANHO_CELL // 2  # Centro da célula
-
-                    if faixa['direcao'] == -1:
-                        # Inverter posição (mas ainda alinhado ao grid)
-                        x_cell_invertido = config.GRID_LARGURA - 1 - x_cell
-                        x_inicial = x_cell_invertido * config.TAMANHO_CELL + config.TAMANHO_CELL // 2
-
-                    carro = Carro(
-                        x_inicial,
-                        faixa_y,
-                        faixa['velocidade'],
-                        faixa['cor'],
-                        faixa['direcao']
-                    )
-                    self.carros_group.add(carro)
-        
-        # Remover carros que saíram da área visível
-        y_min, y_max = self.camera.obter_area_visivel()
-        for carro in list(self.carros_group):
-            if carro.rect.centery < y_min - 100 or carro.rect.centery > y_max + 100:
-                carro.kill()
+
+        # Popular faixas que entraram e remover (com seus carros) as que saíram
+        self.registro_faixas.atualizar(faixas_visiveis)
     
     def verificar_safe_zone(self, delta_time):
         """Verifica se o jogador está em uma área de descanso"""
@@ -243,6 +312,64 @@ class JogoAtraversarRua:
             # Saiu de safe zone
             pass
 
+    def iniciar_gravacao(self, caminho=None):
+        """
+        Começa a gravar o replay da partida atual (fecha o anterior, se houver)
+
+        Args:
+            caminho: Arquivo de saída (padrão: PASTA_REPLAYS/sessao_<data_hora>_<seed>.atr)
+        """
+        self.encerrar_gravacao()
+        if caminho is None:
+            os.makedirs(config.PASTA_REPLAYS, exist_ok=True)
+            nome = time.strftime("sessao_%Y%m%d_%H%M%S") + f"_{self.semente_sessao:x}.atr"
+            caminho = os.path.join(config.PASTA_REPLAYS, nome)
+        self.gravador = InputRecorder(
+            caminho, self.semente_sessao, self.fixed_clock.physics_hz,
+            config.PERFIL_DENSIDADE, config.DENSIDADE_TRAFEGO
+        )
+
+    def encerrar_gravacao(self):
+        """Fecha o replay em gravação, marcando o tick em que a partida parou"""
+        if self.gravador is None:
+            return
+        self.gravador.close(self.tick)
+        print(f"[INFO] Replay salvo em {self.gravador.path} ({self.gravador.commands} comandos)")
+        self.gravador = None
+
+    def comandar(self, dx, dy):
+        """
+        Move o jogador, registrando o comando no replay em gravação
+
+        Args:
+            dx: Células na horizontal (-1, 0 ou 1)
+            dy: Células na vertical (-1, 0 ou 1)
+        """
+        if self.gravador is not None:
+            self.gravador.record(self.tick, dx, dy)
+        self.jogador.mover(dx, dy)
+
+    def alternar_perfil(self):
+        """Mostra/esconde o overlay de tempos (medindo só enquanto visível)"""
+        self.mostrar_perfil = not self.mostrar_perfil
+        self.profiler.enabled = self.mostrar_perfil or config.PERFIL_ATIVO
+
+    def salvar_perfil(self, caminho=None):
+        """
+        Salva p50/p95/p99 de cada subsistema em CSV
+
+        Args:
+            caminho: Arquivo de saída (padrão: perfil_<data_hora>.csv)
+
+        Returns:
+            str: Caminho do arquivo salvo
+        """
+        if caminho is None:
+            caminho = time.strftime("perfil_%Y%m%d_%H%M%S.csv")
+        self.profiler.dump_csv(caminho)
+        print(f"[INFO] Perfil salvo em {caminho}")
+        return caminho
+
     def processar_eventos(self):
         """Processa eventos do pygame"""
         eventos = pygame.event.get()
@@ -255,6 +382,16 @@ class JogoAtraversarRua:
                 # F11 para alternar tela cheia
                 if evento.key == pygame.K_F11:
                     self.alternar_tela_cheia()
+
+                # F2 mostra o contador de entidades
+                if evento.key == pygame.K_F2:
+                    self.mostrar_contagem = not self.mostrar_contagem
+
+                # F3 mostra os tempos por subsistema, F4 salva em CSV
+                if evento.key == pygame.K_F3:
+                    self.alternar_perfil()
+                if evento.key == pygame.K_F4:
+                    self.salvar_perfil()
                 
                 if evento.key == pygame.K_ESCAPE:
                     if self.estado == GameState.MENU:
@@ -292,56 +429,101 @@ class JogoAtraversarRua:
             for evento in eventos:
                 if evento.type == pygame.KEYDOWN:
                     if evento.key == pygame.K_UP or evento.key == pygame.K_w:
-                        self.jogador.mover(0, -1)
+                        self.comandar(0, -1)
                     elif evento.key == pygame.K_DOWN or evento.key == pygame.K_s:
-                        self.jogador.mover(0, 1)
+                        self.comandar(0, 1)
                     elif evento.key == pygame.K_LEFT or evento.key == pygame.K_a:
-                        self.jogador.mover(-1, 0)
+                        self.comandar(-1, 0)
                     elif evento.key == pygame.K_RIGHT or evento.key == pygame.K_d:
-                        self.jogador.mover(1, 0)
+                        self.comandar(1, 0)
         
         return True
 
     def atualizar_plataformas_procedurais(self):
-        """Atualiza plataformas baseadas nos chunks de rio"""
-        # Obter plataformas visíveis
-        plataformas_visiveis = self.procedural_generator.obter_plataformas_visiveis(self.camera.offset_y)
-        
-        # Sincronizar grupo de sprites
-        self.plataformas_group.empty()
-        for plataforma in plataformas_visiveis:
-            self.plataformas_group.add(plataforma)
+        """Sincroniza plataformas quando chunks de rio entram ou saem da área visível"""
+        chunks_rio = [
+            c for c in self.procedural_generator.obter_chunks_visiveis(self.camera.offset_y)
+            if c.tipo == 'rio'
+        ]
+
+        # Chunk entrou: adicionar seus troncos ao grupo
+        for chunk in chunks_rio:
+            if chunk not in self.chunks_rio_ativos:
+                troncos = list(chunk.dados.get('plataformas', []))
+                if self.cinematica is not None:
+                    for tronco in troncos:
+                        tronco.vincular(self.cinematica)
+                self.chunks_rio_ativos[chunk] = troncos
+                self.plataformas_group.add(troncos)
+
+        # Chunk saiu: remover seus troncos (a lista é nossa, pois o gerador
+        # limpa os dados de chunks reciclados)
+        if len(self.chunks_rio_ativos) > len(chunks_rio):
+            visiveis = set(chunks_rio)
+            for chunk in [c for c in self.chunks_rio_ativos if c not in visiveis]:
+                troncos = self.chunks_rio_ativos.pop(chunk)
+                for tronco in troncos:
+                    tronco.desvincular()
+                self.plataformas_group.remove(troncos)
 
     def step_physics(self, delta_time):
         """Executa uma etapa fixa de física e lógica do jogo."""
         if self.estado != GameState.PLAYING:
             return
 
+        perfil = self.profiler
+        inicio_passo = t = perfil.start()
+
         if self.jogador:
+            # Ponto de partida da interpolação do desenho
+            self.jogador.guardar_posicao_anterior()
             self.jogador.step(delta_time)
             self.jogador.atualizar(delta_time)
+        perfil.stop('fisica.jogador', t)
 
+        t = perfil.start()
         self.camera.update(self.jogador, delta_time)
+        perfil.stop('fisica.camera', t)
 
+        t = perfil.start()
         self.procedural_generator.atualizar(self.camera.offset_y)
+        perfil.stop('fisica.gerador', t)
 
         distancia = int(self.procedural_generator.distancia_percorrida / 10)
         if distancia > self.pontuacao:
             self.pontuacao = distancia
 
+        t = perfil.start()
         self.atualizar_carros_procedurais()
         self.atualizar_plataformas_procedurais()
+        perfil.stop('fisica.faixas', t)
 
-        for carro in self.carros_group:
-            carro.atualizar(delta_time)
+        t = perfil.start()
+        if self.cinematica is not None:
+            # Carros e troncos visíveis avançam num único passo vetorizado
+            self.cinematica.avancar(delta_time)
+        else:
+            for carro in self.carros_group:
+                carro.atualizar(delta_time)
 
-        for plataforma in self.plataformas_group:
-            plataforma.atualizar(delta_time)
+            for plataforma in self.plataformas_group:
+                plataforma.atualizar(delta_time)
+        perfil.stop('fisica.movimento', t)
 
+        t = perfil.start()
         status_rio = {'afogando': False, 'em_plataforma': False, 'plataforma': None}
         if self.jogador:
-            chunks_rio = [c for c in self.procedural_generator.chunks if c.tipo == 'rio']
+            # Só os chunks de rio na altura do jogador (com folga de meia faixa,
+            # pois os troncos da borda passam um pouco dos limites do chunk)
+            folga = config.TAMANHO_CELL // 2
+            chunks_rio = [
+                c for c in self.procedural_generator.obter_chunks_no_intervalo(
+                    self.jogador.rect.top - folga, self.jogador.rect.bottom + folga
+                )
+                if c.tipo == 'rio'
+            ]
             status_rio = self.river_physics.atualizar(self.jogador, chunks_rio, delta_time)
+        perfil.stop('fisica.rio', t)
 
         if self.invulneravel:
             self.tempo_invulnerabilidade += delta_time
@@ -351,6 +533,7 @@ class JogoAtraversarRua:
 
         if status_rio['afogando'] and not self.invulneravel:
             self.vidas -= 1
+            self.mortes['afogamento'] += 1
             if self.jogador:
                 self.jogador.resetar_posicao()
 
@@ -365,7 +548,88 @@ class JogoAtraversarRua:
         if self.jogador:
             self.verificar_safe_zone(delta_time)
 
+        t = perfil.start()
         self.verificar_colisoes()
+        perfil.stop('fisica.colisoes', t)
+        perfil.stop('fisica', inicio_passo)
+
+        self.tick += 1
+        if self.estado == GameState.GAME_OVER:
+            self.encerrar_gravacao()
+
+    def simular(self, ticks, parar_no_game_over=True):
+        """
+        Avança a simulação sem renderizar, o mais rápido que a CPU permitir
+
+        Inicia um novo jogo se ainda não houver partida em andamento.
+
+        Args:
+            ticks: Número de passos fixos de física a executar
+            parar_no_game_over: Interrompe ao chegar em GAME_OVER
+
+        Returns:
+            int: Número de passos efetivamente executados
+        """
+        if self.estado != GameState.PLAYING:
+            self.iniciar_novo_jogo()
+
+        dt = self.fixed_clock.dt
+        executados = 0
+        for _ in range(ticks):
+            if parar_no_game_over and self.estado == GameState.GAME_OVER:
+                break
+            self.step_physics(dt)
+            executados += 1
+
+        return executados
+
+    def reproduzir(self, replay, parar_no_game_over=True):
+        """
+        Reexecuta um replay sem renderizar, o mais rápido que a CPU permitir
+
+        Os comandos são aplicados antes do mesmo tick de física em que foram
+        dados na partida original, então o resultado é idêntico a ela.
+
+        Args:
+            replay: core.replay.Replay carregado do arquivo
+            parar_no_game_over: Interrompe ao chegar em GAME_OVER
+
+        Returns:
+            int: Número de passos executados
+        """
+        if replay.physics_hz != self.fixed_clock.physics_hz:
+            raise ValueError(
+                f"Replay gravado a {replay.physics_hz} Hz; o jogo roda a "
+                f"{self.fixed_clock.physics_hz} Hz (ajuste config.PHYSICS_HZ)"
+            )
+        # A densidade muda quantos sorteios cada faixa consome: outro mundo
+        if (replay.profile, replay.density) != (config.PERFIL_DENSIDADE, config.DENSIDADE_TRAFEGO):
+            raise ValueError(
+                f"Replay gravado com perfil {replay.profile!r} e densidade {replay.density}; "
+                f"o jogo usa {config.PERFIL_DENSIDADE!r} e {config.DENSIDADE_TRAFEGO} "
+                f"(veja aplicar_configuracao_replay)"
+            )
+
+        self.iniciar_novo_jogo(replay.seed)
+        dt = self.fixed_clock.dt
+        alimentador = replay.feeder()
+        for _ in range(replay.length):
+            if parar_no_game_over and self.estado == GameState.GAME_OVER:
+                break
+            self.aplicar_comandos(alimentador)
+            self.step_physics(dt)
+
+        return self.tick
+
+    def aplicar_comandos(self, alimentador):
+        """
+        Aplica os comandos do replay devidos antes do próximo tick de física
+
+        Args:
+            alimentador: core.replay.CommandFeeder do replay em reprodução
+        """
+        for dx, dy in alimentador.due(self.tick):
+            self.comandar(dx, dy)
 
     def verificar_colisoes(self):
         """Verifica colisões entre jogador e carros"""
@@ -378,6 +642,7 @@ class JogoAtraversarRua:
 
         if colisoes:
             self.vidas -= 1
+            self.mortes['carro'] += 1
             self.jogador.resetar_posicao()
 
             # Ativar invulnerabilidade
@@ -412,154 +677,127 @@ class JogoAtraversarRua:
         cor_grid = (150, 150, 150, 40)  # Cinza claro com alpha baixo
 
         # Criar surface com alpha para transparência
-        self.grid_cache = pygame.Surface((config.LARGURA_TELA, config.ALTURA_TELA), pygame.SRCALPHA)
+        # Uma célula mais alta que a tela: deslocada pela câmera, sempre cobre a tela
+        altura = config.ALTURA_TELA + config.TAMANHO_CELL
+        self.grid_cache = pygame.Surface((config.LARGURA_TELA, altura), pygame.SRCALPHA)
 
         # Desenhar linhas verticais do grid (bem discretas)
         for x in range(0, config.LARGURA_TELA + 1, config.TAMANHO_CELL):
-            pygame.draw.line(self.grid_cache, cor_grid, (x, 0), (x, config.ALTURA_TELA), 1)
+            pygame.draw.line(self.grid_cache, cor_grid, (x, 0), (x, altura), 1)
 
-    def desenhar_grid_visual(self):
-        """Desenha o grid visual usando cache - OTIMIZADO"""
-        # Usar cache de linhas verticais
-        if self.grid_cache:
-            self.screen.blit(self.grid_cache, (0, 0))
+        # Linhas horizontais nos múltiplos de TAMANHO_CELL
+        for y in range(0, altura, config.TAMANHO_CELL):
+            pygame.draw.line(self.grid_cache, cor_grid, (0, y), (config.LARGURA_TELA, y), 1)
 
-        # Desenhar apenas linhas horizontais dinamicamente (variam com câmera)
-        cor_grid = (150, 150, 150, 40)
-        y_min, y_max = self.camera.obter_area_visivel()
+        self.grid_cache = converter_para_tela(self.grid_cache)
 
-        for i in range(-5, 25):  # Linhas horizontais
-            y_mundo = int(y_min) + (i * config.TAMANHO_CELL)
-            y_tela = self.camera.aplicar_offset(y_mundo)
-            if 0 <= y_tela <= config.ALTURA_TELA:
-                pygame.draw.line(self.screen, cor_grid, (0, y_tela), (config.LARGURA_TELA, y_tela), 1)
+    def desenhar_grid_visual(self):
+        """Desenha o grid visual usando cache - um único blit por frame"""
+        if self.grid_cache:
+            # Linhas horizontais acompanham as células do mundo
+            deslocamento = self.camera.aplicar_offset(0) % config.TAMANHO_CELL
+            self.screen.blit(self.grid_cache, (0, deslocamento - config.TAMANHO_CELL))
     
     def desenhar_fundo(self):
         """Desenha o cenário do jogo com geração procedimental"""
+        if self.canvas_mundo is not None:
+            # Só as linhas expostas desde o último frame são desenhadas
+            self.canvas_mundo.atualizar(self.procedural_generator, self.camera.offset_render)
+            self.canvas_mundo.desenhar(self.screen)
+            return
+        
         # Fundo base (céu)
         self.screen.fill(config.AZUL)
         
-        # Obter área visível da câmera
-        y_min, y_max = self.camera.obter_area_visivel()
-        
-        # Obter chunks visíveis
+        # Obter chunks visíveis (o índice já os devolve ordenados por Y)
         chunks = self.procedural_generator.obter_chunks_visiveis(self.camera.offset_y)
         
-        # Ordenar chunks por Y (do mais baixo para o mais alto)
-        chunks_ordenados = sorted(chunks, key=lambda c: c.y_inicio)
-        
-        # Desenhar chunks na ordem (safe zones primeiro para não serem cobertas)
-        for chunk in chunks_ordenados:
-            y_tela_inicio = self.camera.aplicar_offset(chunk.y_inicio)
-            y_tela_fim = self.camera.aplicar_offset(chunk.y_fim)
-            
-            if chunk.tipo == 'safe_zone':
-                # Safe zone já tem seu próprio método de renderização
-                safe_zone = chunk.dados.get('safe_zone')
-                if safe_zone:
-                    safe_zone.renderizar(self.screen, self.camera.offset_y)
-            
-            elif chunk.tipo == 'estrada':
-                # Desenhar faixas de estrada
-                faixas = chunk.dados.get('faixas', [])
-                for faixa in faixas:
-                    y_tela = self.camera.aplicar_offset(faixa['y'])
-
-                    # Desenhar asfalto da faixa - ALINHADO AO GRID 32px
-                    altura_faixa = config.TAMANHO_CELL  # 1 célula (32px)
-                    pygame.draw.rect(
-                        self.screen,
-                        config.ASFALTO,
-                        (0, y_tela - altura_faixa // 2, config.LARGURA_TELA, altura_faixa)
-                    )
-                    
-                    # Linhas amarelas - ALINHADAS AO GRID
-                    espacamento_linhas = config.TAMANHO_CELL * 2  # A cada 2 células (64px)
-                    largura_linha = config.TAMANHO_CELL // 2  # Meia célula (16px)
-                    for x in range(0, config.LARGURA_TELA, espacamento_linhas):
-                        pygame.draw.rect(
-                            self.screen,
-                            config.AMARELO,
-                            (x + config.TAMANHO_CELL // 4, y_tela - 2, largura_linha, 4)
-                        )
-            
-            elif chunk.tipo == 'rio':
-                # Desenhar água - ALINHADO AO GRID
-                altura_chunk = chunk.dados.get('altura', 96)  # 3 células (96px) - múltiplo de 32
-                
-                # Água base (azul)
-                pygame.draw.rect(
-                    self.screen,
-                    (50, 100, 200),
-                    (0, y_tela_inicio, config.LARGURA_TELA, altura_chunk)
-                )
-                
-                # Água simples sem linhas horríveis - apenas cor sólida
-                # Sem efeitos desnecessários
+        # Um blit por chunk (safe zones primeiro na ordem de Y, sem serem cobertas);
+        # o fundo de cada chunk é desenhado uma vez e reaproveitado enquanto visível
+        self.fundo_chunks.desenhar(self.screen, chunks, self.camera)
+
+    def desenhar_entidades(self, interpolation, piscar=False):
+        """
+        Desenha troncos, carros e jogador interpolados entre dois passos de física
+
+        Args:
+            interpolation: Fração do próximo passo já decorrida [0, 1)
+            piscar: Se True, aplica o efeito de piscar da invulnerabilidade
+        """
+        # Plataformas
+        for plataforma in self.plataformas_group:
+            rect_tela = plataforma.rect.copy()
+            rect_tela.centerx = int(plataforma.x_interpolado(interpolation))
+            rect_tela.centery = self.camera.aplicar_offset(plataforma.rect.centery)
+            self.screen.blit(plataforma.image, rect_tela)
+
+        # Carros
+        for carro in self.carros_group:
+            rect_tela = carro.rect.copy()
+            rect_tela.centerx = int(carro.x_interpolado(interpolation))
+            rect_tela.centery = self.camera.aplicar_offset(carro.rect.centery)
+            self.screen.blit(carro.image, rect_tela)
+
+        # Jogador (com efeito visual de invulnerabilidade)
+        if self.jogador is not None:
+            x, y = self.jogador.centro_interpolado(interpolation)
+            rect_tela = self.jogador.rect.copy()
+            rect_tela.centerx = int(x)
+            rect_tela.centery = self.camera.aplicar_offset(y)
+
+            # Efeito de piscar durante invulnerabilidade
+            if not piscar or not self.invulneravel or int(self.tempo_invulnerabilidade * 10) % 2 == 0:
+                self.screen.blit(self.jogador.image, rect_tela)
 
     def desenhar(self, interpolation=0.0):
-        """Renderiza a tela."""
+        """
+        Renderiza a tela.
+
+        Args:
+            interpolation: Fração do próximo passo de física já decorrida,
+                usada para desenhar entre o estado anterior e o atual
+        """
+        perfil = self.profiler
+        if self.hud is None:
+            self.preparar_render()
+
         if self.estado == GameState.MENU:
             self.menu.desenhar(self.melhor_pontuacao)
         elif self.estado == GameState.PLAYING:
+            self.camera.interpolar(interpolation)
+            t = perfil.start()
             self.desenhar_fundo()
+            perfil.stop('render.fundo', t)
             
             # Desenhar grid visual (sutil)
+            t = perfil.start()
             self.desenhar_grid_visual()
+            perfil.stop('render.grid', t)
             
             # Desenhar sprites com offset da câmera
-            # Plataformas
-            for plataforma in self.plataformas_group:
-                y_tela = self.camera.aplicar_offset(plataforma.rect.centery)
-                rect_tela = plataforma.rect.copy()
-                rect_tela.centery = y_tela
-                self.screen.blit(plataforma.image, rect_tela)
-
-            # Carros
-            for carro in self.carros_group:
-                y_tela = self.camera.aplicar_offset(carro.rect.centery)
-                rect_tela = carro.rect.copy()
-                rect_tela.centery = y_tela
-                self.screen.blit(carro.image, rect_tela)
-
-            # Jogador (com efeito visual de invulnerabilidade)
-            if self.jogador is not None:
-                y_tela = self.camera.aplicar_offset(self.jogador.rect.centery)
-                rect_tela = self.jogador.rect.copy()
-                rect_tela.centery = y_tela
-
-                # Efeito de piscar durante invulnerabilidade
-                if not self.invulneravel or int(self.tempo_invulnerabilidade * 10) % 2 == 0:
-                    self.screen.blit(self.jogador.image, rect_tela)
+            t = perfil.start()
+            self.desenhar_entidades(interpolation, piscar=True)
+            perfil.stop('render.sprites', t)
 
             # Desenha HUD (sempre no topo)
+            t = perfil.start()
             tempo_decorrido = time.time() - self.tempo_inicio if self.tempo_inicio > 0 else 0
             self.hud.desenhar(self.pontuacao, self.nivel, self.vidas, tempo_decorrido)
+            if self.mostrar_contagem:
+                self.hud.desenhar_contagem(
+                    len(self.carros_group),
+                    len(self.plataformas_group),
+                    len(self.procedural_generator.chunks)
+                )
+            perfil.stop('render.hud', t)
             
         elif self.estado == GameState.GAME_OVER:
+            # Física parada: desenhar o último estado simulado
+            self.camera.interpolar(1.0)
             self.desenhar_fundo()
             
             # Desenhar sprites com offset da câmera
-            # Plataformas
-            for plataforma in self.plataformas_group:
-                y_tela = self.camera.aplicar_offset(plataforma.rect.centery)
-                rect_tela = plataforma.rect.copy()
-                rect_tela.centery = y_tela
-                self.screen.blit(plataforma.image, rect_tela)
-            
-            # Carros
-            for carro in self.carros_group:
-                y_tela = self.camera.aplicar_offset(carro.rect.centery)
-                rect_tela = carro.rect.copy()
-                rect_tela.centery = y_tela
-                self.screen.blit(carro.image, rect_tela)
-            
-            # Jogador
-            if self.jogador is not None:
-                y_tela = self.camera.aplicar_offset(self.jogador.rect.centery)
-                rect_tela = self.jogador.rect.copy()
-                rect_tela.centery = y_tela
-                self.screen.blit(self.jogador.image, rect_tela)
+            self.desenhar_entidades(1.0)
             
             # HUD
             tempo_decorrido = time.time() - self.tempo_inicio if self.tempo_inicio > 0 else 0
@@ -567,15 +805,27 @@ class JogoAtraversarRua:
             # Desenha tela de game over
             self.game_over_screen.desenhar(self.pontuacao, self.nivel)
 
-        pygame.display.flip()
+        if self.mostrar_perfil:
+            self.overlay_perfil.desenhar()
+
+        if not self.headless:
+            t = perfil.start()
+            pygame.display.flip()
+            perfil.stop('render.flip', t)
 
     def executar(self):
         """Loop principal do jogo"""
         rodando = True
 
+        perfil = self.profiler
+
         while rodando:
+            inicio_quadro = perfil.start()
+
             # Processar eventos
+            t = perfil.start()
             rodando = self.processar_eventos()
+            perfil.stop('eventos', t)
 
             if not rodando:
                 break
@@ -584,17 +834,84 @@ class JogoAtraversarRua:
             interpolation = self.fixed_clock.step(self.step_physics)
 
             # Desenhar
+            t = perfil.start()
             self.desenhar(interpolation)
+            perfil.stop('render', t)
+            perfil.stop('quadro', inicio_quadro)
 
             # Controlar FPS de renderização
             self.render_clock.tick(config.FPS)
 
+        self.encerrar_gravacao()
         pygame.quit()
         sys.exit()
 
 
+def aplicar_configuracao_replay(replay):
+    """
+    Ajusta config.py para gerar o mesmo mundo da gravação
+
+    Deve ser chamada antes de criar o JogoAtraversarRua (o passo de física
+    é fixado na criação do relógio).
+
+    Args:
+        replay: core.replay.Replay carregado do arquivo
+    """
+    if replay.profile not in config.PERFIS_DENSIDADE:
+        raise ValueError(f"Replay usa o perfil de densidade desconhecido {replay.profile!r}")
+    config.PHYSICS_HZ = replay.physics_hz
+    config.PERFIL_DENSIDADE = replay.profile
+    config.DENSIDADE_TRAFEGO = replay.density
+
+
+def reproduzir_arquivo(caminho):
+    """
+    Reproduz um replay sem janela e mostra o resultado da partida
+
+    Args:
+        caminho: Arquivo .atr gravado com --gravar
+
+    Returns:
+        JogoAtraversarRua: Jogo no estado final do replay
+    """
+    replay = Replay.load(caminho)
+    print(f"[INFO] {replay}")
+
+    # Passo de física e densidade precisam ser os mesmos da gravação
+    aplicar_configuracao_replay(replay)
+    pygame.init()
+    jogo = JogoAtraversarRua(headless=True)
+    inicio = time.perf_counter()
+    try:
+        ticks = jogo.reproduzir(replay)
+    finally:
+        jogo.procedural_generator.parar_pre_geracao()
+    decorrido = time.perf_counter() - inicio
+
+    print(f"[OK] {ticks} ticks em {decorrido:.2f}s ({ticks / max(decorrido, 1e-9):.0f} ticks/s)")
+    print(f"     estado={jogo.estado.name} pontos={jogo.pontuacao} nivel={jogo.nivel} vidas={jogo.vidas}")
+    return jogo
+
+
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="Atravessar a Rua")
+    parser.add_argument('--perfil', choices=sorted(config.PERFIS_DENSIDADE),
+                        help="perfil de densidade de carros/troncos (padrão: config.PERFIL_DENSIDADE)")
+    parser.add_argument('--gravar', action='store_true',
+                        help=f"grava o replay de cada partida em {config.PASTA_REPLAYS}/")
+    parser.add_argument('--replay', metavar='ARQUIVO',
+                        help="reproduz um replay sem janela, o mais rápido possível")
+    args, _ = parser.parse_known_args()
+    if args.perfil:
+        config.PERFIL_DENSIDADE = args.perfil
+        print(f"[INFO] Perfil de densidade: {args.perfil}")
+    if args.gravar:
+        config.GRAVAR_REPLAYS = True
+    if args.replay:
+        reproduzir_arquivo(args.replay)
+        return
+
     try:
         print("=" * 50)
         print("ATRAVESSAR A RUA v2.0 - Frogger Style")
@@ -603,6 +920,8 @@ def main():
         print("  Setas ou WASD : Mover o sapo")
         print("  ESPACO        : Iniciar/Reiniciar")
         print("  ESC           : Menu/Sair")
+        print("  F2            : Contador de entidades")
+        print("  F3 / F4       : Tempos por subsistema / salvar em CSV")
         print("\nObjetivo:")
         print("  Atravesse a rua sem ser atingido pelos carros!")
         print("  Chegue ao topo para avancar de nivel!")
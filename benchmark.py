@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Benchmark headless dos caminhos quentes de simulação e renderização
+
+Roda sem janela (SDL_VIDEODRIVER=dummy) com seeds fixas e grava os
+resultados em JSON para comparar uma execução com a outra:
+
+    python benchmark.py --saida antes.json
+    python benchmark.py --saida depois.json --densidades 1,4 --physics-hz 60
+    python benchmark.py --perfis normal,estresse --densidades 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import config
+from core.clock import VirtualClock
+from game.kinematics import NUMPY_DISPONIVEL
+
+# Operações medidas chamada a chamada (nome no JSON)
+OPERACOES = (
+    'ProceduralGenerator.atualizar',
+    'CollisionSystem.check_collision_pygame',
+    'RiverPhysics.atualizar',
+    'atualizar_carros_procedurais',
+    'desenhar_fundo',
+    'desenhar',
+)
+
+# O jogador tenta subir uma célula a cada tantos segundos de jogo
+INTERVALO_MOVIMENTO = 0.15
+
+
+def _lista(texto, tipo):
+    """Converte '1,2,3' em [tipo(1), tipo(2), tipo(3)]"""
+    return [tipo(item) for item in texto.split(',') if item.strip()]
+
+
+def _cronometrar(funcao, amostras):
+    """
+    Envolve uma função guardando a duração (ns) de cada chamada
+
+    Args:
+        funcao: Função ou método a medir
+        amostras: Lista onde as durações são adicionadas
+
+    Returns:
+        callable: Função com a mesma assinatura
+    """
+    relogio = time.perf_counter_ns
+
+    def medida(*args, **kwargs):
+        inicio = relogio()
+        resultado = funcao(*args, **kwargs)
+        amostras.append(relogio() - inicio)
+        return resultado
+
+    return medida
+
+
+def _estatisticas(amostras_ns):
+    """Resumo em microssegundos de uma lista de durações em nanossegundos"""
+    if not amostras_ns:
+        return {'chamadas': 0}
+    ordenadas = sorted(amostras_ns)
+    n = len(ordenadas)
+
+    def p(percentil):
+        return ordenadas[max(0, -(-n * percentil // 100) - 1)] / 1000.0
+
+    return {
+        'chamadas': n,
+        'us_media': round(sum(ordenadas) / n / 1000.0, 3),
+        'us_p50': round(p(50), 3),
+        'us_p95': round(p(95), 3),
+        'us_p99': round(p(99), 3),
+        'us_max': round(ordenadas[-1] / 1000.0, 3),
+    }
+
+
+def _preparar_jogo(seed):
+    """
+    Cria um jogo headless pronto para o benchmark
+
+    O jogador fica invulnerável (a partida nunca termina) e a câmera rola
+    livremente para cima, exercitando geração e descarte de chunks.
+    """
+    from atravessar_rua import JogoAtraversarRua
+
+    jogo = JogoAtraversarRua(headless=True, time_source=VirtualClock(), seed=seed)
+    jogo.iniciar_novo_jogo()
+    jogo.camera.limite_superior = None
+    jogo.invulneravel = True
+    jogo.duracao_invulnerabilidade = float('inf')
+    return jogo
+
+
+def _encerrar_jogo(jogo):
+    """Para a thread de pré-geração de chunks, se houver"""
+    jogo.procedural_generator.parar_pre_geracao()
+
+
+def medir_vazao(seed, segundos):
+    """
+    Mede ticks/s da simulação completa (step_physics), sem renderizar
+
+    Returns:
+        tuple: (ticks executados, segundos de CPU)
+    """
+    jogo = _preparar_jogo(seed)
+    dt = jogo.fixed_clock.dt
+    ticks = int(round(segundos * config.PHYSICS_HZ))
+    ticks_por_movimento = max(1, int(round(INTERVALO_MOVIMENTO / dt)))
+
+    inicio = time.perf_counter()
+    for tick in range(ticks):
+        if tick % ticks_por_movimento == 0:
+            jogo.jogador.mover(0, -1)
+        jogo.step_physics(dt)
+    decorrido = time.perf_counter() - inicio
+
+    _encerrar_jogo(jogo)
+    return ticks, decorrido
+
+
+def medir_operacoes(seed, segundos, amostras):
+    """
+    Mede cada operação de OPERACOES durante uma partida simulada
+
+    A renderização acontece config.FPS vezes por segundo de jogo, como no
+    loop real, qualquer que seja PHYSICS_HZ (a 30 Hz são dois quadros por tick).
+
+    Args:
+        seed: Seed do mundo
+        segundos: Segundos de jogo simulados
+        amostras: Dict nome -> lista de durações (ns), preenchido aqui
+
+    Returns:
+        dict: Número médio de entidades ativas
+    """
+    jogo = _preparar_jogo(seed)
+    jogo.preparar_render()  # Criar a tela e a UI fica fora da medição de desenhar
+    dt = jogo.fixed_clock.dt
+    ticks = int(round(segundos * config.PHYSICS_HZ))
+    ticks_por_movimento = max(1, int(round(INTERVALO_MOVIMENTO / dt)))
+
+    # Os atributos de instância escondem os métodos originais
+    gerador = jogo.procedural_generator
+    gerador.atualizar = _cronometrar(gerador.atualizar, amostras['ProceduralGenerator.atualizar'])
+    rio = jogo.river_physics
+    rio.atualizar = _cronometrar(rio.atualizar, amostras['RiverPhysics.atualizar'])
+    jogo.atualizar_carros_procedurais = _cronometrar(
+        jogo.atualizar_carros_procedurais, amostras['atualizar_carros_procedurais']
+    )
+    jogo.desenhar_fundo = _cronometrar(jogo.desenhar_fundo, amostras['desenhar_fundo'])
+    desenhar = _cronometrar(jogo.desenhar, amostras['desenhar'])
+    # Invulnerável, o jogo pula a colisão; a consulta é feita aqui a cada tick
+    colisao = _cronometrar(
+        jogo.collision_system.check_collision_pygame,
+        amostras['CollisionSystem.check_collision_pygame']
+    )
+
+    carros = plataformas = 0
+    quadros = 0
+    for tick in range(ticks):
+        if tick % ticks_por_movimento == 0:
+            jogo.jogador.mover(0, -1)
+        jogo.step_physics(dt)
+        colisao(jogo.jogador, jogo.carros_group)
+        carros += len(jogo.carros_group)
+        plataformas += len(jogo.plataformas_group)
+        # Quadros devidos até o fim deste tick (divisão inteira, sem arredondar)
+        while quadros < (tick + 1) * config.FPS // config.PHYSICS_HZ:
+            desenhar((quadros * config.PHYSICS_HZ % config.FPS) / config.FPS)
+            quadros += 1
+
+    _encerrar_jogo(jogo)
+    return {
+        'carros_media': round(carros / max(1, ticks), 2),
+        'troncos_media': round(plataformas / max(1, ticks), 2),
+    }
+
+
+def executar_cenario(perfil, densidade, physics_hz, seeds, segundos):
+    """
+    Roda vazão e operações para uma combinação de perfil, densidade e PHYSICS_HZ
+
+    Returns:
+        dict: Resultado do cenário (amostras de todas as seeds somadas)
+    """
+    config.PERFIL_DENSIDADE = perfil
+    config.DENSIDADE_TRAFEGO = densidade
+    config.PHYSICS_HZ = physics_hz
+
+    ticks_total = 0
+    tempo_total = 0.0
+    amostras = {nome: [] for nome in OPERACOES}
+    entidades = []
+    for seed in seeds:
+        ticks, decorrido = medir_vazao(seed, segundos)
+        ticks_total += ticks
+        tempo_total += decorrido
+        entidades.append(medir_operacoes(seed, segundos, amostras))
+
+    return {
+        'perfil': perfil,
+        'densidade': densidade,
+        'physics_hz': physics_hz,
+        'ticks': ticks_total,
+        'ticks_por_segundo': round(ticks_total / tempo_total, 1) if tempo_total else None,
+        'carros_media': round(sum(e['carros_media'] for e in entidades) / len(entidades), 2),
+        'troncos_media': round(sum(e['troncos_media'] for e in entidades) / len(entidades), 2),
+        'operacoes': {nome: _estatisticas(amostras[nome]) for nome in OPERACOES},
+    }
+
+
+def main(argv=None):
+    """Executa o benchmark e grava o JSON"""
+    parser = argparse.ArgumentParser(description="Benchmark headless do jogo")
+    parser.add_argument('--saida', default='benchmark_resultados.json',
+                        help="arquivo JSON de saída ('-' para stdout)")
+    parser.add_argument('--seeds', default='1,2,3', help="seeds fixas, separadas por vírgula")
+    parser.add_argument('--perfis', default='normal',
+                        help="perfis de config.PERFIS_DENSIDADE, separados por vírgula")
+    parser.add_argument('--densidades', default='0.5,1,2,4',
+                        help="valores de DENSIDADE_TRAFEGO")
+    parser.add_argument('--physics-hz', default='30,60,120', help="valores de PHYSICS_HZ")
+    parser.add_argument('--segundos', type=float, default=20.0,
+                        help="segundos de jogo simulados por seed")
+    args = parser.parse_args(argv)
+
+    seeds = _lista(args.seeds, int)
+    perfis = _lista(args.perfis, str)
+    for perfil in perfis:
+        if perfil not in config.PERFIS_DENSIDADE:
+            parser.error(f"perfil desconhecido: {perfil}")
+    densidades = _lista(args.densidades, float)
+    frequencias = _lista(args.physics_hz, int)
+
+    pygame.init()
+    originais = (config.PERFIL_DENSIDADE, config.DENSIDADE_TRAFEGO, config.PHYSICS_HZ)
+    cenarios = []
+    try:
+        for perfil in perfis:
+            for densidade in densidades:
+                for physics_hz in frequencias:
+                    print(f"[BENCH] perfil={perfil} densidade={densidade} physics_hz={physics_hz}",
+                          file=sys.stderr)
+                    cenarios.append(executar_cenario(perfil, densidade, physics_hz, seeds, args.segundos))
+    finally:
+        config.PERFIL_DENSIDADE, config.DENSIDADE_TRAFEGO, config.PHYSICS_HZ = originais
+        pygame.quit()
+
+    resultado = {
+        'versao': 1,
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'ambiente': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': NUMPY_DISPONIVEL,
+            'plataforma': platform.platform(),
+        },
+        'configuracao': {
+            'USAR_CINEMATICA_NUMPY': config.USAR_CINEMATICA_NUMPY,
+            'PRE_GERACAO_CHUNKS': config.PRE_GERACAO_CHUNKS,
+            'USAR_CANVAS_ROLAGEM': config.USAR_CANVAS_ROLAGEM,
+            'FPS': config.FPS,
+        },
+        'parametros': {
+            'seeds': seeds,
+            'perfis': perfis,
+            'densidades': densidades,
+            'physics_hz': frequencias,
+            'segundos': args.segundos,
+        },
+        'cenarios': cenarios,
+    }
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida == '-':
+        print(texto)
+    else:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+        print(f"[OK] Resultados salvos em {args.saida}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
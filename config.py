@@ -26,9 +26,6 @@ TITULO = "🐸 Atravessar a Rua v3.0 - Frogger Infinito"
 
 # ==================== CONFIGURAÇÕES DO JOGO ====================
 FPS = 60
-# Velocidade do jogador expressa em pixels por segundo. Mantém o salto de
-# uma célula por comando com o passo de física fixo.
-VELOCIDADE_JOGADOR = TAMANHO_CELL * FPS
 
 # ==================== SISTEMA DE GRID/TABULEIRO MODERNO ====================
 # Tile size de 32px é padrão para jogos pixel art modernos
@@ -41,6 +38,10 @@ TAMANHO_JOGADOR = 32  # 1 célula (32x32)
 TAMANHO_CARRO_LARGURA = 64  # 2 células (64x32)
 TAMANHO_CARRO_ALTURA = 32   # 1 célula (32x32)
 
+# Velocidade do jogador expressa em pixels por segundo. Mantém o salto de
+# uma célula por comando com o passo de física fixo.
+VELOCIDADE_JOGADOR = TAMANHO_CELL * FPS
+
 # ==================== CONFIGURAÇÕES DE JOGABILIDADE ====================
 VIDAS_INICIAIS = 3
 VIDAS_MAXIMAS = 5
@@ -69,6 +70,19 @@ FAIXAS = [
 
 CORES_CARROS = [VERMELHO, AZUL, LARANJA, ROXO, AMARELO]
 
+# Multiplicador do número de carros por faixa (1.0 = tráfego normal)
+DENSIDADE_TRAFEGO = 1.0
+
+# Perfis de densidade para testes de carga. Cada perfil multiplica as faixas
+# por grupo de estrada/rio, os carros por faixa e os troncos por faixa de rio.
+# Escolha com PERFIL_DENSIDADE ou: python atravessar_rua.py --perfil estresse
+PERFIS_DENSIDADE = {
+    'normal':   {'faixas': 1.0, 'carros': 1.0, 'troncos': 1.0},
+    'denso':    {'faixas': 2.0, 'carros': 2.0, 'troncos': 1.5},
+    'estresse': {'faixas': 3.0, 'carros': 5.0, 'troncos': 3.0},
+}
+PERFIL_DENSIDADE = 'normal'
+
 # ==================== CONFIGURAÇÕES DE ÁREAS DE DESCANSO ====================
 # Áreas seguras que aparecem periodicamente para o jogador planejar
 INTERVALO_DESAFIOS_PARA_DESCANSO = 5  # Base: aparece a cada 5 desafios
@@ -84,3 +98,49 @@ ALTURA_CHUNK = 320  # 10 células (320px) - múltiplo de 32
 DISTANCIA_GERACAO_CHUNK = 400  # Distância para gerar novo chunk
 MARGEM_REMOCAO_CHUNK = -200  # Margem para remover chunks antigos
 
+# ==================== DESEMPENHO ====================
+# Move carros e troncos com arrays NumPy (um passo vetorizado por tick).
+# Sem NumPy instalado o jogo volta a atualizar entidade por entidade.
+USAR_CINEMATICA_NUMPY = True
+
+# Gera os chunks à frente da câmera numa thread de fundo; o loop principal
+# só adota grupos já prontos da fila (limitada a TAMANHO_FILA_PRE_GERACAO)
+PRE_GERACAO_CHUNKS = True
+TAMANHO_FILA_PRE_GERACAO = 8
+
+# Tempo máximo (microssegundos) gasto gerando chunks por tick. Chunks que
+# ficariam visíveis são gerados mesmo estourando; o resto da antecipação
+# continua nos ticks seguintes
+ORCAMENTO_GERACAO_US = 1000
+# Pixels gerados além de DISTANCIA_GERACAO_CHUNK, para que o orçamento
+# tenha folga antes de um chunk ficar obrigatório
+MARGEM_ANTECIPACAO_GERACAO = 200
+
+# Mantém o fundo numa superfície que rola com a câmera (Surface.scroll) e
+# redesenha só as linhas expostas; False desenha os chunks a cada frame
+USAR_CANVAS_ROLAGEM = True
+
+# Passos de física por segundo. O desenho interpola entre os dois últimos
+# passos, então a física não precisa acompanhar a taxa de quadros
+PHYSICS_HZ = 60
+
+# Máximo de passos de física por quadro. Em máquinas lentas isso evita que
+# um quadro atrasado agende ainda mais trabalho para o próximo
+MAX_SUBSTEPS_POR_FRAME = 5
+# O que fazer com o tempo que passou do limite acima:
+#   'drop'   - descarta os passos excedentes
+#   'slow'   - o jogo roda em câmera lenta enquanto estiver sobrecarregado
+#   'spread' - paga o atraso aos poucos nos quadros seguintes
+POLITICA_ATRASO_FISICA = 'spread'
+
+# Medição de tempo por subsistema (F3 mostra o overlay, F4 salva em CSV).
+# Com PERFIL_ATIVO = False só mede enquanto o overlay estiver aberto
+PERFIL_ATIVO = False
+AMOSTRAS_PERFIL = 600  # Amostras guardadas por seção (buffer circular)
+
+# ==================== REPLAYS ====================
+# Grava a seed e os comandos do jogador por tick de física de cada partida
+# num arquivo binário em PASTA_REPLAYS (também: --gravar). Reproduza com
+#   python atravessar_rua.py --replay replays/sessao_....atr
+GRAVAR_REPLAYS = False
+PASTA_REPLAYS = 'replays'
@@ -5,25 +5,101 @@ from __future__ import annotations
 import time
 from typing import Callable, Optional
 
-PHYSICS_HZ = 120
 _MAX_FRAME_TIME = 0.25  # seconds
 
+CATCH_UP_DROP = "drop"
+CATCH_UP_SLOW = "slow"
+CATCH_UP_SPREAD = "spread"
+CATCH_UP_POLICIES = (CATCH_UP_DROP, CATCH_UP_SLOW, CATCH_UP_SPREAD)
+
+TimeSource = Callable[[], float]
+
+
+class VirtualClock:
+    """Manually advanced time source for headless simulation.
+
+    Instances are callable and can be handed to :class:`FixedStepClock` in
+    place of :func:`time.perf_counter`, so simulated time only moves when
+    :meth:`advance` is called.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = float(start)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> float:
+        """Moves the clock forward by ``seconds`` and returns the new time."""
+        if seconds < 0:
+            raise ValueError("seconds must be non-negative")
+        self.now += seconds
+        return self.now
 
-class FixedStepClock:
-    """Accumulates frame time and executes a fixed-step callback."""
 
-    def __init__(self, physics_hz: int = PHYSICS_HZ) -> None:
+class FixedStepClock:
+    """Accumulates frame time and executes a fixed-step callback.
+
+    ``physics_hz`` has no default here: the game's rate lives in
+    ``config.PHYSICS_HZ``.
+
+    ``max_substeps`` bounds how many updates a single :meth:`step` may run,
+    so an overloaded machine cannot fall into a spiral where each slow frame
+    schedules even more work for the next one. Time beyond that bound is
+    handled by the ``catch_up`` policy:
+
+    * ``"drop"``: the remaining whole ticks are discarded
+      (counted in :attr:`dropped_ticks`).
+    * ``"slow"``: frame time above ``max_substeps * dt`` is not accumulated,
+      so the simulation runs in slow motion while overloaded
+      (counted in :attr:`slowed_time`).
+    * ``"spread"``: the debt stays in the accumulator and is paid over the
+      following frames, up to ``_MAX_FRAME_TIME`` of backlog; ticks run late
+      are counted in :attr:`deferred_ticks`, backlog beyond the cap in
+      :attr:`dropped_ticks`.
+    """
+
+    def __init__(
+        self,
+        physics_hz: int,
+        time_source: Optional[TimeSource] = None,
+        max_substeps: Optional[int] = None,
+        catch_up: str = CATCH_UP_DROP,
+    ) -> None:
         if physics_hz <= 0:
             raise ValueError("physics_hz must be positive")
+        if max_substeps is not None and max_substeps <= 0:
+            raise ValueError("max_substeps must be positive")
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(
+                f"catch_up must be one of {', '.join(CATCH_UP_POLICIES)}, got {catch_up!r}"
+            )
         self.physics_hz = physics_hz
         self.dt = 1.0 / float(physics_hz)
+        self.time_source: TimeSource = time_source or time.perf_counter
+        self.max_substeps = max_substeps
+        self.catch_up = catch_up
         self._accumulator = 0.0
-        self._last_time = time.perf_counter()
+        self._last_time = self.time_source()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.dropped_ticks = 0
+        self.deferred_ticks = 0
+        self.slowed_time = 0.0
+        self.last_substeps = 0
+        self._backlog = 0  # Whole ticks left unpaid by the previous step
+
+    @property
+    def pending_ticks(self) -> int:
+        """Whole ticks currently owed to the simulation."""
+        return int(self._accumulator // self.dt)
 
     def reset(self) -> None:
-        """Resets the accumulator so the next step starts fresh."""
+        """Resets the accumulator and counters so the next step starts fresh."""
         self._accumulator = 0.0
-        self._last_time = time.perf_counter()
+        self._last_time = self.time_source()
+        self._reset_counters()
 
     def step(
         self,
@@ -36,28 +112,63 @@ class FixedStepClock:
             update_fn: Callback executed once per fixed step. Receives ``dt``.
             render_fn: Optional callback executed once per outer frame with the
                 interpolation factor between the last completed update and the
-                next one. Receives ``alpha`` in ``[0, 1)``.
+                next one. Receives ``alpha`` in ``[0, 1)``, or ``1.0`` while
+                deferred ticks are still owed.
 
         Returns:
             The interpolation factor that was supplied to ``render_fn`` (or the
             current accumulator ratio if ``render_fn`` is not provided).
         """
-        now = time.perf_counter()
+        now = self.time_source()
         frame_time = now - self._last_time
         self._last_time = now
 
         if frame_time > _MAX_FRAME_TIME:
             frame_time = _MAX_FRAME_TIME
 
+        if self.max_substeps is not None and self.catch_up == CATCH_UP_SLOW:
+            budget = self.max_substeps * self.dt
+            if frame_time > budget:
+                self.slowed_time += frame_time - budget
+                frame_time = budget
+
         self._accumulator += frame_time
 
+        substeps = 0
         while self._accumulator >= self.dt:
+            if self.max_substeps is not None and substeps >= self.max_substeps:
+                break
             update_fn(self.dt)
             self._accumulator -= self.dt
+            substeps += 1
+        self.last_substeps = substeps
+
+        if self.max_substeps is not None:
+            self._settle_backlog(substeps)
 
         alpha = self._accumulator / self.dt if self.dt else 0.0
+        if alpha >= 1.0:
+            # Ticks still owed (spread policy): draw the latest state
+            alpha = 1.0
 
         if render_fn is not None:
             render_fn(alpha)
 
         return alpha
+
+    def _settle_backlog(self, substeps: int) -> None:
+        """Applies the catch-up policy to ticks left over after ``step``."""
+        self.deferred_ticks += min(substeps, self._backlog)
+
+        backlog = int(self._accumulator // self.dt)
+        if backlog and self.catch_up == CATCH_UP_SPREAD:
+            max_backlog = int(_MAX_FRAME_TIME // self.dt)
+            if backlog > max_backlog:
+                self.dropped_ticks += backlog - max_backlog
+                self._accumulator -= (backlog - max_backlog) * self.dt
+                backlog = max_backlog
+        elif backlog:
+            self.dropped_ticks += backlog
+            self._accumulator -= backlog * self.dt
+            backlog = 0
+        self._backlog = backlog
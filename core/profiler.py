@@ -0,0 +1,152 @@
+"""Per-section frame timing kept in fixed-size ring buffers."""
+
+from __future__ import annotations
+
+import csv
+import time
+from array import array
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+TimeSource = Callable[[], float]
+
+PERCENTILES = (50, 95, 99)
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of floats that overwrites its oldest sample."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._data = array("d", bytes(8 * capacity))
+        self._index = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def append(self, value: float) -> None:
+        self._data[self._index] = value
+        self._index = (self._index + 1) % len(self._data)
+        if self._count < len(self._data):
+            self._count += 1
+
+    def values(self) -> List[float]:
+        """Returns the stored samples, oldest first."""
+        if self._count < len(self._data):
+            return self._data[: self._count].tolist()
+        return (self._data[self._index:] + self._data[: self._index]).tolist()
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, -(-len(sorted_values) * p // 100))  # ceil(n * p / 100)
+    return sorted_values[int(rank) - 1]
+
+
+class FrameProfiler:
+    """Collects durations per named section of the frame.
+
+    The hot path is ``started = profiler.start()`` followed by
+    ``profiler.stop(name, started)``. While the profiler is disabled
+    :meth:`start` returns ``None`` and :meth:`stop` returns immediately, so
+    instrumentation can stay in place at negligible cost.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 600,
+        time_source: Optional[TimeSource] = None,
+        enabled: bool = False,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.time_source: TimeSource = time_source or time.perf_counter
+        self.enabled = enabled
+        self._sections: Dict[str, RingBuffer] = {}
+
+    def start(self) -> Optional[float]:
+        """Returns the current time, or ``None`` while disabled."""
+        if not self.enabled:
+            return None
+        return self.time_source()
+
+    def stop(self, name: str, started: Optional[float]) -> None:
+        """Records the time elapsed since ``started`` under ``name``."""
+        if started is None:
+            return
+        elapsed = self.time_source() - started
+        buffer = self._sections.get(name)
+        if buffer is None:
+            buffer = self._sections[name] = RingBuffer(self.capacity)
+        buffer.append(elapsed)
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Context manager form of :meth:`start`/:meth:`stop`."""
+        started = self.start()
+        try:
+            yield
+        finally:
+            self.stop(name, started)
+
+    @property
+    def sections(self) -> List[str]:
+        """Section names in the order they were first recorded."""
+        return list(self._sections)
+
+    def samples(self, name: str) -> List[float]:
+        """Durations (seconds) currently stored for ``name``, oldest first."""
+        buffer = self._sections.get(name)
+        return buffer.values() if buffer is not None else []
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Statistics per section, in milliseconds.
+
+        Each entry has ``samples``, ``mean``, ``p50``, ``p95``, ``p99`` and
+        ``max``. Sections without samples are omitted.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for name, buffer in self._sections.items():
+            values = sorted(buffer.values())
+            if not values:
+                continue
+            stats: Dict[str, float] = {
+                "samples": len(values),
+                "mean": sum(values) / len(values) * 1000.0,
+            }
+            for p in PERCENTILES:
+                stats[f"p{p}"] = percentile(values, p) * 1000.0
+            stats["max"] = values[-1] * 1000.0
+            result[name] = stats
+        return result
+
+    def dump_csv(self, path: str) -> str:
+        """Writes :meth:`summary` to ``path`` as CSV and returns the path."""
+        columns = ["samples", "mean"] + [f"p{p}" for p in PERCENTILES] + ["max"]
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["section"] + [c if c == "samples" else f"{c}_ms" for c in columns])
+            for name, stats in self.summary().items():
+                row = [name, int(stats["samples"])]
+                row += [f"{stats[c]:.4f}" for c in columns[1:]]
+                writer.writerow(row)
+        return path
+
+    def clear(self) -> None:
+        """Discards all samples."""
+        for buffer in self._sections.values():
+            buffer.clear()
+
+    def __repr__(self) -> str:
+        return f"FrameProfiler(enabled={self.enabled}, sections={len(self._sections)})"
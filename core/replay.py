@@ -0,0 +1,252 @@
+"""Compact binary recording of per-tick player commands.
+
+File layout (little endian)::
+
+    header   magic "ATRR" | version u8 | physics_hz u16 | seed u64
+             | density f64 | profile length u8 | profile (utf-8)
+    records  varint tick delta | command u8        (repeated)
+    trailer  varint tick delta | END u8            (optional)
+
+Each record stores the number of physics ticks since the previous record
+followed by one command byte. A command is a grid move ``(dx, dy)`` with
+both components in ``{-1, 0, 1}``, packed as ``(dx + 1) * 3 + (dy + 1)``.
+The trailer marks the tick at which the session ended; files cut short
+(e.g. the game crashed) are still readable up to the last full record.
+
+World generation also depends on the density profile and traffic
+multiplier (they change how many draws each lane consumes), so both are
+part of the header. Version 1 files, which predate them, are read as the
+``"normal"`` profile with multiplier 1.0.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+MAGIC = b"ATRR"
+VERSION = 2
+END = 0xFF
+
+DEFAULT_PROFILE = "normal"
+DEFAULT_DENSITY = 1.0
+
+_HEADER = struct.Struct("<4sBHQ")
+_HEADER_V2 = struct.Struct("<dB")  # density, profile length
+
+Command = Tuple[int, int, int]  # (tick, dx, dy)
+
+
+class ReplayError(ValueError):
+    """Raised when a replay file is malformed or has an unknown version."""
+
+
+def encode_command(dx: int, dy: int) -> int:
+    """Packs a grid move into one byte."""
+    if dx not in (-1, 0, 1) or dy not in (-1, 0, 1):
+        raise ValueError(f"move out of range: ({dx}, {dy})")
+    return (dx + 1) * 3 + (dy + 1)
+
+
+def decode_command(code: int) -> Tuple[int, int]:
+    """Inverse of :func:`encode_command`."""
+    if not 0 <= code < 9:
+        raise ReplayError(f"unknown command byte: {code}")
+    return code // 3 - 1, code % 3 - 1
+
+
+def _write_varint(stream: BinaryIO, value: int) -> None:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            break
+    stream.write(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Returns ``(value, new_pos)``; raises IndexError on truncated input."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class InputRecorder:
+    """Appends commands to a replay file as they are issued.
+
+    Ticks must be non-decreasing. Several commands may share a tick; they
+    are replayed in the order they were recorded.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        seed: int,
+        physics_hz: int,
+        profile: str = DEFAULT_PROFILE,
+        density: float = DEFAULT_DENSITY,
+    ) -> None:
+        encoded_profile = profile.encode("utf-8")
+        if len(encoded_profile) > 255:
+            raise ValueError("profile name too long")
+        self.path = path
+        self.seed = seed
+        self.physics_hz = physics_hz
+        self.profile = profile
+        self.density = density
+        self.commands = 0
+        self._last_tick = 0
+        self._stream: Optional[BinaryIO] = open(path, "wb")
+        self._stream.write(_HEADER.pack(MAGIC, VERSION, physics_hz, seed))
+        self._stream.write(_HEADER_V2.pack(density, len(encoded_profile)) + encoded_profile)
+
+    @property
+    def closed(self) -> bool:
+        return self._stream is None
+
+    def record(self, tick: int, dx: int, dy: int) -> None:
+        """Records the move ``(dx, dy)`` issued before physics tick ``tick``."""
+        if self._stream is None:
+            raise ValueError("recorder is closed")
+        if tick < self._last_tick:
+            raise ValueError("ticks must be non-decreasing")
+        code = encode_command(dx, dy)
+        _write_varint(self._stream, tick - self._last_tick)
+        self._stream.write(bytes((code,)))
+        self._last_tick = tick
+        self.commands += 1
+
+    def close(self, end_tick: Optional[int] = None) -> None:
+        """Writes the trailer (if ``end_tick`` is given) and closes the file."""
+        if self._stream is None:
+            return
+        if end_tick is not None:
+            _write_varint(self._stream, max(0, end_tick - self._last_tick))
+            self._stream.write(bytes((END,)))
+        self._stream.close()
+        self._stream = None
+
+    def __enter__(self) -> "InputRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"InputRecorder(path={self.path!r}, commands={self.commands})"
+
+
+class Replay:
+    """A decoded replay file: world settings and the command list."""
+
+    def __init__(
+        self,
+        seed: int,
+        physics_hz: int,
+        commands: List[Command],
+        end_tick: Optional[int] = None,
+        profile: str = DEFAULT_PROFILE,
+        density: float = DEFAULT_DENSITY,
+    ) -> None:
+        self.seed = seed
+        self.physics_hz = physics_hz
+        self.commands = commands
+        self.end_tick = end_tick
+        self.profile = profile
+        self.density = density
+
+    @property
+    def length(self) -> int:
+        """Ticks covered by the replay (trailer tick, or last command + 1)."""
+        if self.end_tick is not None:
+            return self.end_tick
+        return self.commands[-1][0] + 1 if self.commands else 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ReplayError("file too short for a replay header")
+        magic, version, physics_hz, seed = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("not a replay file")
+        if version not in (1, VERSION):
+            raise ReplayError(f"unsupported replay version: {version}")
+
+        pos = _HEADER.size
+        profile, density = DEFAULT_PROFILE, DEFAULT_DENSITY
+        if version >= 2:
+            if len(data) < pos + _HEADER_V2.size:
+                raise ReplayError("file too short for a replay header")
+            density, length = _HEADER_V2.unpack_from(data, pos)
+            pos += _HEADER_V2.size
+            if len(data) < pos + length:
+                raise ReplayError("file too short for a replay header")
+            profile = data[pos:pos + length].decode("utf-8")
+            pos += length
+
+        commands: List[Command] = []
+        end_tick = None
+        tick = 0
+        while pos < len(data):
+            try:
+                delta, next_pos = _read_varint(data, pos)
+                code = data[next_pos]
+            except IndexError:
+                break  # truncated last record
+            pos = next_pos + 1
+            tick += delta
+            if code == END:
+                end_tick = tick
+                break
+            dx, dy = decode_command(code)
+            commands.append((tick, dx, dy))
+        return cls(seed, physics_hz, commands, end_tick, profile, density)
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as handle:
+            return cls.from_bytes(handle.read())
+
+    def feeder(self) -> "CommandFeeder":
+        """Returns a :class:`CommandFeeder` positioned at the first command."""
+        return CommandFeeder(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"Replay(seed={self.seed}, physics_hz={self.physics_hz}, "
+            f"profile={self.profile!r}, density={self.density}, "
+            f"commands={len(self.commands)}, length={self.length})"
+        )
+
+
+class CommandFeeder:
+    """Hands out a replay's commands as the simulation reaches their ticks.
+
+    Every consumer that replays a file goes through :meth:`due` before each
+    physics tick, so they all apply commands at exactly the same point.
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        self._commands = replay.commands
+        self._index = 0
+
+    def due(self, tick: int) -> Iterator[Tuple[int, int]]:
+        """Yields the ``(dx, dy)`` moves recorded up to ``tick``, once each."""
+        commands = self._commands
+        while self._index < len(commands) and commands[self._index][0] <= tick:
+            yield commands[self._index][1:]
+            self._index += 1
+
+    @property
+    def remaining(self) -> int:
+        return len(self._commands) - self._index
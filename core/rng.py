@@ -0,0 +1,31 @@
+"""Deterministic random streams derived from a world seed."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Hashable
+
+_SEED_BITS = 63
+
+
+def derive_seed(seed: int, *labels: Hashable) -> int:
+    """Derives an independent seed for the stream identified by ``labels``.
+
+    The result only depends on ``seed`` and the labels (not on
+    ``PYTHONHASHSEED`` or on the order in which streams are created), so
+    the same world seed always yields the same sub-streams.
+    """
+    data = repr((seed,) + labels).encode("utf-8")
+    digest = hashlib.sha256(data).digest()
+    return int.from_bytes(digest[:8], "big") >> (64 - _SEED_BITS)
+
+
+def make_rng(seed: int, *labels: Hashable) -> random.Random:
+    """Returns a private ``random.Random`` for the stream ``labels``."""
+    return random.Random(derive_seed(seed, *labels))
+
+
+def new_seed() -> int:
+    """Draws a fresh world seed from the operating system's entropy source."""
+    return random.SystemRandom().getrandbits(_SEED_BITS)
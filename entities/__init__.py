@@ -6,6 +6,7 @@ from .jogador import Jogador
 from .carro import Carro
 from .safe_zone import SafeZone
 from .tronco import Tronco
+from .entidade_faixa import EntidadeFaixa
 
-__all__ = ['Jogador', 'Carro', 'SafeZone', 'Tronco']
+__all__ = ['Jogador', 'Carro', 'SafeZone', 'Tronco', 'EntidadeFaixa']
 
@@ -0,0 +1,88 @@
+"""
+Base das entidades que andam na horizontal dentro de uma faixa
+"""
+
+import pygame
+
+
+class EntidadeFaixa(pygame.sprite.Sprite):
+    """
+    Sprite de faixa (carro ou tronco) com posição opcionalmente vetorizada
+
+    Enquanto vinculada a um KinematicStore, a posição X vive nos arrays do
+    store e o rect é sincronizado apenas quando alguém o lê (colisão,
+    renderização). Desvinculada, funciona como um sprite comum.
+    """
+
+    _cinematica = None
+    _slot = None
+    _x_anterior = None  # X antes do último passo (caminho por objeto)
+
+    @property
+    def x(self):
+        """Posição X (centro) no mundo"""
+        if self._cinematica is not None:
+            return float(self._cinematica.x[self._slot])
+        return self._x
+
+    @x.setter
+    def x(self, valor):
+        if self._cinematica is not None:
+            self._cinematica.x[self._slot] = valor
+        else:
+            self._x = valor
+
+    @property
+    def rect(self):
+        """Rect do sprite, com centerx lido do store quando vinculado"""
+        if self._cinematica is not None:
+            self._rect.centerx = int(self._cinematica.x[self._slot])
+        return self._rect
+
+    @rect.setter
+    def rect(self, valor):
+        self._rect = valor
+
+    def x_interpolado(self, alpha):
+        """
+        Posição X (centro) entre o passo de física anterior e o atual
+
+        Args:
+            alpha: Fração do próximo passo já decorrida [0, 1)
+
+        Returns:
+            float: Posição X para desenho
+        """
+        if self._cinematica is not None:
+            return float(self._cinematica.interpolar(alpha)[self._slot])
+        if self._x_anterior is None:
+            return self._x
+        return self._x_anterior + (self._x - self._x_anterior) * alpha
+
+    @property
+    def vinculada(self):
+        """True se a posição está sendo movida por um KinematicStore"""
+        return self._cinematica is not None
+
+    def vincular(self, cinematica):
+        """
+        Passa a posição X para o store vetorizado
+
+        Args:
+            cinematica: KinematicStore que moverá a entidade
+        """
+        if self._cinematica is not None:
+            return
+        self._slot = cinematica.registrar(self._x, self.velocidade, self.direcao, self._rect.width)
+        self._cinematica = cinematica
+
+    def desvincular(self):
+        """Traz a posição de volta para o sprite e libera o slot do store"""
+        if self._cinematica is None:
+            return
+        self._x = float(self._cinematica.x[self._slot])
+        self._x_anterior = float(self._cinematica.x_anterior[self._slot])
+        self._rect.centerx = int(self._x)
+        self._cinematica.liberar(self._slot)
+        self._cinematica = None
+        self._slot = None
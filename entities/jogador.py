@@ -5,6 +5,9 @@ Classe do jogador (sapo)
 import pygame
 import config
 
+# Duração do arco do pulo (s): os 4 passos que ele durava com a física a 120 Hz
+DURACAO_PULO = 4 / 120
+
 
 class Jogador(pygame.sprite.Sprite):
     """Classe que representa o personagem controlado pelo jogador"""
@@ -23,6 +26,10 @@ class Jogador(pygame.sprite.Sprite):
         self.x = float(self.pos_inicial_x)
         self.y = float(self.pos_inicial_y)
         
+        # Posição no início do último passo de física (para interpolar o desenho)
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+        
         # Atualizar rect imediatamente
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
@@ -33,7 +40,8 @@ class Jogador(pygame.sprite.Sprite):
         
         # Estado de movimento (para permitir input durante movimento)
         self.movendo = False
-        self.frame_animacao = 0  # Contador de frames para animação de pulo
+        self.pulando = False  # Arco do pulo em andamento (pode durar mais que o movimento)
+        self.tempo_pulo = 0.0  # Tempo (s) desde o início do pulo atual
         self.velocidade = config.VELOCIDADE_JOGADOR  # Pixels por segundo
         self._pendente_x = 0.0
         self._pendente_y = 0.0
@@ -132,9 +140,31 @@ class Jogador(pygame.sprite.Sprite):
 
         if self._pendente_x or self._pendente_y:
             self.movendo = True
-            self.frame_animacao = 0
+            self.pulando = True
+            self.tempo_pulo = 0.0
             self.tempo_animacao += 0.1  # Para animação contínua (opcional)
 
+    def guardar_posicao_anterior(self):
+        """Registra a posição atual como início do próximo passo de física"""
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+
+    def centro_interpolado(self, alpha):
+        """
+        Centro do sprite entre o passo anterior e o atual (mantém o pulo)
+        
+        Args:
+            alpha: Fração do próximo passo já decorrida [0, 1)
+            
+        Returns:
+            tuple: (x, y) no mundo para desenho
+        """
+        x = self.x_anterior + (self.x - self.x_anterior) * alpha
+        y = self.y_anterior + (self.y - self.y_anterior) * alpha
+        # Deslocamento do pulo aplicado ao rect em atualizar()
+        pulo = self.rect.centery - int(self.y)
+        return x, y + pulo
+
     def step(self, delta_time):
         """Aplica o deslocamento acumulado usando a velocidade por segundo."""
         if not (self._pendente_x or self._pendente_y):
@@ -186,12 +216,14 @@ class Jogador(pygame.sprite.Sprite):
         Args:
             delta_time: Tempo desde o último frame (em segundos)
         """
-        if self.movendo:
-            # Efeito de pulo sutil (arco parabólico) - baseado em tempo
-            self.frame_animacao += 1
-            if self.frame_animacao < 4:
+        if self.pulando:
+            # Efeito de pulo sutil (arco parabólico) - baseado em tempo, para a
+            # duração não depender de config.PHYSICS_HZ. Dura DURACAO_PULO
+            # mesmo que o movimento (step) termine antes, como a 60 Hz
+            self.tempo_pulo += delta_time
+            if self.tempo_pulo < DURACAO_PULO - 1e-9:
                 # Arco parabólico pequeno
-                progresso = self.frame_animacao / 4.0
+                progresso = self.tempo_pulo / DURACAO_PULO
                 offset_y = int(4 * (1 - abs(progresso - 0.5) * 2))  # Pico no meio
                 self.rect.centery = int(self.y) - offset_y
             else:
@@ -199,7 +231,8 @@ class Jogador(pygame.sprite.Sprite):
                 self.rect.centerx = int(self.x)
                 self.rect.centery = int(self.y)
                 self.movendo = abs(self._pendente_x) > 1e-3 or abs(self._pendente_y) > 1e-3
-                self.frame_animacao = 0
+                self.pulando = self.movendo
+                self.tempo_pulo = 0.0
 
         # Atualizar animação contínua
         self.tempo_animacao += delta_time
@@ -209,10 +242,12 @@ class Jogador(pygame.sprite.Sprite):
         self.x, self.y = self._snap_ao_grid(self.pos_inicial_x, self.pos_inicial_y)
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
+        self.guardar_posicao_anterior()  # Teleporte: sem interpolar a partir do ponto antigo
         self.angulo = 0
         self.movendo = False
+        self.pulando = False
         self.tempo_animacao = 0.0
-        self.frame_animacao = 0
+        self.tempo_pulo = 0.0
         self._pendente_x = 0.0
         self._pendente_y = 0.0
         self.desenhar()
@@ -2,22 +2,35 @@
 Classe de Área de Descanso (Safe Zone)
 """
 
+import random
+
 import pygame
 import config
+from core.rng import make_rng
+from utils.sprite_cache import converter_para_tela
+
+# Folga vertical da superfície em cache: a textura de grama e as bordas
+# ultrapassam alguns pixels os limites da zona
+_MARGEM_CACHE = 8
 
 
 class SafeZone:
     """Classe que representa uma área de descanso segura"""
 
-    def __init__(self, y_pos, altura=None):
+    # Folga (px) da superfície em cache acima e abaixo da zona
+    MARGEM_CACHE = _MARGEM_CACHE
+
+    def __init__(self, y_pos, altura=None, semente=None):
         """
         Inicializa uma área de descanso
         
         Args:
             y_pos: Posição Y no mundo (coordenada vertical)
             altura: Altura da zona (padrão: ALTURA_AREA_DESCANSO)
+            semente: Seed do mundo para a textura de grama (opcional)
         """
         self.y_pos = y_pos
+        self.semente = semente
         self.altura = altura if altura else config.ALTURA_AREA_DESCANSO
         self.largura = config.LARGURA_TELA
         self.ativa = True
@@ -29,6 +42,9 @@ class SafeZone:
         
         # Para animações futuras
         self.tempo_animacao = 0
+
+        # Fundo pré-renderizado (criado na primeira renderização visível)
+        self._superficie_cache = None
         
     def esta_dentro(self, y):
         """
@@ -66,39 +82,65 @@ class SafeZone:
         # Posição na tela considerando o offset da câmera
         y_tela = self.y_pos - camera_offset
         
-        # Não renderizar se estiver fora da tela
+        # Não renderizar se estiver fora da tela (libera o fundo em cache)
         if y_tela + self.altura < 0 or y_tela > config.ALTURA_TELA:
+            self.liberar_cache()
             return
         
-        # Desenhar fundo principal da área de descanso - MAIS VISÍVEL
-        pygame.draw.rect(
-            surface,
-            self.cor_principal,
-            (0, y_tela, self.largura, self.altura)
-        )
-        
-        # BORDA VISÍVEL para destacar safe zone
-        pygame.draw.rect(
-            surface,
-            self.cor_borda,
-            (0, y_tela, self.largura, self.altura),
-            3  # Borda grossa
-        )
-        
-        # Linha central para indicar área segura
-        pygame.draw.line(
-            surface,
-            self.cor_detalhe,
-            (0, y_tela + self.altura // 2),
-            (self.largura, y_tela + self.altura // 2),
-            2
-        )
-        
-        # Adicionar textura de grama (pequenos detalhes)
-        self._desenhar_textura_grama(surface, y_tela)
-        
-        # Adicionar bordas sutis para indicar zona segura
-        self._desenhar_bordas(surface, y_tela)
+        surface.blit(self.obter_superficie(), (0, y_tela - _MARGEM_CACHE))
+
+    def obter_superficie(self):
+        """
+        Retorna o fundo da área de descanso renderizado uma única vez
+
+        A superfície tem _MARGEM_CACHE pixels de folga acima e abaixo da zona.
+
+        Returns:
+            pygame.Surface: Fundo com grama, bordas e linha central
+        """
+        if self._superficie_cache is None:
+            superficie = pygame.Surface(
+                (self.largura, int(self.altura) + 2 * _MARGEM_CACHE), pygame.SRCALPHA
+            )
+            y_topo = _MARGEM_CACHE
+
+            # Desenhar fundo principal da área de descanso - MAIS VISÍVEL
+            pygame.draw.rect(
+                superficie,
+                self.cor_principal,
+                (0, y_topo, self.largura, self.altura)
+            )
+
+            # BORDA VISÍVEL para destacar safe zone
+            pygame.draw.rect(
+                superficie,
+                self.cor_borda,
+                (0, y_topo, self.largura, self.altura),
+                3  # Borda grossa
+            )
+
+            # Linha central para indicar área segura
+            pygame.draw.line(
+                superficie,
+                self.cor_detalhe,
+                (0, y_topo + self.altura // 2),
+                (self.largura, y_topo + self.altura // 2),
+                2
+            )
+
+            # Adicionar textura de grama (pequenos detalhes)
+            self._desenhar_textura_grama(superficie, y_topo)
+
+            # Adicionar bordas sutis para indicar zona segura
+            self._desenhar_bordas(superficie, y_topo)
+
+            self._superficie_cache = converter_para_tela(superficie)
+
+        return self._superficie_cache
+
+    def liberar_cache(self):
+        """Descarta o fundo pré-renderizado (zona saiu da área ativa)"""
+        self._superficie_cache = None
     
     def _desenhar_textura_grama(self, surface, y_tela):
         """
@@ -109,16 +151,20 @@ class SafeZone:
             y_tela: Posição Y na tela
         """
         # Desenhar pequenos detalhes de grama em padrão
-        import random
-        random.seed(int(self.y_pos))  # Seed baseado na posição para consistência
+        # Gerador próprio derivado da seed do mundo e da posição
+        # (não altera o random global)
+        if self.semente is not None:
+            rng = make_rng(self.semente, 'grama', int(self.y_pos))
+        else:
+            rng = random.Random(int(self.y_pos))
         
         for i in range(0, self.largura, 20):
             for j in range(0, int(self.altura), 15):
                 # Pequenas linhas de grama
-                if random.random() > 0.3:
-                    x = i + random.randint(-5, 5)
-                    y = y_tela + j + random.randint(-3, 3)
-                    altura_linha = random.randint(3, 6)
+                if rng.random() > 0.3:
+                    x = i + rng.randint(-5, 5)
+                    y = y_tela + j + rng.randint(-3, 3)
+                    altura_linha = rng.randint(3, 6)
                     
                     pygame.draw.line(
                         surface,
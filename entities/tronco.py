@@ -4,9 +4,108 @@ Classe de Tronco (plataforma flutuante no rio)
 
 import pygame
 import config
+from utils.sprite_cache import SpriteCache
+from entities.entidade_faixa import EntidadeFaixa
 
 
-class Tronco(pygame.sprite.Sprite):
+def _renderizar_tronco(largura, altura):
+    """
+    Desenha tronco com pixel art profissional - AJUSTADO PARA 32px ALTURA
+
+    Args:
+        largura: Largura do tronco (múltiplo de 32px)
+        altura: Altura do tronco (32px)
+
+    Returns:
+        pygame.Surface: Nova imagem do tronco com fundo transparente
+    """
+    superficie = pygame.Surface((largura, altura), pygame.SRCALPHA)
+
+    # CORES PROFISSIONAIS DE MADEIRA
+    marrom_base = (101, 67, 33)      # Marrom escuro (casca)
+    marrom_claro = (139, 90, 43)     # Marrom médio (centro)
+    marrom_escuro = (69, 39, 19)     # Marrom muito escuro (sombra)
+    marrom_highlight = (160, 110, 60) # Marrom claro (brilho)
+    
+    # === SOMBRA NA ÁGUA ===
+    # Sombra suave e realista
+    sombra_cores = [
+        (40, 20, 10),  # Mais escura
+        (50, 30, 15),  # Média
+    ]
+    for i in range(2):
+        pygame.draw.ellipse(
+            superficie,
+            sombra_cores[i],
+            (2 + i, altura - 2 + i, largura - 4 - i*2, 4 - i),
+        )
+    
+    # === CORPO PRINCIPAL (32px altura) ===
+    # Base escura
+    pygame.draw.rect(superficie, marrom_escuro, (0, 4, largura, altura - 8))
+    # Corpo principal
+    pygame.draw.rect(superficie, marrom_base, (1, 6, largura - 2, altura - 12))
+    # Highlight superior (brilho do sol)
+    pygame.draw.ellipse(superficie, marrom_highlight, (2, 8, largura - 4, 10))
+    # Meio-tom
+    pygame.draw.rect(superficie, marrom_claro, (2, 9, largura - 4, 8))
+    
+    # === ANÉIS DE CRESCIMENTO (TEXTURA DE MADEIRA) ===
+    # Anéis bem desenhados para textura real
+    num_aneis = max(2, largura // 32)
+    for i in range(num_aneis):
+        x = (i + 1) * (largura // (num_aneis + 1))
+        # Anel escuro
+        pygame.draw.line(superficie, marrom_escuro, (x, 10), (x, 20), 1)
+        # Anel claro ao lado
+        if x + 1 < largura - 1:
+            pygame.draw.line(superficie, marrom_highlight, (x + 1, 11), (x + 1, 19), 1)
+    
+    # === EXTREMIDADES ARREDONDADAS ===
+    # Círculos nas pontas para forma cilíndrica (ajustados para 32px)
+    pygame.draw.circle(superficie, marrom_escuro, (1, altura // 2), 4)
+    pygame.draw.circle(superficie, marrom_escuro, (largura - 1, altura // 2), 4)
+    pygame.draw.circle(superficie, marrom_base, (1, altura // 2), 3)
+    pygame.draw.circle(superficie, marrom_base, (largura - 1, altura // 2), 3)
+    # Highlight nas extremidades
+    pygame.draw.circle(superficie, marrom_highlight, (2, altura // 2 - 1), 2)
+    pygame.draw.circle(superficie, marrom_highlight, (largura - 2, altura // 2 - 1), 2)
+    
+    # === RACHADURAS E DETALHES ===
+    # Pequenas rachaduras para realismo
+    if largura > 64:
+        for i in range(2):
+            x_rach = 8 + i * (largura // 3)
+            pygame.draw.line(superficie, marrom_escuro, (x_rach, 11), (x_rach, 19), 1)
+    
+    # === BORDAS ===
+    # Borda superior e inferior para profundidade
+    pygame.draw.line(superficie, marrom_escuro, (1, 10), (largura - 1, 10), 1)
+    pygame.draw.line(superficie, marrom_escuro, (1, 20), (largura - 1, 20), 1)
+
+    return superficie
+
+
+# Uma imagem por variante (largura, altura), compartilhada por todos os troncos
+_SPRITES_TRONCO = SpriteCache(_renderizar_tronco)
+
+
+def pre_renderizar_troncos(larguras, altura=32):
+    """
+    Garante no cache as imagens das larguras informadas
+
+    Útil antes de criar troncos fora da thread principal, para que a
+    renderização e a conversão de formato aconteçam nela.
+
+    Args:
+        larguras: Larguras de tronco (múltiplos de 32px)
+        altura: Altura do tronco
+    """
+    for largura in larguras:
+        _SPRITES_TRONCO.obter(largura, altura)
+
+
+class Tronco(EntidadeFaixa):
     """Classe que representa um tronco flutuante no rio"""
 
     def __init__(self, x, y, largura, velocidade, direcao=1):
@@ -27,83 +126,20 @@ class Tronco(pygame.sprite.Sprite):
         self.velocidade = velocidade
         self.direcao = direcao
         
-        # Criar surface
-        self.image = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
+        # Rect do sprite (a imagem é compartilhada e vem do cache)
+        self.rect = pygame.Rect(0, 0, self.largura, self.altura)
         self.rect.centerx = int(x)
         self.rect.centery = int(y)
 
         self.x = float(x)
         self.y = float(y)
 
-        # Desenhar o tronco
+        # Imagem compartilhada do cache
         self.desenhar()
     
     def desenhar(self):
-        """Desenha tronco com pixel art profissional - AJUSTADO PARA 32px ALTURA"""
-        self.image.fill((0, 0, 0, 0))  # Transparente
-        
-        # CORES PROFISSIONAIS DE MADEIRA
-        marrom_base = (101, 67, 33)      # Marrom escuro (casca)
-        marrom_claro = (139, 90, 43)     # Marrom médio (centro)
-        marrom_escuro = (69, 39, 19)     # Marrom muito escuro (sombra)
-        marrom_highlight = (160, 110, 60) # Marrom claro (brilho)
-        
-        # === SOMBRA NA ÁGUA ===
-        # Sombra suave e realista
-        sombra_cores = [
-            (40, 20, 10),  # Mais escura
-            (50, 30, 15),  # Média
-        ]
-        for i in range(2):
-            pygame.draw.ellipse(
-                self.image,
-                sombra_cores[i],
-                (2 + i, self.altura - 2 + i, self.largura - 4 - i*2, 4 - i),
-            )
-        
-        # === CORPO PRINCIPAL (32px altura) ===
-        # Base escura
-        pygame.draw.rect(self.image, marrom_escuro, (0, 4, self.largura, self.altura - 8))
-        # Corpo principal
-        pygame.draw.rect(self.image, marrom_base, (1, 6, self.largura - 2, self.altura - 12))
-        # Highlight superior (brilho do sol)
-        pygame.draw.ellipse(self.image, marrom_highlight, (2, 8, self.largura - 4, 10))
-        # Meio-tom
-        pygame.draw.rect(self.image, marrom_claro, (2, 9, self.largura - 4, 8))
-        
-        # === ANÉIS DE CRESCIMENTO (TEXTURA DE MADEIRA) ===
-        # Anéis bem desenhados para textura real
-        num_aneis = max(2, self.largura // 32)
-        for i in range(num_aneis):
-            x = (i + 1) * (self.largura // (num_aneis + 1))
-            # Anel escuro
-            pygame.draw.line(self.image, marrom_escuro, (x, 10), (x, 20), 1)
-            # Anel claro ao lado
-            if x + 1 < self.largura - 1:
-                pygame.draw.line(self.image, marrom_highlight, (x + 1, 11), (x + 1, 19), 1)
-        
-        # === EXTREMIDADES ARREDONDADAS ===
-        # Círculos nas pontas para forma cilíndrica (ajustados para 32px)
-        pygame.draw.circle(self.image, marrom_escuro, (1, self.altura // 2), 4)
-        pygame.draw.circle(self.image, marrom_escuro, (self.largura - 1, self.altura // 2), 4)
-        pygame.draw.circle(self.image, marrom_base, (1, self.altura // 2), 3)
-        pygame.draw.circle(self.image, marrom_base, (self.largura - 1, self.altura // 2), 3)
-        # Highlight nas extremidades
-        pygame.draw.circle(self.image, marrom_highlight, (2, self.altura // 2 - 1), 2)
-        pygame.draw.circle(self.image, marrom_highlight, (self.largura - 2, self.altura // 2 - 1), 2)
-        
-        # === RACHADURAS E DETALHES ===
-        # Pequenas rachaduras para realismo
-        if self.largura > 64:
-            for i in range(2):
-                x_rach = 8 + i * (self.largura // 3)
-                pygame.draw.line(self.image, marrom_escuro, (x_rach, 11), (x_rach, 19), 1)
-        
-        # === BORDAS ===
-        # Borda superior e inferior para profundidade
-        pygame.draw.line(self.image, marrom_escuro, (1, 10), (self.largura - 1, 10), 1)
-        pygame.draw.line(self.image, marrom_escuro, (1, 20), (self.largura - 1, 20), 1)
+        """Usa a imagem pré-renderizada compartilhada para a largura do tronco"""
+        self.image = _SPRITES_TRONCO.obter(self.largura, self.altura)
     
     def update(self):
         """Atualiza a posição do tronco (método compatível com sprite.Group.update())"""
@@ -117,6 +153,7 @@ class Tronco(pygame.sprite.Sprite):
             delta_time: Tempo desde o último frame (em segundos)
         """
         # Movimento baseado em velocidade em pixels por segundo
+        self._x_anterior = self.x
         self.x += self.velocidade * self.direcao * delta_time
         self.rect.centerx = int(self.x)
 
@@ -124,6 +161,8 @@ class Tronco(pygame.sprite.Sprite):
         if self.direcao == 1 and self.rect.left > config.LARGURA_TELA:
             self.rect.right = -self.largura
             self.x = float(self.rect.centerx)
+            self._x_anterior = self.x  # Reaparece sem atravessar a tela
         elif self.direcao == -1 and self.rect.right < 0:
             self.rect.left = config.LARGURA_TELA + self.largura
             self.x = float(self.rect.centerx)
+            self._x_anterior = self.x
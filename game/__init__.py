@@ -3,10 +3,12 @@ Módulo de lógica do jogo
 """
 
 from .game_state import GameState
-from .collision import CollisionSystem
+from .collision import CollisionSystem, LaneGroup
 from .camera import Camera
 from .procedural_generator import ProceduralGenerator
 from .river_physics import RiverPhysics
+from .lane_registry import LaneRegistry
 
-__all__ = ['GameState', 'CollisionSystem', 'Camera', 'ProceduralGenerator', 'RiverPhysics']
+__all__ = ['GameState', 'CollisionSystem', 'LaneGroup', 'Camera', 'ProceduralGenerator', 'RiverPhysics',
+           'LaneRegistry']
 
@@ -0,0 +1,269 @@
+"""
+Fundo pré-renderizado dos chunks do mundo
+"""
+
+import math
+
+import pygame
+import config
+from utils.sprite_cache import converter_para_tela
+
+# Cor da água dos rios
+COR_AGUA = (50, 100, 200)
+
+# Quanto o fundo de um chunk pode passar dos seus limites (asfalto da
+# primeira faixa, folga da safe zone)
+_SOBRA_FUNDO = config.TAMANHO_CELL // 2
+
+# Fundos de chunks até esta distância além da área que o canvas desenha
+# continuam em cache, para um chunk na borda não ser renderizado a cada frame
+_MARGEM_DESCARTE = 4 * config.TAMANHO_CELL
+
+
+def _renderizar_estrada(chunk):
+    """
+    Desenha o asfalto e as linhas amarelas de um chunk de estrada
+
+    O asfalto de cada faixa é centrado no Y da faixa, então a primeira
+    invade metade de uma célula acima do chunk; a superfície começa ali.
+
+    Args:
+        chunk: Chunk do tipo 'estrada'
+
+    Returns:
+        tuple: (Surface, Y no mundo do topo da superfície)
+    """
+    altura_faixa = config.TAMANHO_CELL  # 1 célula (32px)
+    y_topo = chunk.y_inicio - altura_faixa // 2
+    superficie = pygame.Surface((config.LARGURA_TELA, chunk.y_fim - y_topo))
+    superficie.fill(config.AZUL)
+
+    # Linhas amarelas - ALINHADAS AO GRID
+    espacamento_linhas = config.TAMANHO_CELL * 2  # A cada 2 células (64px)
+    largura_linha = config.TAMANHO_CELL // 2  # Meia célula (16px)
+
+    for faixa in chunk.dados.get('faixas', []):
+        y_faixa = faixa['y'] - y_topo
+
+        # Asfalto da faixa - ALINHADO AO GRID 32px
+        superficie.fill(
+            config.ASFALTO,
+            (0, y_faixa - altura_faixa // 2, config.LARGURA_TELA, altura_faixa)
+        )
+        for x in range(0, config.LARGURA_TELA, espacamento_linhas):
+            superficie.fill(
+                config.AMARELO,
+                (x + config.TAMANHO_CELL // 4, y_faixa - 2, largura_linha, 4)
+            )
+
+    return converter_para_tela(superficie, alfa=False), y_topo
+
+
+def _renderizar_rio(chunk):
+    """
+    Desenha a água de um chunk de rio (cor sólida)
+
+    Args:
+        chunk: Chunk do tipo 'rio'
+
+    Returns:
+        tuple: (Surface, Y no mundo do topo da superfície)
+    """
+    altura_chunk = chunk.dados.get('altura', 96)  # 3 células (96px) - múltiplo de 32
+    superficie = pygame.Surface((config.LARGURA_TELA, altura_chunk))
+    superficie.fill(COR_AGUA)
+    return converter_para_tela(superficie, alfa=False), chunk.y_inicio
+
+
+class ChunkBackgroundCache:
+    """
+    Guarda o fundo já desenhado de cada chunk visível
+
+    O fundo de um chunk não muda depois de gerado: ele é renderizado na
+    primeira vez que o chunk aparece e reaproveitado até sair da área
+    visível. Safe zones usam a superfície que a própria SafeZone mantém.
+    """
+
+    def __init__(self):
+        """Inicializa o cache vazio"""
+        self._fundos = {}  # Chunk -> (Surface, Y no mundo do topo)
+
+    def obter(self, chunk):
+        """
+        Retorna o fundo de um chunk, renderizando-o se ainda não estiver em cache
+
+        Args:
+            chunk: Chunk do gerador procedural
+
+        Returns:
+            tuple ou None: (Surface, Y no mundo do topo) ou None se o chunk
+            não tem fundo próprio
+        """
+        fundo = self._fundos.get(chunk)
+        if fundo is None:
+            fundo = self._renderizar(chunk)
+            if fundo is not None:
+                self._fundos[chunk] = fundo
+        return fundo
+
+    def _renderizar(self, chunk):
+        """Renderiza o fundo conforme o tipo do chunk"""
+        if chunk.tipo == 'safe_zone':
+            safe_zone = chunk.dados.get('safe_zone')
+            if safe_zone is None:
+                return None
+            return safe_zone.obter_superficie(), safe_zone.y_pos - safe_zone.MARGEM_CACHE
+        if chunk.tipo == 'estrada':
+            return _renderizar_estrada(chunk)
+        if chunk.tipo == 'rio':
+            return _renderizar_rio(chunk)
+        return None
+
+    def desenhar(self, surface, chunks, camera):
+        """
+        Desenha o fundo dos chunks (um blit por chunk) e descarta os que sumiram
+
+        Args:
+            surface: Surface de destino
+            chunks: Chunks visíveis em ordem de Y
+            camera: Camera usada para converter Y do mundo em Y da tela
+        """
+        for chunk in chunks:
+            fundo = self.obter(chunk)
+            if fundo is not None:
+                superficie, y_topo = fundo
+                surface.blit(superficie, (0, camera.aplicar_offset(y_topo)))
+
+        if len(self._fundos) > len(chunks):
+            self.descartar_fora(chunks)
+
+    def descartar_fora(self, chunks):
+        """
+        Libera o fundo dos chunks que não estão na lista
+
+        Args:
+            chunks: Chunks que devem continuar em cache
+        """
+        mantidos = set(chunks)
+        for chunk in [c for c in self._fundos if c not in mantidos]:
+            self._liberar(chunk)
+
+    def _liberar(self, chunk):
+        """Remove um chunk do cache (e o fundo guardado pela safe zone)"""
+        del self._fundos[chunk]
+        safe_zone = chunk.dados.get('safe_zone')
+        if safe_zone is not None:
+            safe_zone.liberar_cache()
+
+    def limpar(self):
+        """Libera todos os fundos"""
+        for chunk in list(self._fundos):
+            self._liberar(chunk)
+
+    def __len__(self):
+        return len(self._fundos)
+
+    def __repr__(self):
+        return f"ChunkBackgroundCache(fundos={len(self._fundos)})"
+
+
+class WorldCanvas:
+    """
+    Fundo da tela mantido numa superfície que rola junto com a câmera
+
+    A linha 0 da superfície corresponde ao Y do mundo ``topo``. Quando a
+    câmera anda, o conteúdo já desenhado é deslocado com Surface.scroll e
+    só as linhas que ficaram expostas são redesenhadas a partir dos fundos
+    dos chunks, então o custo por frame acompanha a distância rolada e
+    não a altura da tela.
+    """
+
+    def __init__(self, fundos=None, largura=None, altura=None):
+        """
+        Inicializa o canvas (o primeiro atualizar() desenha a tela inteira)
+
+        Args:
+            fundos: ChunkBackgroundCache compartilhado (opcional)
+            largura: Largura em pixels (padrão: LARGURA_TELA)
+            altura: Altura em pixels (padrão: ALTURA_TELA)
+        """
+        self.fundos = fundos if fundos is not None else ChunkBackgroundCache()
+        self.superficie = converter_para_tela(
+            pygame.Surface((largura or config.LARGURA_TELA, altura or config.ALTURA_TELA)),
+            alfa=False
+        )
+        self.topo = None  # Y do mundo da linha 0 (None = precisa redesenhar tudo)
+
+        # Estatísticas
+        self.linhas_renderizadas = 0  # Total de linhas redesenhadas
+
+    def invalidar(self):
+        """Força o redesenho completo no próximo atualizar()"""
+        self.topo = None
+
+    def atualizar(self, gerador, camera_offset):
+        """
+        Acompanha a câmera, desenhando apenas as linhas novas
+
+        Args:
+            gerador: ProceduralGenerator com os chunks do mundo
+            camera_offset: Offset atual da câmera
+        """
+        # Mesmo arredondamento de Camera.aplicar_offset (int(y - offset))
+        topo = math.ceil(camera_offset)
+        altura = self.superficie.get_height()
+
+        if self.topo is None or abs(topo - self.topo) >= altura:
+            self._renderizar_linhas(gerador, topo, 0, altura)
+        elif topo != self.topo:
+            deslocamento = self.topo - topo  # > 0: câmera subiu
+            self.superficie.scroll(0, deslocamento)
+            if deslocamento > 0:
+                self._renderizar_linhas(gerador, topo, 0, deslocamento)
+            else:
+                self._renderizar_linhas(gerador, topo, altura + deslocamento, altura)
+        self.topo = topo
+
+        # Mantém tudo o que _renderizar_linhas pode desenhar, com folga
+        margem = _SOBRA_FUNDO + _MARGEM_DESCARTE
+        mantidos = gerador.obter_chunks_no_intervalo(topo - margem, topo + altura + margem)
+        if len(self.fundos) > len(mantidos):
+            self.fundos.descartar_fora(mantidos)
+
+    def _renderizar_linhas(self, gerador, topo, inicio, fim):
+        """
+        Redesenha as linhas [inicio, fim) do canvas
+
+        Args:
+            gerador: ProceduralGenerator com os chunks do mundo
+            topo: Y do mundo da linha 0
+            inicio: Primeira linha a desenhar
+            fim: Linha final (exclusiva)
+        """
+        area = pygame.Rect(0, inicio, self.superficie.get_width(), fim - inicio)
+        self.superficie.set_clip(area)
+        self.superficie.fill(config.AZUL, area)
+
+        chunks = gerador.obter_chunks_no_intervalo(
+            topo + inicio - _SOBRA_FUNDO, topo + fim + _SOBRA_FUNDO
+        )
+        for chunk in chunks:
+            fundo = self.fundos.obter(chunk)
+            if fundo is not None:
+                superficie, y_topo = fundo
+                self.superficie.blit(superficie, (0, y_topo - topo))
+
+        self.superficie.set_clip(None)
+        self.linhas_renderizadas += fim - inicio
+
+    def desenhar(self, surface):
+        """
+        Copia o canvas para a tela
+
+        Args:
+            surface: Surface de destino
+        """
+        surface.blit(self.superficie, (0, 0))
+
+    def __repr__(self):
+        return f"WorldCanvas(topo={self.topo}, linhas_renderizadas={self.linhas_renderizadas})"
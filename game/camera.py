@@ -12,6 +12,8 @@ class Camera:
     def __init__(self):
         """Inicializa o sistema de câmera"""
         self.offset_y = 0  # Offset vertical da câmera
+        self.offset_anterior = 0  # Offset no início do último passo de física
+        self.offset_render = 0  # Offset usado para desenhar (ver interpolar)
         self.velocidade_scroll = config.VELOCIDADE_SCROLL
         self.scroll_ativo = False
 
@@ -35,6 +37,8 @@ class Camera:
             jogador: Objeto do jogador
             delta_time: Tempo desde o último frame (em segundos)
         """
+        self.offset_anterior = self.offset_y
+
         if jogador and hasattr(jogador, 'y'):
             # Usar posição Y direta do jogador (movimento livre em pixels)
             posicao_tela_jogador = config.ALTURA_TELA - (config.TAMANHO_CELL * 5)  # 5 células do fundo (160px)
@@ -64,6 +68,20 @@ class Camera:
             self.offset_y = max(self.limite_superior, self.offset_y)
         if self.limite_inferior is not None:
             self.offset_y = min(self.limite_inferior, self.offset_y)
+        self.offset_render = self.offset_y
+    
+    def interpolar(self, alpha):
+        """
+        Posiciona a câmera de desenho entre o passo anterior e o atual
+        
+        Args:
+            alpha: Fração do próximo passo de física já decorrida [0, 1)
+            
+        Returns:
+            float: Offset usado por aplicar_offset até o próximo update
+        """
+        self.offset_render = self.offset_anterior + (self.offset_y - self.offset_anterior) * alpha
+        return self.offset_render
     
     def aplicar_offset(self, y):
         """
@@ -75,7 +93,7 @@ class Camera:
         Returns:
             int: Coordenada Y na tela
         """
-        return int(y - self.offset_y)
+        return int(y - self.offset_render)
     
     def obter_y_mundo(self, y_tela):
         """
@@ -127,6 +145,8 @@ class Camera:
         # Offset inicial para mostrar jogador na posição correta
         self.target_offset = y_mundo_inicial - posicao_tela_jogador
         self.offset_y = self.target_offset  # Snap inicial imediato
+        self.offset_anterior = self.offset_y
+        self.offset_render = self.offset_y
         self.scroll_ativo = False
         self.jogador_y = y_mundo_inicial
     
@@ -0,0 +1,108 @@
+"""
+Pré-geração de chunks em uma thread de fundo
+"""
+
+import queue
+import threading
+
+
+class ChunkPrefetcher:
+    """
+    Constrói grupos de chunks à frente da câmera fora do loop principal
+
+    A thread chama ``construir(y)`` repetidamente, sempre a partir do topo
+    do último grupo, e deixa os grupos prontos numa fila limitada. Quando a
+    fila enche, a thread espera; o loop principal só precisa adotar o que
+    já está pronto (ver ProceduralGenerator.atualizar).
+    """
+
+    def __init__(self, construir, y_inicial, tamanho_fila=8):
+        """
+        Inicializa o pré-gerador (a thread só começa em iniciar())
+
+        Args:
+            construir: Função y -> lista de chunks acima de y (o último é o mais alto)
+            y_inicial: Y onde termina o último chunk já registrado
+            tamanho_fila: Máximo de grupos prontos aguardando adoção
+        """
+        self.construir = construir
+        self.y_inicial = y_inicial
+        self._fila = queue.Queue(maxsize=max(1, tamanho_fila))
+        self._parar = threading.Event()
+        self._thread = None
+        self._erro = None
+
+    @property
+    def ativo(self):
+        """True enquanto a thread de geração está rodando"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def prontos(self):
+        """Número aproximado de grupos aguardando na fila"""
+        return self._fila.qsize()
+
+    def iniciar(self):
+        """Dispara a thread de geração"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._executar, name="pre-geracao-chunks", daemon=True
+        )
+        self._thread.start()
+
+    def _executar(self):
+        """Laço da thread: gera grupos até a fila encher ou pedirem parada"""
+        y = self.y_inicial
+        try:
+            while not self._parar.is_set():
+                chunks = self.construir(y)
+                y = chunks[-1].y_inicio
+                while not self._parar.is_set():
+                    try:
+                        self._fila.put(chunks, timeout=0.05)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as erro:  # Repassado ao loop principal em obter()
+            self._erro = erro
+
+    def obter(self, bloquear=True):
+        """
+        Retira o próximo grupo de chunks
+
+        Args:
+            bloquear: Se True, espera o grupo ficar pronto; se False,
+                retorna None quando a fila está vazia
+
+        Returns:
+            list ou None: Chunks do grupo, em ordem de geração
+
+        Raises:
+            RuntimeError: Se a thread de geração falhou
+        """
+        while True:
+            if self._erro is not None:
+                raise RuntimeError("Falha na pré-geração de chunks") from self._erro
+            try:
+                return self._fila.get(block=bloquear, timeout=0.05)
+            except queue.Empty:
+                if not bloquear:
+                    return None
+                if not self.ativo and self._erro is None:
+                    raise RuntimeError("Pré-geração de chunks não está ativa")
+
+    def parar(self):
+        """Encerra a thread e descarta os grupos que ainda estavam na fila"""
+        self._parar.set()
+        while True:
+            try:
+                self._fila.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __repr__(self):
+        return f"ChunkPrefetcher(ativo={self.ativo}, prontos={self.prontos})"
@@ -2,10 +2,97 @@
 Sistema de detecção de colisão
 """
 
+from bisect import bisect_left, bisect_right, insort
+
 import pygame
 import config
 
 
+def _chave_x(sprite):
+    """Chave de ordenação dos carros dentro de uma faixa"""
+    return sprite.rect.left
+
+
+class LaneGroup(pygame.sprite.Group):
+    """
+    Grupo de carros indexado por faixa para broadphase de colisão
+
+    Carros nunca mudam de faixa, então cada um é guardado no balde do Y
+    (centery) em que entrou no grupo. Os Ys das faixas ficam ordenados para
+    busca binária e cada balde é mantido ordenado por X, de modo que uma
+    consulta só percorre as faixas que encostam na área pedida.
+    """
+
+    def __init__(self, *sprites):
+        self._faixas = {}  # Y da faixa -> lista de carros ordenada por X
+        self._ys_faixas = []  # Ys das faixas ocupadas, em ordem crescente
+        self._faixa_do_sprite = {}
+        self._largura_maxima = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        y_faixa = sprite.rect.centery
+        carros = self._faixas.get(y_faixa)
+        if carros is None:
+            carros = self._faixas[y_faixa] = []
+            insort(self._ys_faixas, y_faixa)
+        carros.append(sprite)
+        self._faixa_do_sprite[sprite] = y_faixa
+        self._largura_maxima = max(self._largura_maxima, sprite.rect.width)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        y_faixa = self._faixa_do_sprite.pop(sprite)
+        carros = self._faixas[y_faixa]
+        carros.remove(sprite)
+        if not carros:
+            del self._faixas[y_faixa]
+            del self._ys_faixas[bisect_left(self._ys_faixas, y_faixa)]
+
+    def sprites_na_area(self, rect):
+        """
+        Retorna os carros cujo rect pode intersectar ``rect``
+
+        Só examina as faixas cujo centro fica a meia altura de carro da área
+        e, dentro delas, apenas o trecho da lista ordenada que cobre o X.
+
+        Args:
+            rect: Área de consulta (coordenadas do mundo)
+
+        Returns:
+            list: Carros candidatos à colisão
+        """
+        meia_altura = config.TAMANHO_CARRO_ALTURA // 2
+        inicio = bisect_left(self._ys_faixas, rect.top - meia_altura)
+        fim = bisect_right(self._ys_faixas, rect.bottom + meia_altura)
+
+        candidatos = []
+        x_min = rect.left - self._largura_maxima
+        for y_faixa in self._ys_faixas[inicio:fim]:
+            carros = self._faixas[y_faixa]
+            # Carros da mesma faixa andam juntos: a lista só sai de ordem
+            # quando um deles dá a volta na tela, e o timsort é linear aqui
+            carros.sort(key=_chave_x)
+
+            # Busca binária pelo primeiro carro que pode alcançar rect.left
+            baixo, alto = 0, len(carros)
+            while baixo < alto:
+                meio = (baixo + alto) // 2
+                if carros[meio].rect.left < x_min:
+                    baixo = meio + 1
+                else:
+                    alto = meio
+
+            for carro in carros[baixo:]:
+                if carro.rect.left >= rect.right:
+                    break
+                if carro.rect.colliderect(rect):
+                    candidatos.append(carro)
+
+        return candidatos
+
+
 class CollisionSystem:
     """Sistema de detecção e tratamento de colisões"""
     
@@ -49,8 +136,14 @@ class CollisionSystem:
         Returns:
             Lista de carros que colidiram
         """
-        return pygame.sprite.spritecollide(
-            jogador, carros_group, False,
-            pygame.sprite.collide_rect_ratio(0.8)
-        )
+        colide = pygame.sprite.collide_rect_ratio(0.8)
+
+        # Broadphase por faixa: só testa carros na faixa do jogador e vizinhas
+        if isinstance(carros_group, LaneGroup):
+            return [
+                carro for carro in carros_group.sprites_na_area(jogador.rect)
+                if colide(jogador, carro)
+            ]
+
+        return pygame.sprite.spritecollide(jogador, carros_group, False, colide)
 
@@ -0,0 +1,50 @@
+"""
+Perfis de densidade de entidades (testes de carga)
+"""
+
+import config
+
+# Limites por grupo/faixa, para que perfis agressivos continuem jogáveis
+MAX_FAIXAS_GRUPO = 12
+MAX_CARROS_FAIXA = config.GRID_LARGURA // 2
+MAX_TRONCOS_FAIXA = config.GRID_LARGURA // 2
+
+
+def perfil_densidade(nome=None):
+    """
+    Retorna os multiplicadores de um perfil de config.PERFIS_DENSIDADE
+
+    Args:
+        nome: Nome do perfil (padrão: config.PERFIL_DENSIDADE)
+
+    Returns:
+        dict: Multiplicadores 'faixas', 'carros' e 'troncos'
+    """
+    nome = config.PERFIL_DENSIDADE if nome is None else nome
+    try:
+        return config.PERFIS_DENSIDADE[nome]
+    except KeyError:
+        raise ValueError(f"Perfil de densidade desconhecido: {nome!r}") from None
+
+
+def escalar(quantidade, tipo, maximo):
+    """
+    Aplica o multiplicador do perfil atual a uma quantidade sorteada
+
+    Com multiplicador 1.0 a quantidade volta inalterada (mesmo acima do
+    máximo), então o perfil 'normal' gera exatamente o mundo de sempre.
+
+    Args:
+        quantidade: Quantidade base (sorteada pelo gerador)
+        tipo: 'faixas', 'carros' ou 'troncos'
+        maximo: Limite superior depois de escalar
+
+    Returns:
+        int: Quantidade escalada (pelo menos 1)
+    """
+    fator = perfil_densidade().get(tipo, 1.0)
+    if tipo == 'carros':
+        fator *= config.DENSIDADE_TRAFEGO
+    if fator == 1.0:
+        return quantidade
+    return max(1, min(maximo, round(quantidade * fator)))
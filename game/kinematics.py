@@ -0,0 +1,200 @@
+"""
+Cinemática vetorizada (struct-of-arrays) das entidades de faixa
+
+NumPy é opcional: sem ele NUMPY_DISPONIVEL é False e o jogo continua
+atualizando carros e troncos um a um.
+"""
+
+import config
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+NUMPY_DISPONIVEL = np is not None
+
+
+class KinematicStore:
+    """
+    Guarda x, velocidade, direção e largura de todas as entidades de faixa
+
+    Cada entidade vinculada ocupa um slot dos arrays. avancar() move e faz
+    o wrap-around de todas de uma vez, reproduzindo a regra de
+    Carro.atualizar/Tronco.atualizar (sai por um lado, reaparece uma
+    largura além do outro).
+    """
+
+    def __init__(self, capacidade=256):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            capacidade: Número inicial de slots (cresce sob demanda)
+        """
+        if np is None:
+            raise RuntimeError("KinematicStore requer NumPy (pip install numpy)")
+
+        self.x = np.zeros(capacidade, dtype=np.float64)
+        self.x_anterior = np.zeros(capacidade, dtype=np.float64)  # x antes do último passo
+        self.velocidade = np.zeros(capacidade, dtype=np.float64)
+        self.direcao = np.zeros(capacidade, dtype=np.float64)  # 0 = slot livre
+        self.largura = np.zeros(capacidade, dtype=np.float64)
+        self._metade = np.zeros(capacidade, dtype=np.float64)  # largura // 2
+
+        # Buffers reaproveitados a cada passo (evitam alocações por tick)
+        self._tmp = np.zeros(capacidade, dtype=np.float64)
+        self._mascara = np.zeros(capacidade, dtype=bool)
+        self._mascara_aux = np.zeros(capacidade, dtype=bool)
+
+        # Posições interpoladas para desenho (recalculadas quando alpha muda)
+        self._x_render = np.zeros(capacidade, dtype=np.float64)
+        self._alpha_render = None
+
+        self._livres = list(range(capacidade - 1, -1, -1))
+        self.ativos = 0
+
+    @property
+    def capacidade(self):
+        """Número de slots alocados"""
+        return len(self.x)
+
+    def _crescer(self):
+        """Dobra a capacidade dos arrays"""
+        antiga = self.capacidade
+        nova = antiga * 2
+        for nome in ('x', 'x_anterior', 'velocidade', 'direcao', 'largura', '_metade',
+                     '_tmp', '_x_render'):
+            array = np.zeros(nova, dtype=np.float64)
+            array[:antiga] = getattr(self, nome)
+            setattr(self, nome, array)
+        self._mascara = np.zeros(nova, dtype=bool)
+        self._mascara_aux = np.zeros(nova, dtype=bool)
+        self._livres.extend(range(nova - 1, antiga - 1, -1))
+
+    def registrar(self, x, velocidade, direcao, largura):
+        """
+        Ocupa um slot com o estado de uma entidade
+
+        Args:
+            x: Posição X (centro) no mundo
+            velocidade: Pixels por segundo
+            direcao: 1 = direita, -1 = esquerda
+            largura: Largura do sprite em pixels
+
+        Returns:
+            int: Índice do slot
+        """
+        if not self._livres:
+            self._crescer()
+        slot = self._livres.pop()
+        self.x[slot] = x
+        self.x_anterior[slot] = x
+        self.velocidade[slot] = velocidade
+        self.direcao[slot] = direcao
+        self.largura[slot] = largura
+        self._metade[slot] = largura // 2
+        self.ativos += 1
+        self._alpha_render = None
+        return slot
+
+    def liberar(self, slot):
+        """
+        Devolve um slot (a entidade deixa de ser movida)
+
+        Args:
+            slot: Índice retornado por registrar()
+        """
+        self.velocidade[slot] = 0.0
+        self.direcao[slot] = 0.0
+        self._livres.append(slot)
+        self.ativos -= 1
+
+    def avancar(self, delta_time):
+        """
+        Move todas as entidades e aplica o wrap-around horizontal
+
+        Args:
+            delta_time: Passo de tempo (em segundos)
+        """
+        x = self.x
+        tmp = self._tmp
+        mascara = self._mascara
+        aux = self._mascara_aux
+
+        np.copyto(self.x_anterior, x)
+        self._alpha_render = None
+
+        # x += velocidade * direcao * dt
+        np.multiply(self.velocidade, self.direcao, out=tmp)
+        tmp *= delta_time
+        x += tmp
+
+        # rect.left = int(x) - largura // 2
+        np.trunc(x, out=tmp)
+        tmp -= self._metade
+
+        # Indo para a direita e saiu pela borda direita:
+        # rect.right = -largura -> x = -2 * largura + largura // 2
+        np.greater(tmp, config.LARGURA_TELA, out=mascara)
+        np.greater(self.direcao, 0, out=aux)
+        mascara &= aux
+        if mascara.any():
+            x[mascara] = self._metade[mascara] - 2 * self.largura[mascara]
+            self.x_anterior[mascara] = x[mascara]  # Reaparece sem atravessar a tela
+
+        # Indo para a esquerda e saiu pela borda esquerda (rect.right < 0):
+        # rect.left = LARGURA_TELA + largura -> x = LARGURA_TELA + largura + largura // 2
+        tmp += self.largura
+        np.less(tmp, 0, out=mascara)
+        np.less(self.direcao, 0, out=aux)
+        mascara &= aux
+        if mascara.any():
+            x[mascara] = config.LARGURA_TELA + self.largura[mascara] + self._metade[mascara]
+            self.x_anterior[mascara] = x[mascara]
+
+    def interpolar(self, alpha):
+        """
+        Posições X entre o passo anterior e o atual, para desenho
+
+        O resultado é calculado uma vez por valor de alpha (todas as
+        entidades de um frame compartilham o mesmo array).
+
+        Args:
+            alpha: Fração do próximo passo de física já decorrida [0, 1)
+
+        Returns:
+            numpy.ndarray: x_anterior + (x - x_anterior) * alpha, por slot
+        """
+        if alpha != self._alpha_render:
+            np.subtract(self.x, self.x_anterior, out=self._x_render)
+            self._x_render *= alpha
+            self._x_render += self.x_anterior
+            self._alpha_render = alpha
+        return self._x_render
+
+    def limpar(self):
+        """Libera todos os slots"""
+        self.velocidade[:] = 0.0
+        self.direcao[:] = 0.0
+        self._livres = list(range(self.capacidade - 1, -1, -1))
+        self.ativos = 0
+        self._alpha_render = None
+
+    def __len__(self):
+        return self.ativos
+
+    def __repr__(self):
+        return f"KinematicStore(ativos={self.ativos}, capacidade={self.capacidade})"
+
+
+def criar_kinematic_store():
+    """
+    Cria o armazenamento vetorizado se estiver habilitado e NumPy existir
+
+    Returns:
+        KinematicStore ou None: None quando o jogo deve usar o caminho por objeto
+    """
+    if not getattr(config, 'USAR_CINEMATICA_NUMPY', True) or not NUMPY_DISPONIVEL:
+        return None
+    return KinematicStore()
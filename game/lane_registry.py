@@ -0,0 +1,121 @@
+"""
+Registro de ocupação das faixas de estrada
+"""
+
+import config
+from core.rng import make_rng, new_seed
+from entities.carro import Carro
+from game.density import MAX_CARROS_FAIXA, escalar
+
+
+class LaneRegistry:
+    """
+    Controla quais faixas visíveis já estão populadas e quais carros são de cada uma
+
+    A identidade de uma faixa é o seu Y no mundo (chunks não se sobrepõem).
+    Carros são criados quando a faixa entra na área visível e removidos
+    todos juntos quando ela sai, sem varrer o grupo de carros.
+    """
+
+    def __init__(self, carros_group, cinematica=None, seed=None):
+        """
+        Inicializa o registro
+
+        Args:
+            carros_group: Grupo onde os carros criados são adicionados
+            cinematica: KinematicStore que move os carros (opcional)
+            seed: Seed do mundo (opcional; sorteada se None)
+        """
+        self.carros_group = carros_group
+        self.cinematica = cinematica
+        self.seed = seed if seed is not None else new_seed()
+        self.faixas = {}  # Y da faixa -> lista de carros da faixa
+
+    def atualizar(self, faixas_visiveis):
+        """
+        Popula as faixas que entraram na área visível e libera as que saíram
+
+        Args:
+            faixas_visiveis: Lista de faixas (dicts do gerador) visíveis
+        """
+        ys_visiveis = set()
+        for faixa in faixas_visiveis:
+            y_faixa = faixa['y']
+            ys_visiveis.add(y_faixa)
+            if y_faixa not in self.faixas:
+                self.faixas[y_faixa] = self._popular_faixa(faixa)
+
+        if len(self.faixas) > len(ys_visiveis):
+            for y_faixa in [y for y in self.faixas if y not in ys_visiveis]:
+                self.liberar_faixa(y_faixa)
+
+    def _popular_faixa(self, faixa):
+        """
+        Cria os carros de uma faixa
+
+        Args:
+            faixa: Dados da faixa (y, velocidade, direcao, cor)
+
+        Returns:
+            list: Carros criados
+        """
+        carros = []
+        # Stream próprio da faixa: o resultado não depende de quando (ou em
+        # que ordem) as faixas ficam visíveis
+        rng = make_rng(self.seed, 'faixa', faixa['y'])
+        carros_por_faixa = escalar(rng.randint(2, 4), 'carros', MAX_CARROS_FAIXA)
+        for i in range(carros_por_faixa):
+            # ESPAÇAMENTO ALINHADO AO GRID (fracionário, para faixas muito cheias
+            # não empilharem carros na mesma célula)
+            espacamento_cells = config.GRID_LARGURA / (carros_por_faixa + 1)
+            x_cell = int((i + 1) * espacamento_cells) + rng.randint(-1, 1)  # Variação mínima: ±1 célula
+            x_cell = max(0, min(x_cell, config.GRID_LARGURA - 1))  # Limitar dentro da tela
+            x_inicial = x_cell * config.TAMANHO_CELL + config.TAMANHO_CELL // 2  # Centro da célula
+
+            if faixa['direcao'] == -1:
+                # Inverter posição (mas ainda alinhado ao grid)
+                x_cell_invertido = config.GRID_LARGURA - 1 - x_cell
+                x_inicial = x_cell_invertido * config.TAMANHO_CELL + config.TAMANHO_CELL // 2
+
+            carro = Carro(
+                x_inicial,
+                faixa['y'],
+                faixa['velocidade'],
+                faixa['cor'],
+                faixa['direcao']
+            )
+            if self.cinematica is not None:
+                carro.vincular(self.cinematica)
+            self.carros_group.add(carro)
+            carros.append(carro)
+
+        return carros
+
+    def liberar_faixa(self, y_faixa):
+        """
+        Remove a faixa do registro junto com todos os seus carros
+
+        Args:
+            y_faixa: Y da faixa no mundo
+        """
+        for carro in self.faixas.pop(y_faixa, ()):
+            carro.desvincular()
+            carro.kill()
+
+    def resetar(self, seed=None):
+        """
+        Libera todas as faixas
+
+        Args:
+            seed: Nova seed do mundo (opcional; mantém a atual se None)
+        """
+        for y_faixa in list(self.faixas):
+            self.liberar_faixa(y_faixa)
+        if seed is not None:
+            self.seed = seed
+
+    def __len__(self):
+        return len(self.faixas)
+
+    def __repr__(self):
+        return f"LaneRegistry(faixas={len(self.faixas)}, carros={len(self.carros_group)})"
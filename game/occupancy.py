@@ -0,0 +1,127 @@
+"""
+Grade de ocupação da área visível, para bots e análises
+"""
+
+import math
+
+import config
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+# Canais da grade
+CANAL_TIPO = 0      # Tipo da linha (TIPOS_LINHA), repetido em todas as colunas
+CANAL_CARROS = 1    # 1 onde há carro
+CANAL_TRONCOS = 2   # 1 onde há tronco
+CANAL_JOGADOR = 3   # 1 na célula do jogador
+NUM_CANAIS = 4
+
+# Código de cada tipo de chunk no CANAL_TIPO (0 = grama / fora de chunks)
+TIPOS_LINHA = {'estrada': 1, 'rio': 2, 'safe_zone': 3}
+
+
+def _intervalo_celulas(inicio, fim, origem, limite):
+    """
+    Células cujo centro fica em [inicio, fim), relativas a ``origem``
+
+    Returns:
+        tuple: (primeira, última + 1), limitadas a [0, limite]
+    """
+    celula = config.TAMANHO_CELL
+    primeira = math.ceil((inicio - origem) / celula - 0.5)
+    ultima = math.ceil((fim - origem) / celula - 0.5)
+    return max(0, primeira), min(limite, ultima)
+
+
+class OccupancyGrid:
+    """
+    Estado da tela em GRID_ALTURA x GRID_LARGURA células, num array NumPy fixo
+
+    A grade (NUM_CANAIS, linhas, colunas) de uint8 é alocada uma vez (ou
+    recebida pronta, por exemplo uma fatia de um lote de observações) e
+    reescrita em atualizar() a partir dos dados dos chunks e das faixas, sem
+    olhar pixels renderizados. Cada entidade marca as células cujo centro
+    fica dentro do seu rect; a linha 0 é a do topo da tela.
+    """
+
+    def __init__(self, grade=None):
+        """
+        Inicializa a grade
+
+        Args:
+            grade: Array uint8 (NUM_CANAIS, GRID_ALTURA, GRID_LARGURA) onde
+                escrever (padrão: um novo)
+        """
+        if np is None:
+            raise RuntimeError("OccupancyGrid requer NumPy (pip install numpy)")
+
+        forma = (NUM_CANAIS, config.GRID_ALTURA, config.GRID_LARGURA)
+        if grade is None:
+            grade = np.zeros(forma, dtype=np.uint8)
+        elif grade.shape != forma:
+            raise ValueError(f"grade deve ter forma {forma}, não {grade.shape}")
+
+        self.grade = grade
+        self.linhas = config.GRID_ALTURA
+        self.colunas = config.GRID_LARGURA
+
+        # Visões de cada canal (sem cópia)
+        self.tipo = grade[CANAL_TIPO]
+        self.carros = grade[CANAL_CARROS]
+        self.troncos = grade[CANAL_TRONCOS]
+        self.jogador = grade[CANAL_JOGADOR]
+        self.tipo_linha = grade[CANAL_TIPO, :, 0]  # Um código por linha
+
+        self.celula_jogador = (-1, -1)  # (linha, coluna); -1 fora da tela
+
+    def _marcar(self, canal, rect, origem):
+        """Marca em ``canal`` as células cobertas pelo rect (mundo)"""
+        l0, l1 = _intervalo_celulas(rect.top, rect.bottom, origem, self.linhas)
+        if l0 >= l1:
+            return
+        c0, c1 = _intervalo_celulas(rect.left, rect.right, 0, self.colunas)
+        if c0 < c1:
+            canal[l0:l1, c0:c1] = 1
+
+    def atualizar(self, gerador, registro_faixas, jogador, camera_offset):
+        """
+        Reescreve a grade com o estado atual
+
+        Args:
+            gerador: ProceduralGenerator (chunks e troncos dos rios)
+            registro_faixas: LaneRegistry (carros de cada faixa visível)
+            jogador: Jogador (ou None)
+            camera_offset: Offset da câmera (Y do mundo no topo da tela)
+
+        Returns:
+            numpy.ndarray: A própria grade
+        """
+        self.grade.fill(0)
+        y_fim = camera_offset + self.linhas * config.TAMANHO_CELL
+
+        for chunk in gerador.obter_chunks_no_intervalo(camera_offset, y_fim):
+            l0, l1 = _intervalo_celulas(chunk.y_inicio, chunk.y_fim, camera_offset, self.linhas)
+            if l0 < l1:
+                self.tipo[l0:l1] = TIPOS_LINHA.get(chunk.tipo, 0)
+            if chunk.tipo == 'rio':
+                for tronco in chunk.dados.get('plataformas', ()):
+                    self._marcar(self.troncos, tronco.rect, camera_offset)
+
+        for carros in registro_faixas.faixas.values():
+            for carro in carros:
+                self._marcar(self.carros, carro.rect, camera_offset)
+
+        self.celula_jogador = (-1, -1)
+        if jogador is not None:
+            linha = math.floor((jogador.y - camera_offset) / config.TAMANHO_CELL)
+            coluna = int(jogador.x // config.TAMANHO_CELL)
+            if 0 <= linha < self.linhas and 0 <= coluna < self.colunas:
+                self.jogador[linha, coluna] = 1
+                self.celula_jogador = (linha, coluna)
+
+        return self.grade
+
+    def __repr__(self):
+        return f"OccupancyGrid({self.linhas}x{self.colunas}, jogador={self.celula_jogador})"
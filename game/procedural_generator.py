@@ -2,14 +2,22 @@
 Sistema de Geração Procedimental
 """
 
-import random
+import time
+
 import pygame
 import config
+from core.rng import make_rng, new_seed
 from entities.safe_zone import SafeZone
-from entities.tronco import Tronco
+from entities.tronco import Tronco, pre_renderizar_troncos
+from game.chunk_worker import ChunkPrefetcher
+from game.density import MAX_FAIXAS_GRUPO, MAX_TRONCOS_FAIXA, escalar
+from game.world_index import WorldIndex
 # Tartarugas removidas - apenas troncos para simplificar
 # Lilypads removidos - apenas troncos
 
+# Margem de obter_chunks_visiveis(): acima dela nada é desenhado nem consultado
+_MARGEM_VISIVEL = 100
+
 
 class Chunk:
     """Representa um chunk (pedaço) do mundo"""
@@ -37,18 +45,22 @@ class Chunk:
 class ProceduralGenerator:
     """Gerenciador de geração procedimental"""
     
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, pre_geracao=None):
         """
         Inicializa o gerador procedimental
 
         Args:
-            seed: Seed para geração aleatória (opcional)
+            seed: Seed do mundo (opcional; sorteada se None). O gerador usa
+                um random.Random próprio derivado dela e nunca o módulo
+                random global
+            pre_geracao: Inicia a thread de pré-geração em
+                inicializar_mundo_inicial (padrão: config.PRE_GERACAO_CHUNKS)
         """
-        if seed:
-            random.seed(seed)
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = make_rng(self.seed, 'mundo')
 
-        # Lista de chunks ativos
-        self.chunks = []
+        # Chunks ativos indexados por Y
+        self.indice = WorldIndex()
         self.safe_zones = []
 
         # Controle de geração
@@ -64,7 +76,23 @@ class ProceduralGenerator:
         # Pool de chunks reciclados (otimização de memória)
         self.chunk_pool = []
         self.max_pool_size = 50
-        
+
+        # Thread que gera chunks à frente da câmera (ver iniciar_pre_geracao)
+        if pre_geracao is None:
+            pre_geracao = getattr(config, 'PRE_GERACAO_CHUNKS', False)
+        self.pre_geracao = pre_geracao
+        self.pre_gerador = None
+
+        # Orçamento de geração por tick (ver _gerar_com_orcamento)
+        self.chunks_gerados = 0  # Grupos gerados/adotados durante o jogo
+        self.tempo_geracao_ns = 0  # Tempo gasto gerando no último tick
+        self.estouros_orcamento = 0  # Ticks em que o orçamento foi excedido
+        
+    @property
+    def chunks(self):
+        """Chunks ativos em ordem crescente de Y"""
+        return self.indice.chunks
+
     def deve_gerar_area_descanso(self):
         """
         Verifica se deve gerar uma área de descanso
@@ -88,7 +116,7 @@ class ProceduralGenerator:
         Returns:
             SafeZone: Área de descanso gerada
         """
-        safe_zone = SafeZone(y_pos, config.ALTURA_AREA_DESCANSO)
+        safe_zone = SafeZone(y_pos, config.ALTURA_AREA_DESCANSO, semente=self.seed)
         self.safe_zones.append(safe_zone)
         
         # Criar chunk para a área de descanso
@@ -100,14 +128,14 @@ class ProceduralGenerator:
                 'safe_zone': safe_zone
             }
         )
-        self.chunks.append(chunk)
+        self.indice.inserir(chunk)
         
         # Atualizar próxima posição
         self.proximo_y = y_pos + config.ALTURA_AREA_DESCANSO
         
         # Variar o intervalo (5 ou 6 desafios)
         self.ultimo_intervalo = config.INTERVALO_DESAFIOS_PARA_DESCANSO + \
-                                random.randint(0, config.VARIACAO_INTERVALO_DESAFIOS)
+                                self.rng.randint(0, config.VARIACAO_INTERVALO_DESAFIOS)
         
         return safe_zone
     
@@ -123,15 +151,15 @@ class ProceduralGenerator:
             Chunk: Chunk com dados das faixas
         """
         if num_faixas is None:
-            num_faixas = random.randint(2, 3)
+            num_faixas = self.rng.randint(2, 3)
         
         altura_faixa = 32  # 1 célula (32px) - alinhado ao grid moderno  # Altura de cada faixa
         faixas = []
         
         for i in range(num_faixas):
             y_faixa = y_pos + (i * altura_faixa)
-            velocidade_base = random.uniform(2.0, 4.5)
-            direcao = random.choice([1, -1])
+            velocidade_base = self.rng.uniform(2.0, 4.5)
+            direcao = self.rng.choice([1, -1])
 
             # Aplicar dificuldade
             velocidade = velocidade_base * self.dificuldade_atual * config.FPS
@@ -140,7 +168,7 @@ class ProceduralGenerator:
                 'y': y_faixa,
                 'velocidade': velocidade,
                 'direcao': direcao,
-                'cor': random.choice(config.CORES_CARROS)
+                'cor': self.rng.choice(config.CORES_CARROS)
             })
         
         altura_total = num_faixas * altura_faixa
@@ -155,7 +183,7 @@ class ProceduralGenerator:
             }
         )
         
-        self.chunks.append(chunk)
+        self.indice.inserir(chunk)
         self.proximo_y = y_pos + altura_total
         self.contador_desafios += 1
         
@@ -173,7 +201,7 @@ class ProceduralGenerator:
             Chunk: Chunk com dados do rio
         """
         if num_faixas is None:
-            num_faixas = random.randint(2, 3)
+            num_faixas = self.rng.randint(2, 3)
         
         altura_faixa = 32  # 1 célula (32px) - alinhado ao grid moderno
         plataformas = []
@@ -181,8 +209,8 @@ class ProceduralGenerator:
         
         for i in range(num_faixas):
             y_faixa = y_pos + (i * altura_faixa)
-            velocidade_base = random.uniform(1.5, 3.5)
-            direcao = random.choice([1, -1])
+            velocidade_base = self.rng.uniform(1.5, 3.5)
+            direcao = self.rng.choice([1, -1])
 
             # Aplicar dificuldade
             velocidade = velocidade_base * self.dificuldade_atual * config.FPS
@@ -202,7 +230,7 @@ class ProceduralGenerator:
             
             if tipo_plataforma == 'tronco_garantido':
                 # GARANTIR tronco grande e acessível no centro da tela (onde jogador está)
-                num_troncos = random.randint(6, 8)  # Ainda mais troncos
+                num_troncos = self.rng.randint(6, 8)  # Ainda mais troncos
                 
                 # Calcular posição do centro da tela ALINHADA AO GRID
                 centro_cell = config.GRID_LARGURA // 2
@@ -217,7 +245,7 @@ class ProceduralGenerator:
                 posicoes_base = []
                 espacamento_cells = config.GRID_LARGURA // (num_troncos + 1)
                 for j in range(num_troncos - 1):  # -1 pois já criamos o central
-                    x_cell = int((j + 1) * espacamento_cells) + random.randint(-1, 1)
+                    x_cell = int((j + 1) * espacamento_cells) + self.rng.randint(-1, 1)
                     x_cell = max(0, min(x_cell, config.GRID_LARGURA - 1))
                     pos_base = x_cell * config.TAMANHO_CELL + config.TAMANHO_CELL // 2
                     
@@ -227,7 +255,7 @@ class ProceduralGenerator:
                 
                 for x_base in posicoes_base:
                     # Larguras sempre múltiplos de TAMANHO_CELL (3, 4 ou 6 células)
-                    largura = random.choice([
+                    largura = self.rng.choice([
                         3 * config.TAMANHO_CELL,  # 96px
                         4 * config.TAMANHO_CELL,  # 128px
                         6 * config.TAMANHO_CELL   # 192px
@@ -237,14 +265,14 @@ class ProceduralGenerator:
             
             elif tipo_plataforma == 'tronco':
                 # MAIS troncos (5-7) e sempre GRANDES
-                num_troncos = random.randint(5, 7)
+                num_troncos = self.rng.randint(5, 7)
                 
                 # Distribuir uniformemente pela tela ALINHADO AO GRID
                 posicoes_base = []
                 espacamento_cells = config.GRID_LARGURA // (num_troncos + 1)
                 for j in range(num_troncos):
                     # Posição alinhada ao grid com variação mínima
-                    x_cell = int((j + 1) * espacamento_cells) + random.randint(-1, 1)
+                    x_cell = int((j + 1) * espacamento_cells) + self.rng.randint(-1, 1)
                     x_cell = max(0, min(x_cell, config.GRID_LARGURA - 1))
                     pos_base = x_cell * config.TAMANHO_CELL + config.TAMANHO_CELL // 2
                     posicoes_base.append(pos_base)
@@ -261,7 +289,7 @@ class ProceduralGenerator:
                         6 * config.TAMANHO_CELL,  # 192px
                         6 * config.TAMANHO_CELL   # 192px (mais comum)
                     ]
-                    largura = random.choice(largura_opcoes)
+                    largura = self.rng.choice(largura_opcoes)
                     
                     # Ajustar posição se necessário para não sair da tela
                     if x_base + largura // 2 > config.LARGURA_TELA:
@@ -291,7 +319,7 @@ class ProceduralGenerator:
             }
         )
         
-        self.chunks.append(chunk)
+        self.indice.inserir(chunk)
         self.proximo_y = y_pos + altura_total
         self.contador_desafios += 1
         
@@ -310,7 +338,7 @@ class ProceduralGenerator:
             return self.gerar_area_descanso(self.proximo_y)
         else:
             # Decidir entre estrada ou rio (50/50 para mais variedade)
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 return self.gerar_grupo_faixas(self.proximo_y)
             else:
                 return self.gerar_grupo_rio(self.proximo_y)
@@ -325,13 +353,41 @@ class ProceduralGenerator:
         Returns:
             Chunk: Chunk gerado
         """
+        chunks = self.construir_chunks_acima(y_pos)
+        for chunk in chunks:
+            self.registrar_chunk(chunk)
+        return chunks[-1]
+    
+    def registrar_chunk(self, chunk):
+        """
+        Adiciona ao mundo um chunk já construído
+        
+        Args:
+            chunk: Chunk vindo de construir_chunks_acima()
+        """
+        self.indice.inserir(chunk)
+        if chunk.tipo == 'safe_zone':
+            self.safe_zones.append(chunk.dados['safe_zone'])
+    
+    def construir_chunks_acima(self, y_pos):
+        """
+        Constrói o próximo grupo de chunks acima de y_pos sem registrá-los
+        
+        Só altera o estado de geração (rng, contadores, último tipo), então
+        pode rodar fora da thread principal enquanto ninguém mais gera.
+        
+        Args:
+            y_pos: Posição Y onde termina o chunk anterior
+            
+        Returns:
+            list: Chunks em ordem de geração (o último é o mais alto)
+        """
         # Verificar se deve gerar área de descanso
         if self.deve_gerar_area_descanso():
             # Calcular posição acima
             altura = config.ALTURA_AREA_DESCANSO
             y_inicio = y_pos - altura
-            safe_zone = SafeZone(y_inicio, altura)
-            self.safe_zones.append(safe_zone)
+            safe_zone = SafeZone(y_inicio, altura, semente=self.seed)
             
             chunk = Chunk(
                 y_inicio=y_inicio,
@@ -341,17 +397,18 @@ class ProceduralGenerator:
                     'safe_zone': safe_zone
                 }
             )
-            self.chunks.append(chunk)
             
             # Variar o intervalo
             self.ultimo_intervalo = config.INTERVALO_DESAFIOS_PARA_DESCANSO + \
-                                    random.randint(0, config.VARIACAO_INTERVALO_DESAFIOS)
+                                    self.rng.randint(0, config.VARIACAO_INTERVALO_DESAFIOS)
             
             # Safe zone não muda o ultimo_tipo - mantém o anterior para continuar a sequência
             # (ex: se último foi estrada, após safe zone pode ir para rio)
             
-            return chunk
+            return [chunk]
         else:
+            gerados = []
+            
             # Decidir entre estrada ou rio
             # SEMPRE adicionar grama entre estrada e rio
             precisa_grama = False
@@ -365,7 +422,7 @@ class ProceduralGenerator:
                 precisa_grama = True
             else:
                 # Primeiro chunk ou grama, pode ser qualquer coisa
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     proximo_tipo = 'estrada'
                 else:
                     proximo_tipo = 'rio'
@@ -374,8 +431,7 @@ class ProceduralGenerator:
             if precisa_grama:
                 altura_grama = config.ALTURA_AREA_DESCANSO
                 y_grama = y_pos - altura_grama
-                safe_zone = SafeZone(y_grama, altura_grama)
-                self.safe_zones.append(safe_zone)
+                safe_zone = SafeZone(y_grama, altura_grama, semente=self.seed)
                 
                 chunk_grama = Chunk(
                     y_inicio=y_grama,
@@ -385,28 +441,29 @@ class ProceduralGenerator:
                         'safe_zone': safe_zone
                     }
                 )
-                self.chunks.append(chunk_grama)
+                gerados.append(chunk_grama)
                 y_pos = y_grama  # Atualizar posição para gerar próximo chunk acima
             
             # Gerar estrada ou rio
             if proximo_tipo == 'estrada':
                 # Estrada
-                num_faixas = random.randint(2, 3)
+                num_faixas = escalar(self.rng.randint(2, 3), 'faixas', MAX_FAIXAS_GRUPO)
                 altura = num_faixas * 60
                 y_inicio = y_pos - altura
+                dificuldade = self.dificuldade_em(y_inicio)
                 
                 faixas = []
                 for i in range(num_faixas):
                     y_faixa = y_inicio + (i * 60)
-                    velocidade_base = random.uniform(2.0, 4.5)
-                    direcao = random.choice([1, -1])
-                    velocidade = velocidade_base * self.dificuldade_atual * config.FPS
+                    velocidade_base = self.rng.uniform(2.0, 4.5)
+                    direcao = self.rng.choice([1, -1])
+                    velocidade = velocidade_base * dificuldade * config.FPS
                     
                     faixas.append({
                         'y': y_faixa,
                         'velocidade': velocidade,
                         'direcao': direcao,
-                        'cor': random.choice(config.CORES_CARROS)
+                        'cor': self.rng.choice(config.CORES_CARROS)
                     })
                 
                 chunk = Chunk(
@@ -418,24 +475,25 @@ class ProceduralGenerator:
                         'num_faixas': num_faixas
                     }
                 )
-                self.chunks.append(chunk)
+                gerados.append(chunk)
                 self.contador_desafios += 1
                 self.ultimo_tipo = 'estrada'
-                return chunk
+                return gerados
             else:
                 # Rio
-                num_faixas = random.randint(2, 3)
+                num_faixas = escalar(self.rng.randint(2, 3), 'faixas', MAX_FAIXAS_GRUPO)
                 altura = num_faixas * 60
                 y_inicio = y_pos - altura
+                dificuldade = self.dificuldade_em(y_inicio)
                 
                 plataformas = []
                 faixas_rio = []
                 
                 for i in range(num_faixas):
                     y_faixa = y_inicio + (i * 60)
-                    velocidade_base = random.uniform(1.5, 3.5)
-                    direcao = random.choice([1, -1])
-                    velocidade = velocidade_base * self.dificuldade_atual * config.FPS
+                    velocidade_base = self.rng.uniform(1.5, 3.5)
+                    direcao = self.rng.choice([1, -1])
+                    velocidade = velocidade_base * dificuldade * config.FPS
                     
                     faixas_rio.append({
                         'y': y_faixa,
@@ -445,14 +503,14 @@ class ProceduralGenerator:
                     
                     # Gerar plataformas - APENAS TRONCOS (sistema simplificado)
                     # MAIS troncos (5-7) e sempre GRANDES
-                    num_troncos = random.randint(5, 7)
+                    num_troncos = escalar(self.rng.randint(5, 7), 'troncos', MAX_TRONCOS_FAIXA)
                     
                     # Distribuir uniformemente pela tela (menos gaps)
                     posicoes_base = []
                     espacamento_base = config.LARGURA_TELA / (num_troncos + 1)
                     for j in range(num_troncos):
                         # Posição mais uniforme (menos variação)
-                        pos_base = (j + 1) * espacamento_base + random.randint(-20, 20)
+                        pos_base = (j + 1) * espacamento_base + self.rng.randint(-20, 20)
                         # Alinhar ao grid
                         pos_base = (pos_base // config.TAMANHO_CELL) * config.TAMANHO_CELL + config.TAMANHO_CELL // 2
                         posicoes_base.append(pos_base)
@@ -469,7 +527,7 @@ class ProceduralGenerator:
                             6 * config.TAMANHO_CELL,  # 192px
                             6 * config.TAMANHO_CELL   # 192px (mais comum)
                         ]
-                        largura = random.choice(largura_opcoes)
+                        largura = self.rng.choice(largura_opcoes)
                         
                         # Ajustar posição se necessário para não sair da tela
                         if x_base + largura // 2 > config.LARGURA_TELA:
@@ -492,10 +550,10 @@ class ProceduralGenerator:
                         'num_faixas': num_faixas
                     }
                 )
-                self.chunks.append(chunk)
+                gerados.append(chunk)
                 self.contador_desafios += 1
                 self.ultimo_tipo = 'rio'
-                return chunk
+                return gerados
     
     def atualizar(self, camera_offset):
         """
@@ -510,14 +568,9 @@ class ProceduralGenerator:
         # Remover chunks que saíram da tela (atrás da câmera, abaixo do jogador)
         # Usar margem maior para cleanup mais agressivo
         margem_cleanup = 400
-        chunks_para_remover = []
-        chunks_para_manter = []
-
-        for c in self.chunks:
-            if c.y_inicio < camera_offset + config.ALTURA_TELA + margem_cleanup:
-                chunks_para_manter.append(c)
-            else:
-                chunks_para_remover.append(c)
+        chunks_para_remover = self.indice.remover_a_partir_de(
+            camera_offset + config.ALTURA_TELA + margem_cleanup
+        )
 
         # Reciclar chunks removidos no pool (otimização de memória)
         for chunk in chunks_para_remover:
@@ -526,36 +579,126 @@ class ProceduralGenerator:
                 chunk.dados.clear()
                 self.chunk_pool.append(chunk)
 
-        self.chunks = chunks_para_manter
-
-        # Remover safe zones antigas com mesma margem
-        self.safe_zones = [sz for sz in self.safe_zones
-                          if sz.y_pos < camera_offset + config.ALTURA_TELA + margem_cleanup]
+        # Remover safe zones antigas com mesma margem (liberando o fundo em cache)
+        safe_zones_mantidas = []
+        for sz in self.safe_zones:
+            if sz.y_pos < camera_offset + config.ALTURA_TELA + margem_cleanup:
+                safe_zones_mantidas.append(sz)
+            else:
+                sz.liberar_cache()
+        self.safe_zones = safe_zones_mantidas
         
         # Gerar novos chunks à frente se necessário
         # O jogador vai "subir" (Y diminui), então geramos chunks com Y menor
-        limite_geracao = camera_offset - config.DISTANCIA_GERACAO_CHUNK
-        
-        chunks_gerados = 0
-        while self.proximo_y > limite_geracao and chunks_gerados < 50:
-            # Gerar chunk acima (Y menor)
-            chunk = self.gerar_proximo_chunk_invertido(self.proximo_y)
-            if chunk:
-                self.proximo_y = chunk.y_inicio
-                chunks_gerados += 1
-            else:
-                break  # Evitar loop infinito
+        # Obrigatório: tudo que obter_chunks_visiveis() pode devolver
+        limite_obrigatorio = camera_offset - _MARGEM_VISIVEL
+        # Desejado: a distância de geração mais a margem de antecipação
+        limite_geracao = camera_offset - config.DISTANCIA_GERACAO_CHUNK - \
+                         getattr(config, 'MARGEM_ANTECIPACAO_GERACAO', 0)
+        self._gerar_com_orcamento(limite_obrigatorio, limite_geracao)
         
         # Atualizar dificuldade baseado na distância percorrida
         # Quanto mais o jogador sobe (Y diminui), maior a dificuldade
         progresso = max(0, config.ALTURA_TELA - camera_offset)
         self.distancia_percorrida = progresso
+        self.dificuldade_atual = self._dificuldade_para_offset(camera_offset)
+    
+    def _gerar_com_orcamento(self, limite_obrigatorio, limite_geracao):
+        """
+        Gera (ou adota da pré-geração) chunks até limite_geracao, dentro do orçamento
+        
+        Chunks até limite_obrigatorio são sempre gerados, mesmo que o
+        orçamento estoure; o restante da antecipação é feito só enquanto
+        sobrar tempo e continua nos próximos ticks.
+        
+        Args:
+            limite_obrigatorio: Y que precisa estar coberto ao final do tick
+            limite_geracao: Y até onde gerar se houver orçamento
+        """
+        orcamento_ns = getattr(config, 'ORCAMENTO_GERACAO_US', 1000) * 1000
+        inicio = time.perf_counter_ns()
+        
+        while self.proximo_y > limite_geracao:
+            obrigatorio = self.proximo_y > limite_obrigatorio
+            if not obrigatorio and time.perf_counter_ns() - inicio >= orcamento_ns:
+                break
+            
+            if self.pre_gerador is not None:
+                # Espera a thread só se o chunk for obrigatório
+                chunks = self.pre_gerador.obter(bloquear=obrigatorio)
+                if chunks is None:
+                    break
+                for chunk in chunks:
+                    self.registrar_chunk(chunk)
+                self.proximo_y = chunks[-1].y_inicio
+            else:
+                chunk = self.gerar_proximo_chunk_invertido(self.proximo_y)
+                self.proximo_y = chunk.y_inicio
+            self.chunks_gerados += 1
+        
+        self.tempo_geracao_ns = time.perf_counter_ns() - inicio
+        if self.tempo_geracao_ns > orcamento_ns:
+            self.estouros_orcamento += 1
+    
+    @staticmethod
+    def _dificuldade_para_offset(camera_offset):
+        """
+        Calcula a dificuldade para uma posição da câmera
+        
+        Args:
+            camera_offset: Offset da câmera
+            
+        Returns:
+            float: Multiplicador de velocidade
+        """
+        progresso = max(0, config.ALTURA_TELA - camera_offset)
 
         # Dificuldade com limite máximo (evita velocidades impossíveis)
         dificuldade_base = 1.0 + (progresso / 2000) * 0.3
         # Limitar dificuldade máxima a 2.5x (configurável em config.py)
         dificuldade_max = getattr(config, 'DIFICULDADE_MAXIMA', 2.5)
-        self.dificuldade_atual = min(dificuldade_base, dificuldade_max)
+        return min(dificuldade_base, dificuldade_max)
+    
+    def dificuldade_em(self, y):
+        """
+        Dificuldade de um chunk que começa em y
+        
+        Depende só da altura no mundo (o chunk seria gerado quando a câmera
+        estivesse DISTANCIA_GERACAO_CHUNK abaixo dele), então o resultado é
+        o mesmo gerando na hora ou antecipadamente em segundo plano.
+        
+        Args:
+            y: Coordenada Y no mundo
+            
+        Returns:
+            float: Multiplicador de velocidade
+        """
+        return self._dificuldade_para_offset(y + config.DISTANCIA_GERACAO_CHUNK)
+    
+    def obter_chunk_no_y(self, y):
+        """
+        Retorna o chunk que contém uma coordenada Y do mundo
+        
+        Args:
+            y: Coordenada Y no mundo
+            
+        Returns:
+            Chunk ou None: Chunk naquela posição
+        """
+        return self.indice.no_y(y)
+    
+    def obter_chunks_no_intervalo(self, y_min, y_max):
+        """
+        Retorna os chunks que encostam no intervalo [y_min, y_max]
+        
+        Args:
+            y_min: Menor Y do intervalo (mundo)
+            y_max: Maior Y do intervalo (mundo)
+            
+        Returns:
+            list: Chunks em ordem crescente de Y
+        """
+        return self.indice.no_intervalo(y_min, y_max)
     
     def obter_faixas_visiveis(self, camera_offset):
         """
@@ -572,11 +715,9 @@ class ProceduralGenerator:
         y_min = camera_offset - 100
         y_max = camera_offset + config.ALTURA_TELA + 100
         
-        for chunk in self.chunks:
+        for chunk in self.indice.no_intervalo(y_min, y_max):
             if chunk.tipo == 'estrada':
-                # Verificar se chunk está visível
-                if chunk.y_inicio <= y_max and chunk.y_fim >= y_min:
-                    faixas_visiveis.extend(chunk.dados.get('faixas', []))
+                faixas_visiveis.extend(chunk.dados.get('faixas', []))
         
         return faixas_visiveis
     
@@ -594,9 +735,9 @@ class ProceduralGenerator:
         y_max = camera_offset + config.ALTURA_TELA
         
         visiveis = []
-        for sz in self.safe_zones:
-            if sz.y_pos <= y_max and sz.y_pos + sz.altura >= y_min:
-                visiveis.append(sz)
+        for chunk in self.indice.no_intervalo(y_min, y_max):
+            if chunk.tipo == 'safe_zone':
+                visiveis.append(chunk.dados['safe_zone'])
         
         return visiveis
     
@@ -614,11 +755,9 @@ class ProceduralGenerator:
         y_max = camera_offset + config.ALTURA_TELA + 100
         
         plataformas = []
-        for chunk in self.chunks:
+        for chunk in self.indice.no_intervalo(y_min, y_max):
             if chunk.tipo == 'rio':
-                # Verificar se chunk está visível
-                if chunk.y_inicio <= y_max and chunk.y_fim >= y_min:
-                    plataformas.extend(chunk.dados.get('plataformas', []))
+                plataformas.extend(chunk.dados.get('plataformas', []))
         
         return plataformas
     
@@ -630,21 +769,28 @@ class ProceduralGenerator:
             camera_offset: Offset da câmera
             
         Returns:
-            list: Lista de chunks visíveis
+            list: Lista de chunks visíveis, em ordem crescente de Y
         """
         y_min = camera_offset - 100
         y_max = camera_offset + config.ALTURA_TELA + 100
         
-        visiveis = []
-        for chunk in self.chunks:
-            if chunk.y_inicio <= y_max and chunk.y_fim >= y_min:
-                visiveis.append(chunk)
-        
-        return visiveis
+        return self.indice.no_intervalo(y_min, y_max)
     
-    def resetar(self):
-        """Reseta o gerador para estado inicial"""
-        self.chunks = []
+    def resetar(self, seed=None):
+        """
+        Reseta o gerador para estado inicial
+
+        Args:
+            seed: Nova seed do mundo (opcional; mantém a atual se None).
+                O stream aleatório é sempre reiniciado a partir da seed
+        """
+        self.parar_pre_geracao()
+        if seed is not None:
+            self.seed = seed
+        self.rng = make_rng(self.seed, 'mundo')
+        for sz in self.safe_zones:
+            sz.liberar_cache()
+        self.indice.limpar()
         self.safe_zones = []
         self.proximo_y = 0
         self.contador_desafios = 0
@@ -652,6 +798,9 @@ class ProceduralGenerator:
         self.dificuldade_atual = 1.0
         self.ultimo_intervalo = config.INTERVALO_DESAFIOS_PARA_DESCANSO
         self.ultimo_tipo = None
+        self.chunks_gerados = 0
+        self.tempo_geracao_ns = 0
+        self.estouros_orcamento = 0
     
     def inicializar_mundo_inicial(self):
         """Gera os chunks iniciais do mundo"""
@@ -664,7 +813,7 @@ class ProceduralGenerator:
         altura_grama_inicial = config.TAMANHO_CELL * 6  # 6 células = 192px (múltiplo de 32)
         y_grama_inicial = config.ALTURA_TELA - altura_grama_inicial
         
-        safe_zone_inicial = SafeZone(y_grama_inicial, altura_grama_inicial)
+        safe_zone_inicial = SafeZone(y_grama_inicial, altura_grama_inicial, semente=self.seed)
         self.safe_zones.append(safe_zone_inicial)
         
         self.proximo_y = y_grama_inicial
@@ -677,7 +826,7 @@ class ProceduralGenerator:
                 'safe_zone': safe_zone_inicial
             }
         )
-        self.chunks.append(chunk_grama_inicial)
+        self.indice.inserir(chunk_grama_inicial)
         self.proximo_y = y_grama_inicial
         
         # Gerar chunks para cima (Y diminui) para preencher a tela e além
@@ -685,6 +834,40 @@ class ProceduralGenerator:
             chunk = self.gerar_proximo_chunk_invertido(self.proximo_y)
             if chunk:
                 self.proximo_y = chunk.y_inicio
+
+        # Daqui em diante os chunks podem vir da thread de pré-geração
+        if self.pre_geracao:
+            self.iniciar_pre_geracao()
+    
+    def iniciar_pre_geracao(self, tamanho_fila=None):
+        """
+        Passa a gerar chunks numa thread de fundo, à frente da câmera
+        
+        Enquanto ativa, a thread é a única dona do estado de geração;
+        atualizar() apenas adota os grupos de chunks já prontos na fila.
+        
+        Args:
+            tamanho_fila: Máximo de grupos prontos aguardando (padrão:
+                config.TAMANHO_FILA_PRE_GERACAO)
+        """
+        if self.pre_gerador is not None:
+            return
+        if tamanho_fila is None:
+            tamanho_fila = getattr(config, 'TAMANHO_FILA_PRE_GERACAO', 8)
+        
+        # Sprites dos troncos renderizados aqui (a thread só reaproveita)
+        pre_renderizar_troncos(
+            [3 * config.TAMANHO_CELL, 4 * config.TAMANHO_CELL, 6 * config.TAMANHO_CELL]
+        )
+        
+        self.pre_gerador = ChunkPrefetcher(self.construir_chunks_acima, self.proximo_y, tamanho_fila)
+        self.pre_gerador.iniciar()
+    
+    def parar_pre_geracao(self):
+        """Encerra a thread de pré-geração (chunks ainda na fila são descartados)"""
+        if self.pre_gerador is not None:
+            self.pre_gerador.parar()
+            self.pre_gerador = None
     
     def __repr__(self):
         return f"ProceduralGenerator(chunks={len(self.chunks)}, desafios={self.contador_desafios})"
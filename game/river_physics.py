@@ -112,7 +112,7 @@ class RiverPhysics:
 
         Args:
             jogador: Objeto Jogador
-            chunks_rio: Lista de TODOS os chunks de rio (não apenas visíveis)
+            chunks_rio: Lista de chunks de rio na altura do jogador
             delta_time: Tempo desde o último frame (em segundos)
 
         Returns:
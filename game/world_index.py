@@ -0,0 +1,100 @@
+"""
+Índice espacial dos chunks do mundo (eixo Y)
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class WorldIndex:
+    """
+    Mantém os chunks ordenados por Y para consultas por posição e intervalo
+
+    Chunks não se sobrepõem, então tanto os inícios quanto os fins ficam em
+    ordem crescente e cada consulta é uma busca binária mais o tamanho da
+    resposta. Novos chunks entram quase sempre numa das pontas da lista.
+    """
+
+    def __init__(self):
+        """Inicializa o índice vazio"""
+        self._chunks = []  # Ordenados por y_inicio crescente
+        self._inicios = []
+        self._fins = []
+
+    @property
+    def chunks(self):
+        """Lista de chunks em ordem de Y (não deve ser alterada por fora)"""
+        return self._chunks
+
+    def inserir(self, chunk):
+        """
+        Adiciona um chunk mantendo a ordem por Y
+
+        Args:
+            chunk: Chunk a indexar
+        """
+        i = bisect_right(self._inicios, chunk.y_inicio)
+        self._chunks.insert(i, chunk)
+        self._inicios.insert(i, chunk.y_inicio)
+        self._fins.insert(i, chunk.y_fim)
+
+    def remover_a_partir_de(self, y):
+        """
+        Remove todos os chunks que começam em ``y`` ou abaixo (Y maior)
+
+        Args:
+            y: Coordenada Y no mundo
+
+        Returns:
+            list: Chunks removidos
+        """
+        i = bisect_left(self._inicios, y)
+        removidos = self._chunks[i:]
+        del self._chunks[i:]
+        del self._inicios[i:]
+        del self._fins[i:]
+        return removidos
+
+    def no_y(self, y):
+        """
+        Retorna o chunk que contém a coordenada ``y``
+
+        Args:
+            y: Coordenada Y no mundo
+
+        Returns:
+            Chunk ou None: Chunk com y_inicio <= y < y_fim
+        """
+        i = bisect_right(self._inicios, y) - 1
+        if i >= 0 and y < self._fins[i]:
+            return self._chunks[i]
+        return None
+
+    def no_intervalo(self, y_min, y_max):
+        """
+        Retorna os chunks que encostam no intervalo [y_min, y_max]
+
+        Args:
+            y_min: Limite superior (menor Y) no mundo
+            y_max: Limite inferior (maior Y) no mundo
+
+        Returns:
+            list: Chunks em ordem de Y
+        """
+        inicio = bisect_left(self._fins, y_min)
+        fim = bisect_right(self._inicios, y_max)
+        return self._chunks[inicio:fim]
+
+    def limpar(self):
+        """Remove todos os chunks"""
+        self._chunks = []
+        self._inicios = []
+        self._fins = []
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def __repr__(self):
+        return f"WorldIndex(chunks={len(self._chunks)})"
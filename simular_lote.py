@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Simulação em lote de partidas headless, em vários processos
+
+Cada partida roda num processo do pool com seed e política de entrada
+próprias, até GAME_OVER ou até o limite de ticks. O resultado agrega
+pontuação, mortes por causa (carro ou afogamento), ticks/s e pico de memória:
+
+    python simular_lote.py --jogos 32 --politica aleatoria
+    python simular_lote.py --seeds 1,2,3 --politica roteiro --roteiro CCECD
+    python simular_lote.py --politica replay --replays replays/*.atr
+    python simular_lote.py --jogos 16 --config DIFICULDADE_MAXIMA=3.5
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import resource  # Indisponível no Windows
+except ImportError:
+    resource = None
+
+import pygame
+
+import config
+from core.clock import VirtualClock
+from core.replay import Replay
+from core.rng import make_rng
+
+POLITICAS = ('aleatoria', 'roteiro', 'replay')
+
+# Letras do --roteiro: Cima, Baixo, Esquerda, Direita, Parado
+MOVIMENTOS_ROTEIRO = {
+    'C': (0, -1),
+    'B': (0, 1),
+    'E': (-1, 0),
+    'D': (1, 0),
+    'P': None,
+}
+
+# Política aleatória: movimentos possíveis e seus pesos (None = esperar)
+MOVIMENTOS_ALEATORIOS = ((0, -1), (-1, 0), (1, 0), (0, 1), None)
+PESOS_ALEATORIOS = (50, 15, 15, 5, 15)
+
+# A política decide um movimento a cada tantos segundos de jogo
+INTERVALO_DECISAO = 0.15
+
+
+def _lista(texto, tipo):
+    """Converte '1,2,3' em [tipo(1), tipo(2), tipo(3)]"""
+    return [tipo(item) for item in texto.split(',') if item.strip()]
+
+
+def _valor_config(texto):
+    """Interpreta NOME=VALOR de --config (literal Python ou, senão, string)"""
+    nome, separador, valor = texto.partition('=')
+    if not separador or not nome.strip():
+        raise argparse.ArgumentTypeError(f"use NOME=VALOR: {texto!r}")
+    try:
+        valor = ast.literal_eval(valor)
+    except (ValueError, SyntaxError):
+        pass
+    return nome.strip(), valor
+
+
+def _pico_memoria_kb():
+    """Pico de memória residente do processo (KB), ou None sem o módulo resource"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+def criar_politica(nome, seed, roteiro, intervalo_ticks):
+    """
+    Cria a função que decide o movimento do jogador a cada tick
+
+    Args:
+        nome: 'aleatoria' ou 'roteiro'
+        seed: Seed da partida (a política aleatória deriva a sua dela)
+        roteiro: Letras de MOVIMENTOS_ROTEIRO repetidas em ciclo
+        intervalo_ticks: Ticks entre duas decisões
+
+    Returns:
+        callable: tick -> (dx, dy) ou None
+    """
+    if nome == 'aleatoria':
+        rng = make_rng(seed, 'politica')
+
+        def escolher(tick):
+            if tick % intervalo_ticks:
+                return None
+            return rng.choices(MOVIMENTOS_ALEATORIOS, PESOS_ALEATORIOS)[0]
+
+    elif nome == 'roteiro':
+        passos = [MOVIMENTOS_ROTEIRO[letra] for letra in roteiro.upper()]
+
+        def escolher(tick):
+            if tick % intervalo_ticks:
+                return None
+            return passos[(tick // intervalo_ticks) % len(passos)]
+
+    else:
+        raise ValueError(f"Política sem função de decisão: {nome!r}")
+    return escolher
+
+
+def simular_partida(tarefa):
+    """
+    Roda uma partida headless até GAME_OVER ou até o limite de ticks
+
+    Executa no processo do pool; recebe e devolve só dados simples.
+
+    Args:
+        tarefa: dict com seed, politica, ticks, roteiro, replay, camera_livre,
+            pre_geracao, tracemalloc e config (sobrescritas de config.py)
+
+    Returns:
+        dict: Resultado da partida
+    """
+    for nome, valor in tarefa['config'].items():
+        setattr(config, nome, valor)
+
+    replay = None
+    seed = tarefa['seed']
+    if tarefa['politica'] == 'replay':
+        replay = Replay.load(tarefa['replay'])
+        seed = replay.seed
+
+    if not pygame.get_init():
+        pygame.init()
+    from atravessar_rua import JogoAtraversarRua, aplicar_configuracao_replay
+
+    if replay is not None:
+        aplicar_configuracao_replay(replay)
+
+    if tarefa['tracemalloc']:
+        tracemalloc.start()
+
+    jogo = JogoAtraversarRua(
+        headless=True, time_source=VirtualClock(), pre_geracao=tarefa['pre_geracao']
+    )
+    jogo.iniciar_novo_jogo(seed)
+    # Replays usam a câmera da partida gravada, senão o mundo seria outro
+    if tarefa['camera_livre'] and replay is None:
+        jogo.camera.limite_superior = None
+    dt = jogo.fixed_clock.dt
+
+    limite = tarefa['ticks'] or float('inf')
+    if replay is not None:
+        limite = min(limite, replay.length)
+        alimentador = replay.feeder()
+    else:
+        intervalo_ticks = max(1, int(round(INTERVALO_DECISAO / dt)))
+        escolher = criar_politica(tarefa['politica'], seed, tarefa['roteiro'], intervalo_ticks)
+
+    inicio = time.perf_counter()
+    try:
+        while jogo.tick < limite and jogo.estado.name == 'PLAYING':
+            if replay is not None:
+                jogo.aplicar_comandos(alimentador)
+            else:
+                movimento = escolher(jogo.tick)
+                if movimento is not None:
+                    jogo.comandar(*movimento)
+            jogo.step_physics(dt)
+    finally:
+        decorrido = time.perf_counter() - inicio
+        jogo.procedural_generator.parar_pre_geracao()
+
+    resultado = {
+        'seed': seed,
+        'politica': tarefa['politica'],
+        'replay': tarefa['replay'],
+        'ticks': jogo.tick,
+        'game_over': jogo.estado.name == 'GAME_OVER',
+        'pontuacao': jogo.pontuacao,
+        'nivel': jogo.nivel,
+        'mortes': dict(jogo.mortes),
+        'segundos': round(decorrido, 4),
+        'ticks_por_segundo': round(jogo.tick / decorrido, 1) if decorrido else None,
+        'pico_memoria_kb': _pico_memoria_kb(),
+    }
+    if tarefa['tracemalloc']:
+        resultado['pico_python_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return resultado
+
+
+def agregar(resultados):
+    """
+    Resume os resultados de todas as partidas
+
+    Returns:
+        dict: Pontuação (média/mín/máx), mortes por causa, ticks/s e memória
+    """
+    pontos = sorted(r['pontuacao'] for r in resultados)
+    ticks = sum(r['ticks'] for r in resultados)
+    segundos = sum(r['segundos'] for r in resultados)
+    memorias = [r['pico_memoria_kb'] for r in resultados if r['pico_memoria_kb'] is not None]
+
+    agregado = {
+        'jogos': len(resultados),
+        'game_overs': sum(r['game_over'] for r in resultados),
+        'pontuacao': {
+            'media': round(sum(pontos) / len(pontos), 2),
+            'min': pontos[0],
+            'p50': pontos[(len(pontos) - 1) // 2],
+            'max': pontos[-1],
+        },
+        'mortes': {
+            causa: sum(r['mortes'][causa] for r in resultados)
+            for causa in ('carro', 'afogamento')
+        },
+        'ticks': ticks,
+        'ticks_por_segundo': round(ticks / segundos, 1) if segundos else None,
+        'pico_memoria_kb': max(memorias) if memorias else None,
+    }
+    if 'pico_python_kb' in resultados[0]:
+        agregado['pico_python_kb'] = max(r['pico_python_kb'] for r in resultados)
+    return agregado
+
+
+def main(argv=None):
+    """Distribui as partidas pelo pool de processos e grava o JSON"""
+    parser = argparse.ArgumentParser(description="Simulação em lote de partidas headless")
+    parser.add_argument('--politica', choices=POLITICAS, default='aleatoria',
+                        help="entrada do jogador em cada partida")
+    parser.add_argument('--jogos', type=int, default=8,
+                        help="número de partidas (seeds a partir de --seed-inicial)")
+    parser.add_argument('--seed-inicial', type=int, default=1)
+    parser.add_argument('--seeds', help="seeds explícitas, separadas por vírgula (ignora --jogos)")
+    parser.add_argument('--roteiro', default='C',
+                        help="política 'roteiro': letras C/B/E/D/P (cima, baixo, esquerda, "
+                             "direita, parado) repetidas em ciclo")
+    parser.add_argument('--replays', nargs='+', default=[],
+                        help="política 'replay': arquivos .atr (uma partida por arquivo)")
+    parser.add_argument('--ticks', type=int, default=36000,
+                        help="limite de ticks por partida (0 = só para em GAME_OVER)")
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1,
+                        help="processos no pool")
+    parser.add_argument('--config', type=_valor_config, action='append', default=[],
+                        metavar='NOME=VALOR', help="sobrescreve uma constante de config.py")
+    parser.add_argument('--camera-fixa', dest='camera_livre', action='store_false',
+                        help="mantém o limite superior da câmera do jogo; por padrão ele é "
+                             "removido (como no benchmark), senão a pontuação para em 72")
+    parser.add_argument('--pre-geracao', action='store_true',
+                        help="gera chunks numa thread em cada partida (por padrão não: ela "
+                             "disputa o GIL com a simulação e distorce os ticks/s)")
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="mede também o pico de memória Python (mais lento)")
+    parser.add_argument('--saida', default='lote_resultados.json',
+                        help="arquivo JSON de saída ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    sobrescritas = dict(args.config)
+    for nome in sobrescritas:
+        if not hasattr(config, nome):
+            parser.error(f"config.py não tem a constante {nome}")
+
+    if args.politica == 'replay':
+        if not args.replays:
+            parser.error("a política 'replay' precisa de --replays")
+        if sobrescritas:
+            # O replay só guarda PHYSICS_HZ, perfil e densidade: qualquer outra
+            # constante mudaria o mundo e a partida reproduzida seria outra
+            parser.error("--config não pode ser usado com a política 'replay'")
+        seeds = [None] * len(args.replays)
+        replays = args.replays
+    else:
+        if args.politica == 'roteiro':
+            invalidas = set(args.roteiro.upper()) - set(MOVIMENTOS_ROTEIRO)
+            if not args.roteiro or invalidas:
+                parser.error(f"--roteiro inválido: {args.roteiro!r}")
+        if args.seeds:
+            seeds = _lista(args.seeds, int)
+        else:
+            seeds = list(range(args.seed_inicial, args.seed_inicial + args.jogos))
+        replays = [None] * len(seeds)
+
+    tarefas = [
+        {
+            'seed': seed,
+            'politica': args.politica,
+            'ticks': args.ticks,
+            'roteiro': args.roteiro,
+            'replay': replay,
+            'camera_livre': args.camera_livre,
+            'pre_geracao': args.pre_geracao,
+            'tracemalloc': args.tracemalloc,
+            'config': sobrescritas,
+        }
+        for seed, replay in zip(seeds, replays)
+    ]
+    if not tarefas:
+        parser.error("nenhuma partida para simular")
+
+    # Um processo novo por partida, para o pico de memória ser só dela
+    opcoes_pool = {'max_workers': max(1, min(args.processos, len(tarefas)))}
+    if sys.version_info >= (3, 11):
+        opcoes_pool['max_tasks_per_child'] = 1
+
+    print(f"[LOTE] {len(tarefas)} partidas em {opcoes_pool['max_workers']} processos", file=sys.stderr)
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(**opcoes_pool) as pool:
+        resultados = list(pool.map(simular_partida, tarefas))
+    decorrido = time.perf_counter() - inicio
+
+    agregado = agregar(resultados)
+    agregado['segundos_total'] = round(decorrido, 3)
+    agregado['ticks_por_segundo_total'] = round(agregado['ticks'] / decorrido, 1) if decorrido else None
+
+    saida = {
+        'versao': 1,
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'parametros': {
+            'politica': args.politica,
+            'ticks': args.ticks,
+            'roteiro': args.roteiro if args.politica == 'roteiro' else None,
+            'camera_livre': args.camera_livre,
+            'pre_geracao': args.pre_geracao,
+            'config': sobrescritas,
+            'processos': opcoes_pool['max_workers'],
+        },
+        'agregado': agregado,
+        'partidas': resultados,
+    }
+
+    pontos = agregado['pontuacao']
+    print(
+        f"[LOTE] pontos media={pontos['media']} min={pontos['min']} max={pontos['max']} | "
+        f"mortes carro={agregado['mortes']['carro']} afogamento={agregado['mortes']['afogamento']} | "
+        f"{agregado['ticks_por_segundo']} ticks/s por processo, "
+        f"{agregado['ticks_por_segundo_total']} no total",
+        file=sys.stderr
+    )
+
+    texto = json.dumps(saida, indent=2, ensure_ascii=False)
+    if args.saida == '-':
+        print(texto)
+    else:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+        print(f"[OK] Resultados salvos em {args.saida}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
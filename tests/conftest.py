@@ -0,0 +1,30 @@
+"""
+Configuração comum dos testes: pygame sem janela e o jogo headless
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+from core.clock import VirtualClock
+
+
+@pytest.fixture
+def jogo():
+    """JogoAtraversarRua headless, com relógio virtual e sem pré-geração"""
+    if not pygame.get_init():
+        pygame.init()
+    from atravessar_rua import JogoAtraversarRua
+
+    jogo = JogoAtraversarRua(headless=True, time_source=VirtualClock(), pre_geracao=False)
+    yield jogo
+    jogo.encerrar_gravacao()
+    jogo.procedural_generator.parar_pre_geracao()
@@ -0,0 +1,36 @@
+"""
+Testes do fundo em rolagem (WorldCanvas + ChunkBackgroundCache)
+"""
+
+import collections
+
+from game.background import ChunkBackgroundCache
+
+
+def test_chunk_renderizado_uma_vez_enquanto_na_tela(jogo, monkeypatch):
+    """Subindo sem parar, nenhum fundo é renderizado, liberado e refeito"""
+    renderizacoes = collections.Counter()
+    original = ChunkBackgroundCache._renderizar
+
+    def contar(cache, chunk):
+        renderizacoes[chunk] += 1
+        return original(cache, chunk)
+
+    monkeypatch.setattr(ChunkBackgroundCache, '_renderizar', contar)
+
+    jogo.iniciar_novo_jogo(3)
+    jogo.camera.limite_superior = None
+    jogo.preparar_render()
+    assert jogo.canvas_mundo is not None
+
+    for tick in range(1200):
+        jogo.invulneravel = True
+        jogo.tempo_invulnerabilidade = 0.0
+        if tick % 12 == 0:
+            jogo.comandar(0, -1)
+        jogo.step_physics(jogo.fixed_clock.dt)
+        jogo.desenhar()
+
+    assert jogo.pontuacao > 300  # a câmera rolou por vários chunks
+    repetidos = {chunk: n for chunk, n in renderizacoes.items() if n > 1}
+    assert not repetidos
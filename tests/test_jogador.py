@@ -0,0 +1,30 @@
+"""
+Testes do pulo do jogador
+"""
+
+import pygame
+import pytest
+
+import config
+from entities.jogador import DURACAO_PULO, Jogador
+
+
+@pytest.mark.parametrize('physics_hz', [60, 120, 144])
+def test_arco_do_pulo_dura_duracao_pulo(physics_hz):
+    """O arco aparece mesmo quando o movimento termina no primeiro passo"""
+    if not pygame.get_init():
+        pygame.init()
+    jogador = Jogador(config.LARGURA_TELA // 2, 600)
+    jogador.mover(0, -1)
+
+    dt = 1 / physics_hz
+    alturas = []
+    for _ in range(physics_hz):  # 1 s, bem mais que o pulo
+        jogador.step(dt)
+        jogador.atualizar(dt)
+        alturas.append(int(jogador.y) - jogador.rect.centery)
+
+    passos_no_ar = sum(1 for altura in alturas if altura > 0)
+    assert passos_no_ar >= 1
+    assert passos_no_ar <= round(DURACAO_PULO * physics_hz)
+    assert alturas[-1] == 0 and not jogador.pulando
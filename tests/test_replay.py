@@ -0,0 +1,113 @@
+"""
+Testes do formato de replay (core/replay.py) e da reprodução no jogo
+"""
+
+import random
+import struct
+
+import pytest
+
+import config
+from core.replay import (
+    DEFAULT_DENSITY, DEFAULT_PROFILE, MAGIC, InputRecorder, Replay, ReplayError,
+)
+
+COMANDOS = [(0, 0, -1), (0, 1, 0), (5, -1, 0), (200, 0, 1), (200, 0, -1), (70000, 1, 1)]
+
+
+def gravar(caminho, comandos=COMANDOS, end_tick=None, **opcoes):
+    with InputRecorder(str(caminho), 42, 60, **opcoes) as gravador:
+        for tick, dx, dy in comandos:
+            gravador.record(tick, dx, dy)
+        gravador.close(end_tick)
+
+
+def test_ida_e_volta(tmp_path):
+    caminho = tmp_path / 'a.atr'
+    gravar(caminho, end_tick=70010, profile='estresse', density=1.5)
+
+    replay = Replay.load(str(caminho))
+    assert (replay.seed, replay.physics_hz) == (42, 60)
+    assert replay.commands == COMANDOS
+    assert replay.end_tick == replay.length == 70010
+    assert (replay.profile, replay.density) == ('estresse', 1.5)
+
+
+def test_sem_trailer_termina_apos_ultimo_comando(tmp_path):
+    caminho = tmp_path / 'a.atr'
+    gravar(caminho)
+
+    replay = Replay.load(str(caminho))
+    assert replay.end_tick is None
+    assert replay.length == COMANDOS[-1][0] + 1
+
+
+def test_cabecalho_v1_le_perfil_padrao():
+    # v1: só magic, versão, physics_hz e seed; depois os registros
+    dados = struct.pack('<4sBHQ', MAGIC, 1, 120, 7) + bytes((3, 1, 0, 0xFF))
+
+    replay = Replay.from_bytes(dados)
+    assert (replay.seed, replay.physics_hz) == (7, 120)
+    assert (replay.profile, replay.density) == (DEFAULT_PROFILE, DEFAULT_DENSITY) == ('normal', 1.0)
+    assert replay.commands == [(3, -1, 0)]
+    assert replay.end_tick == 3
+
+
+def test_arquivo_truncado_le_ate_o_ultimo_comando_completo(tmp_path):
+    caminho = tmp_path / 'a.atr'
+    gravar(caminho)
+    dados = caminho.read_bytes()
+
+    # O último registro é um varint de 2 bytes (69800) e o byte do comando
+    replay = Replay.from_bytes(dados[:-2])
+    assert replay.commands == COMANDOS[:-1]
+    assert replay.end_tick is None
+
+
+@pytest.mark.parametrize('dados', [b'', b'XXXX' + bytes(11), struct.pack('<4sBHQ', MAGIC, 9, 60, 0)])
+def test_cabecalho_invalido(dados):
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(dados)
+
+
+def test_alimentador_entrega_cada_comando_uma_vez():
+    replay = Replay(1, 60, list(COMANDOS))
+    alimentador = replay.feeder()
+
+    assert list(alimentador.due(0)) == [(0, -1), (1, 0)]
+    assert list(alimentador.due(0)) == []
+    assert list(alimentador.due(199)) == [(-1, 0)]
+    assert list(alimentador.due(200)) == [(0, 1), (0, -1)]
+    assert alimentador.remaining == 1
+
+
+def estado(jogo):
+    return (
+        jogo.estado, jogo.tick, jogo.pontuacao, jogo.vidas, dict(jogo.mortes),
+        jogo.jogador.x, jogo.jogador.y, jogo.camera.offset_y,
+        sorted((round(carro.x, 3), carro.rect.y) for carro in jogo.carros_group),
+    )
+
+
+def test_reproduzir_igual_a_partida_gravada(jogo, tmp_path):
+    caminho = tmp_path / 'partida.atr'
+    jogo.iniciar_novo_jogo(1234)
+    jogo.iniciar_gravacao(str(caminho))
+
+    movimentos = random.Random(5)
+    dt = jogo.fixed_clock.dt
+    for tick in range(1500):
+        if jogo.estado.name == 'GAME_OVER':
+            break
+        if tick % 6 == 0:
+            jogo.comandar(*movimentos.choice([(0, -1), (0, -1), (0, -1), (-1, 0), (1, 0)]))
+        jogo.step_physics(dt)
+    jogo.encerrar_gravacao()
+    ao_vivo = estado(jogo)
+
+    replay = Replay.load(str(caminho))
+    assert replay.seed == 1234
+    assert (replay.profile, replay.density) == (config.PERFIL_DENSIDADE, config.DENSIDADE_TRAFEGO)
+
+    jogo.reproduzir(replay)
+    assert estado(jogo) == ao_vivo
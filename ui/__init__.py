@@ -6,6 +6,8 @@ from .menu import Menu
 from .hud import HUD
 from .game_over import GameOverScreen
 from .button import Button, ToggleButton
+from .glyph_atlas import GlyphAtlas
+from .profiler_overlay import ProfilerOverlay
 
-__all__ = ['Menu', 'HUD', 'GameOverScreen', 'Button', 'ToggleButton']
+__all__ = ['Menu', 'HUD', 'GameOverScreen', 'Button', 'ToggleButton', 'GlyphAtlas', 'ProfilerOverlay']
 
@@ -0,0 +1,89 @@
+"""
+Atlas de glifos para textos numéricos que mudam com frequência
+"""
+
+import pygame
+
+
+class GlyphAtlas:
+    """
+    Renderiza cada caractere de um conjunto uma única vez
+
+    Textos formados só por esses caracteres (números, tempo) são montados
+    colando os glifos prontos, sem chamar font.render. Rótulos fixos
+    ("Pontos: ", "s") também são renderizados uma vez e reaproveitados.
+    """
+
+    def __init__(self, font, cor, caracteres="0123456789.-"):
+        """
+        Inicializa o atlas
+
+        Args:
+            font: pygame.font.Font usada nos glifos
+            cor: Cor do texto
+            caracteres: Caracteres pré-renderizados
+        """
+        self.font = font
+        self.cor = cor
+        self.altura = font.get_height()
+        self.renders = 0  # Chamadas a font.render feitas pelo atlas
+
+        self._glifos = {}  # Caractere -> (Surface, avanço horizontal)
+        for caractere in caracteres:
+            self._glifos[caractere] = (self._renderizar(caractere), font.size(caractere)[0])
+        self._rotulos = {}  # Texto fixo -> Surface
+
+    def _renderizar(self, texto):
+        """Renderiza um texto com a fonte do atlas (contabilizado em renders)"""
+        self.renders += 1
+        return self.font.render(texto, True, self.cor)
+
+    def rotulo(self, texto):
+        """
+        Retorna a superfície de um texto fixo, renderizando-o só na primeira vez
+
+        Args:
+            texto: Texto do rótulo
+
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        superficie = self._rotulos.get(texto)
+        if superficie is None:
+            superficie = self._renderizar(texto)
+            self._rotulos[texto] = superficie
+        return superficie
+
+    def compor(self, valor, prefixo="", sufixo=""):
+        """
+        Monta ``prefixo + valor + sufixo`` a partir de rótulos e glifos em cache
+
+        Args:
+            valor: Texto formado apenas por caracteres do atlas
+            prefixo: Rótulo fixo antes do valor
+            sufixo: Rótulo fixo depois do valor
+
+        Returns:
+            pygame.Surface: Texto montado
+        """
+        partes = []
+        largura = 0
+        if prefixo:
+            partes.append((self.rotulo(prefixo), largura))
+            largura += self.font.size(prefixo)[0]
+        for caractere in valor:
+            glifo, avanco = self._glifos[caractere]
+            partes.append((glifo, largura))
+            largura += avanco
+        if sufixo:
+            superficie_sufixo = self.rotulo(sufixo)
+            partes.append((superficie_sufixo, largura))
+            largura += superficie_sufixo.get_width()
+
+        superficie = pygame.Surface((max(1, largura), self.altura), pygame.SRCALPHA)
+        for parte, x in partes:
+            superficie.blit(parte, (x, 0))
+        return superficie
+
+    def __repr__(self):
+        return f"GlyphAtlas(glifos={len(self._glifos)}, rotulos={len(self._rotulos)})"
@@ -2,21 +2,67 @@
 Heads-up Display (HUD) do jogo
 """
 
+import time
+
 import pygame
 import config
+from ui.glyph_atlas import GlyphAtlas
 
 
 class HUD:
     """Classe responsável pelo HUD durante o jogo"""
-    
+
     def __init__(self, screen, font_pequena):
         self.screen = screen
         self.font_pequena = font_pequena
-        
+
+        # Textos em cache: só são refeitos quando o valor exibido muda
+        self.atlas = GlyphAtlas(font_pequena, config.BRANCO)
+        self._textos = {}  # Nome -> (valor exibido, Surface)
+        self.texto_vidas = self.atlas.rotulo("Vidas:")
+
+        # Estatísticas de renderização de texto
+        self.textos_renderizados = 0  # Textos refeitos desde a criação
+        self.renders_por_segundo = 0.0
+        self._inicio_janela = time.perf_counter()
+        self._renders_inicio_janela = 0
+
+    def _texto(self, nome, valor, prefixo="", sufixo=""):
+        """
+        Retorna o texto de um campo, montando-o só se o valor mudou
+
+        Args:
+            nome: Identificador do campo
+            valor: Valor exibido (string numérica)
+            prefixo: Rótulo antes do valor
+            sufixo: Rótulo depois do valor
+
+        Returns:
+            pygame.Surface: Texto pronto para blit
+        """
+        anterior = self._textos.get(nome)
+        if anterior is not None and anterior[0] == valor:
+            return anterior[1]
+
+        superficie = self.atlas.compor(valor, prefixo, sufixo)
+        self._textos[nome] = (valor, superficie)
+        self.textos_renderizados += 1
+        return superficie
+
+    def _atualizar_contador(self):
+        """Recalcula renders_por_segundo uma vez por segundo"""
+        agora = time.perf_counter()
+        decorrido = agora - self._inicio_janela
+        if decorrido >= 1.0:
+            renders = self.textos_renderizados - self._renders_inicio_janela
+            self.renders_por_segundo = renders / decorrido
+            self._inicio_janela = agora
+            self._renders_inicio_janela = self.textos_renderizados
+
     def desenhar(self, pontuacao, nivel, vidas, tempo_decorrido):
         """
         Desenha o HUD na tela
-        
+
         Args:
             pontuacao: Pontuação atual
             nivel: Nível atual
@@ -24,32 +70,51 @@ class HUD:
             tempo_decorrido: Tempo decorrido em segundos
         """
         # Pontuação
-        texto_pontos = self.font_pequena.render(f"Pontos: {pontuacao}", True, config.BRANCO)
+        texto_pontos = self._texto('pontos', str(pontuacao), "Pontos: ")
         self.screen.blit(texto_pontos, (10, 10))
-        
+
         # Nível
-        texto_nivel = self.font_pequena.render(f"Nível: {nivel}", True, config.BRANCO)
+        texto_nivel = self._texto('nivel', str(nivel), "Nível: ")
         texto_nivel_rect = texto_nivel.get_rect()
         texto_nivel_rect.topright = (config.LARGURA_TELA - 10, 10)
         self.screen.blit(texto_nivel, texto_nivel_rect)
-        
+
         # Vidas
-        texto_vidas = self.font_pequena.render("Vidas:", True, config.BRANCO)
-        texto_vidas_rect = texto_vidas.get_rect()
+        texto_vidas_rect = self.texto_vidas.get_rect()
         texto_vidas_rect.centerx = config.LARGURA_TELA // 2
         texto_vidas_rect.y = 10
-        self.screen.blit(texto_vidas, texto_vidas_rect)
-        
+        self.screen.blit(self.texto_vidas, texto_vidas_rect)
+
         for i in range(vidas):
             pygame.draw.circle(
                 self.screen, config.VERMELHO,
                 (config.LARGURA_TELA // 2 + 60 + i * 30, 25),
                 10
             )
-        
-        # Timer
-        texto_tempo = self.font_pequena.render(
-            f"Tempo: {tempo_decorrido:.1f}s", True, config.BRANCO
-        )
+
+        # Timer (exibido com 0.1s de resolução)
+        texto_tempo = self._texto('tempo', f"{tempo_decorrido:.1f}", "Tempo: ", "s")
         self.screen.blit(texto_tempo, (10, config.ALTURA_TELA - 30))
 
+        self._atualizar_contador()
+
+    def desenhar_contagem(self, carros, troncos, chunks):
+        """
+        Desenha o contador de entidades ativas no canto inferior direito
+
+        Args:
+            carros: Carros ativos
+            troncos: Troncos ativos
+            chunks: Chunks carregados
+        """
+        campos = (
+            self._texto('carros', str(carros), "Carros: "),
+            self._texto('troncos', str(troncos), "Troncos: "),
+            self._texto('chunks', str(chunks), "Chunks: "),
+        )
+        y = config.ALTURA_TELA - 30
+        for superficie in reversed(campos):
+            rect = superficie.get_rect()
+            rect.bottomright = (config.LARGURA_TELA - 10, y + rect.height)
+            self.screen.blit(superficie, rect)
+            y -= rect.height
@@ -0,0 +1,73 @@
+"""
+Overlay com os tempos por subsistema (F3)
+"""
+
+import time
+
+import pygame
+import config
+
+
+class ProfilerOverlay:
+    """Painel com p50/p95/p99 de cada seção medida pelo FrameProfiler"""
+
+    # Intervalo (s) entre atualizações do texto do painel
+    INTERVALO_ATUALIZACAO = 0.5
+
+    def __init__(self, screen, profiler, font=None):
+        """
+        Inicializa o overlay
+
+        Args:
+            screen: Surface onde o painel é desenhado
+            profiler: FrameProfiler com as medições
+            font: Fonte das linhas (padrão: fonte do pygame, criada ao abrir o painel)
+        """
+        self.screen = screen
+        self.profiler = profiler
+        self.font = font
+
+        # O painel é montado só a cada INTERVALO_ATUALIZACAO segundos
+        self._painel = None
+        self._ultima_atualizacao = 0.0
+
+    def _montar_painel(self):
+        """Renderiza a tabela de tempos numa superfície semitransparente"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        linhas = [("seção (ms)", "p50", "p95", "p99")]
+        for nome, stats in self.profiler.summary().items():
+            linhas.append((nome, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"))
+        if len(linhas) == 1:
+            linhas.append(("coletando...", "", "", ""))
+
+        # Cada célula é renderizada à parte para alinhar as colunas com qualquer fonte
+        celulas = [[self.font.render(texto, True, config.BRANCO) for texto in linha] for linha in linhas]
+        larguras = [max(linha[i].get_width() for linha in celulas) for i in range(4)]
+        espaco = 14
+        altura_linha = self.font.get_linesize()
+        largura = sum(larguras) + espaco * 3 + 20
+        altura = altura_linha * len(celulas) + 16
+
+        painel = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        painel.fill((0, 0, 0, 170))
+        for i, linha in enumerate(celulas):
+            y = 8 + i * altura_linha
+            painel.blit(linha[0], (10, y))
+            x = 10 + larguras[0]
+            for coluna in range(1, 4):
+                x += espaco + larguras[coluna]
+                painel.blit(linha[coluna], (x - linha[coluna].get_width(), y))  # Alinhado à direita
+        return painel
+
+    def desenhar(self):
+        """Desenha o painel no canto superior direito (abaixo do HUD)"""
+        agora = time.perf_counter()
+        if self._painel is None or agora - self._ultima_atualizacao >= self.INTERVALO_ATUALIZACAO:
+            self._painel = self._montar_painel()
+            self._ultima_atualizacao = agora
+
+        rect = self._painel.get_rect()
+        rect.topright = (config.LARGURA_TELA - 10, 50)
+        self.screen.blit(self._painel, rect)
@@ -3,8 +3,9 @@ Módulo de utilitários
 """
 
 from .colors import *
+from .sprite_cache import SpriteCache, converter_para_tela
 
 __all__ = ['PRETO', 'BRANCO', 'VERDE', 'VERDE_ESCURO', 'VERMELHO', 'AZUL', 'AMARELO',
            'LARANJA', 'ROXO', 'CINZA', 'CINZA_ESCURO', 'ASFALTO',
-           'VERDE_GRAMA', 'VERDE_GRAM_ESCURO']
+           'VERDE_GRAMA', 'VERDE_GRAM_ESCURO', 'SpriteCache', 'converter_para_tela']
 
@@ -0,0 +1,65 @@
+"""
+Cache de sprites pré-renderizados compartilhados entre entidades
+"""
+
+import pygame
+
+
+def converter_para_tela(superficie, alfa=True):
+    """
+    Converte a superfície para o formato de pixel da tela, se houver uma
+
+    Sem janela (modo headless ou antes de set_mode) a superfície é
+    devolvida como está.
+
+    Args:
+        superficie: Surface a converter
+        alfa: Se False, descarta o canal alfa (fundos opacos)
+
+    Returns:
+        pygame.Surface: Superfície pronta para blit rápido
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return superficie.convert_alpha() if alfa else superficie.convert()
+    return superficie
+
+
+class SpriteCache:
+    """Renderiza cada variante de sprite uma única vez e compartilha a imagem"""
+
+    def __init__(self, fabrica):
+        """
+        Inicializa o cache
+
+        Args:
+            fabrica: Função que recebe os campos da chave e devolve uma
+                nova Surface desenhada para aquela variante
+        """
+        self.fabrica = fabrica
+        self._superficies = {}
+
+    def obter(self, *chave):
+        """
+        Retorna a imagem compartilhada da variante, renderizando se preciso
+
+        Args:
+            *chave: Campos que identificam a variante (ex.: cor, direção)
+
+        Returns:
+            pygame.Surface: Imagem compartilhada (não deve ser alterada)
+        """
+        superficie = self._superficies.get(chave)
+        if superficie is None:
+            superficie = converter_para_tela(self.fabrica(*chave))
+            self._superficies[chave] = superficie
+        return superficie
+
+    def limpar(self):
+        """Descarta todas as imagens (ex.: após trocar o modo de vídeo)"""
+        self._superficies.clear()
+
+    def __len__(self):
+        return len(self._superficies)
+
+    def __repr__(self):
+        return f"SpriteCache(variantes={len(self._superficies)})"